@@ -13,9 +13,12 @@ from Wood Pyrolysis”. Industrial & Engineering Chemistry Research, vol. 40,
 pp. 5547–5556, 2001.
 """
 
-import cantera as ct
-import matplotlib.pyplot as plt
 import numpy as np
+from funcs import profiling
+from funcs.kinetics import read_mechanism
+from funcs.result_cache import ResultCache
+from funcs.scenarios import run_scenarios
+from funcs.state_recorder import StateRecorder
 
 # Parameters
 # ----------------------------------------------------------------------------
@@ -27,121 +30,120 @@ from params import y0
 # time vector for evaluating kinetic reactions [s]
 time = np.linspace(0, 25, num=1000)
 
-# Batch reactor with primary Di Blasi reactions
+# Batch reactors with Di Blasi reactions
 # ----------------------------------------------------------------------------
 
-gas1 = ct.Solution('blasi.cti')
-gas1.TPY = temp, press, y0
+scenarios = [
+    # use only primary reactions by disabling the secondary reactions for tar
+    # which are reactions tar => gas and tar => char
+    {'name': 'primary', 'multipliers': [1, 1, 1, 0, 0]},
 
-# use only primary reactions by disabling the secondary reactions for tar
-gas1.set_multiplier(0, 3)    # disable reaction tar => gas
-gas1.set_multiplier(0, 4)    # disable reaction tar => char
+    # primary and secondary Di Blasi reactions
+    {'name': 'primary + secondary', 'multipliers': [1, 1, 1, 1, 1]},
 
-r1 = ct.IdealGasConstPressureReactor(gas1, energy='off')
+    # primary and secondary Di Blasi reactions (modified) where a factor of
+    # 0.2 is applied to reaction tar => gas
+    {'name': 'primary + secondary (mod)', 'multipliers': [1, 1, 1, 0.2, 1]}
+]
 
-sim1 = ct.ReactorNet([r1])
-states1 = ct.SolutionArray(gas1, extra=['t'])
+for sc in scenarios:
+    sc.update(temp=temp, press=press, y0=y0)
 
-for ti in time:
-    sim1.advance(ti)
-    states1.append(r1.thermo.state, t=ti)
 
-# Batch reactor with primary and secondary Di Blasi reactions
-# ----------------------------------------------------------------------------
-
-gas2 = ct.Solution('blasi.cti')
-gas2.TPY = temp, press, y0
+def calc_scenarios(scenarios, time):
+    import cantera as ct
 
-r2 = ct.IdealGasConstPressureReactor(gas2, energy='off')
+    with profiling.stage('ct.Solution'):
+        gas = ct.Solution('blasi.cti')
 
-sim2 = ct.ReactorNet([r2])
-states2 = ct.SolutionArray(gas2, extra=['t'])
+    table, y = run_scenarios(gas, scenarios, time)
+    return {'table': table, 'y': y}
 
-for ti in time:
-    sim2.advance(ti)
-    states2.append(r2.thermo.state, t=ti)
-
-# Batch reactor with primary and secondary Di Blasi reactions (modified)
-# ----------------------------------------------------------------------------
 
-gas3 = ct.Solution('blasi.cti')
-gas3.TPY = temp, press, y0
+def main():
+    import matplotlib.pyplot as plt
 
-# apply factor of 0.2 to reaction tar => gas
-gas3.set_multiplier(0.2, 3)
+    # results are reused from the cache when the scenarios, the code, and the
+    # mechanism file are unchanged
+    cache = ResultCache()
+    inputs = {'scenarios': scenarios, 'time': time}
+    res = cache.run('batch_blasi', calc_scenarios, inputs, files=['blasi.cti'])
+    table = res['table']
+    y = res['y']
 
-r3 = ct.IdealGasConstPressureReactor(gas3, energy='off')
+    mech = read_mechanism('blasi.cti')
+    species = list(mech['species'])
 
-sim3 = ct.ReactorNet([r3])
-states3 = ct.SolutionArray(gas3, extra=['t'])
+    states1 = StateRecorder(time, species, out=y[0])
+    states2 = StateRecorder(time, species, out=y[1])
+    states3 = StateRecorder(time, species, out=y[2])
 
-for ti in time:
-    sim3.advance(ti)
-    states3.append(r3.thermo.state, t=ti)
+    # Print
+    # ------------------------------------------------------------------------
 
-# Print
-# ----------------------------------------------------------------------------
-
-print(f"""
+    print(f"""
 --- Parameters ---
 T   {temp} K
 P   {press:,} Pa
 """)
 
-print('--- Reactions (index, reaction) ---')
-for i, r in enumerate(gas1.reactions()):
-    print(i, r)
-
-print('\n--- Final primary yields (mass fraction) ---')
-for sp in states1.species_names:
-    print(f"{sp:10} {states1(sp).Y[-1][0]:.4f}")
-
-print('\n--- Final primary + seconary yields (mass fraction) ---')
-for sp in states2.species_names:
-    print(f"{sp:10} {states2(sp).Y[-1][0]:.4f}")
-
-print('\n--- Max tar yield (mass fraction) ---')
-print(f"{'tar':10} {max(states1('tar').Y[:, 0]):.4f}   primary")
-print(f"{'tar':10} {max(states2('tar').Y[:, 0]):.4f}   primary + secondary")
-print(f"{'tar':10} {max(states3('tar').Y[:, 0]):.4f}   primary + secondary (mod)")
-
-print('\n--- Max gas yield (mass fraction) ---')
-print(f"{'gas':10} {max(states1('gas').Y[:, 0]):.4f}   primary")
-print(f"{'gas':10} {max(states2('gas').Y[:, 0]):.4f}   primary + secondary")
-print(f"{'gas':10} {max(states3('gas').Y[:, 0]):.4f}   primary + secondary (mod)")
-
-# Plot
-# ----------------------------------------------------------------------------
-
-fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(10, 4.8), sharey=True, tight_layout=True)
-
-ax1.plot(states1.t, states1('biomass').Y[:, 0], label='biomass')
-ax1.plot(states1.t, states1('gas').Y[:, 0], label='gas')
-ax1.plot(states1.t, states1('tar').Y[:, 0], label='tar')
-ax1.plot(states1.t, states1('char').Y[:, 0], label='char')
-ax1.set_xlabel('Time [s]')
-ax1.set_ylabel('Mass fraction [-]')
-ax1.grid(color='0.9')
-ax1.set_frame_on(False)
-ax1.tick_params(color='0.9')
-
-ax2.plot(states2.t, states2('biomass').Y[:, 0], label='biomass')
-ax2.plot(states2.t, states2('gas').Y[:, 0], label='gas')
-ax2.plot(states2.t, states2('tar').Y[:, 0], label='tar')
-ax2.plot(states2.t, states2('char').Y[:, 0], label='char')
-ax2.set_xlabel('Time [s]')
-ax2.grid(color='0.9')
-ax2.set_frame_on(False)
-ax2.tick_params(color='0.9')
-
-ax3.plot(states3.t, states3('biomass').Y[:, 0], label='biomass')
-ax3.plot(states3.t, states3('gas').Y[:, 0], label='gas')
-ax3.plot(states3.t, states3('tar').Y[:, 0], label='tar')
-ax3.plot(states3.t, states3('char').Y[:, 0], label='char')
-ax3.set_xlabel('Time [s]')
-ax3.grid(color='0.9')
-ax3.legend(loc='best', frameon=False)
-ax3.set_frame_on(False)
-ax3.tick_params(color='0.9')
-
-plt.show()
+    print('--- Reactions (index, reaction) ---')
+    for i, r in enumerate(mech['equations']):
+        print(i, r)
+
+    print('\n--- Final primary yields (mass fraction) ---')
+    for sp in states1.species_names:
+        print(f"{sp:10} {states1[sp][-1]:.4f}")
+
+    print('\n--- Final primary + seconary yields (mass fraction) ---')
+    for sp in states2.species_names:
+        print(f"{sp:10} {states2[sp][-1]:.4f}")
+
+    print('\n--- Max tar yield (mass fraction) ---')
+    for row in table:
+        print(f"{'tar':10} {row['tar_max']:.4f}   {row['name']}")
+
+    print('\n--- Max gas yield (mass fraction) ---')
+    for row in table:
+        print(f"{'gas':10} {row['gas_max']:.4f}   {row['name']}")
+
+    # Plot
+    # ------------------------------------------------------------------------
+
+    with profiling.stage('matplotlib'):
+        fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(10, 4.8), sharey=True, tight_layout=True)
+
+        ax1.plot(states1.t, states1['biomass'], label='biomass')
+        ax1.plot(states1.t, states1['gas'], label='gas')
+        ax1.plot(states1.t, states1['tar'], label='tar')
+        ax1.plot(states1.t, states1['char'], label='char')
+        ax1.set_xlabel('Time [s]')
+        ax1.set_ylabel('Mass fraction [-]')
+        ax1.grid(color='0.9')
+        ax1.set_frame_on(False)
+        ax1.tick_params(color='0.9')
+
+        ax2.plot(states2.t, states2['biomass'], label='biomass')
+        ax2.plot(states2.t, states2['gas'], label='gas')
+        ax2.plot(states2.t, states2['tar'], label='tar')
+        ax2.plot(states2.t, states2['char'], label='char')
+        ax2.set_xlabel('Time [s]')
+        ax2.grid(color='0.9')
+        ax2.set_frame_on(False)
+        ax2.tick_params(color='0.9')
+
+        ax3.plot(states3.t, states3['biomass'], label='biomass')
+        ax3.plot(states3.t, states3['gas'], label='gas')
+        ax3.plot(states3.t, states3['tar'], label='tar')
+        ax3.plot(states3.t, states3['char'], label='char')
+        ax3.set_xlabel('Time [s]')
+        ax3.grid(color='0.9')
+        ax3.legend(loc='best', frameon=False)
+        ax3.set_frame_on(False)
+        ax3.tick_params(color='0.9')
+
+    plt.show()
+
+
+if __name__ == '__main__':
+    main()
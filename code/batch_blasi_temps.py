@@ -14,9 +14,10 @@ from Wood Pyrolysis”. Industrial & Engineering Chemistry Research, vol. 40,
 pp. 5547–5556, 2001.
 """
 
-import cantera as ct
-import matplotlib.pyplot as plt
 import numpy as np
+from funcs import profiling
+from funcs.batch_reactor import sweep
+from funcs.result_cache import ResultCache
 
 # Parameters
 # ----------------------------------------------------------------------------
@@ -35,48 +36,43 @@ temps = np.arange(temp_min, temp_max + 20, 20)
 # Batch reactor with Di Blasi reactions
 # ----------------------------------------------------------------------------
 
-# store tar yields at each temperature
-# tar1 is for primary reactions only
-# tar2 is for primary and secondary reactions
-tar1 = []
-tar2 = []
+# multipliers for primary reactions only, disables reactions tar => gas and
+# tar => char
+mult1 = [1, 1, 1, 0, 0]
 
-# calculate biomass conversion and product yields for each temperature over a
-# specified time range
-for temp in temps:
+# multipliers for primary and secondary reactions
+mult2 = [1, 1, 1, 1, 1]
 
-    # primary reactions only
-    gas1 = ct.Solution('blasi.cti')
-    gas1.TPY = temp, press, y0
-    gas1.set_multiplier(0, 3)    # disable reaction tar => gas
-    gas1.set_multiplier(0, 4)    # disable reaction tar => char
+# primary cases followed by primary and secondary cases for each temperature
+cases = [(t, press, mult1) for t in temps] + [(t, press, mult2) for t in temps]
 
-    r1 = ct.IdealGasConstPressureReactor(gas1, energy='off')
-    sim1 = ct.ReactorNet([r1])
-    states1 = ct.SolutionArray(gas1, extra=['t'])
 
-    # primary and secondary reactions
-    gas2 = ct.Solution('blasi.cti')
-    gas2.TPY = temp, press, y0
+def calc_yields(cases, y0, time):
+    y = sweep(cases, y0, time)
+    return {'y': y}
 
-    r2 = ct.IdealGasConstPressureReactor(gas2, energy='off')
-    sim2 = ct.ReactorNet([r2])
-    states2 = ct.SolutionArray(gas2, extra=['t'])
 
-    for t in time:
-        sim1.advance(t)
-        states1.append(r1.thermo.state, t=t)
+def main():
+    import matplotlib.pyplot as plt
 
-        sim2.advance(t)
-        states2.append(r2.thermo.state, t=t)
+    # calculate biomass conversion and product yields for each temperature
+    # over a specified time range, results are reused from the cache when the
+    # cases and the mechanism file are unchanged
+    cache = ResultCache()
+    inputs = {'cases': cases, 'y0': y0, 'time': time}
+    y = cache.run('batch_blasi_temps', calc_yields, inputs, files=['blasi.cti'])['y']
 
-    tar1.append(states1('tar').Y[:, 0])
-    tar2.append(states2('tar').Y[:, 0])
+    # store tar yields at each temperature
+    # tar1 is for primary reactions only
+    # tar2 is for primary and secondary reactions
+    itar = 2    # index of tar species in blasi.cti
+    tar1 = y[:len(temps), :, itar]
+    tar2 = y[len(temps):, :, itar]
 
-# Print
-# ----------------------------------------------------------------------------
+    # Print
+    # ------------------------------------------------------------------------
 
-print(f"""
+    print(f"""
 --- Parameters ---
 temp_min    {temp_min} K
 temp_max    {temp_max} K
@@ -87,25 +83,30 @@ y0          {y0}
 temps       {temps} K
 """)
 
-# Plot
-# ----------------------------------------------------------------------------
+    # Plot
+    # ------------------------------------------------------------------------
+
+    with profiling.stage('matplotlib'):
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(8.4, 4.8), sharey=True, tight_layout=True)
+
+        for i in range(len(temps)):
+            ax1.plot(time, tar1[i])
+            ax2.plot(time, tar2[i], label=f'{temps[i]} K')
 
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(8.4, 4.8), sharey=True, tight_layout=True)
+        ax1.grid(color='0.9')
+        ax1.tick_params(color='0.9')
+        ax1.set_frame_on(False)
+        ax1.set_xlabel('Time [s]')
+        ax1.set_ylabel('Tar mass fraction [-]')
 
-for i in range(len(temps)):
-    ax1.plot(time, tar1[i])
-    ax2.plot(time, tar2[i], label=f'{temps[i]} K')
+        ax2.grid(color='0.9')
+        ax2.legend(loc='best', frameon=False)
+        ax2.tick_params(color='0.9')
+        ax2.set_frame_on(False)
+        ax2.set_xlabel('Time [s]')
 
-ax1.grid(color='0.9')
-ax1.tick_params(color='0.9')
-ax1.set_frame_on(False)
-ax1.set_xlabel('Time [s]')
-ax1.set_ylabel('Tar mass fraction [-]')
+    plt.show()
 
-ax2.grid(color='0.9')
-ax2.legend(loc='best', frameon=False)
-ax2.tick_params(color='0.9')
-ax2.set_frame_on(False)
-ax2.set_xlabel('Time [s]')
 
-plt.show()
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,326 @@
+"""
+Benchmarks for the gas property, mixture, fluidization, and kinetics
+calculations. Each benchmark has a fixed workload for a small, medium, and
+large size. Results are the throughput, latency percentiles, and peak memory
+of each benchmark and can be saved as a JSON baseline which is compared to
+later runs to find performance regressions.
+
+Examples
+--------
+Run all the benchmarks for the medium size.
+
+    $ python benchmark.py
+
+Run the viscosity benchmarks for all sizes and save a baseline.
+
+    $ python benchmark.py mu_wilke mu_brokaw --size all --save base.json
+
+Compare to the baseline and report benchmarks that are more than 10% slower.
+
+    $ python benchmark.py --size all --compare base.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+# benchmark name and (setup function, workload size for small, medium, large)
+benchmarks = {}
+
+# gases used for the mixture benchmarks
+species = ['N2', 'H2', 'H2O', 'CO', 'CO2', 'CH4']
+
+
+def benchmark(small, medium, large):
+    """
+    Register a benchmark. The decorated function takes the workload size and
+    returns a function that runs the workload once. Setup in the decorated
+    function is not timed.
+    """
+    def register(setup):
+        benchmarks[setup.__name__] = (setup, {'small': small, 'medium': medium, 'large': large})
+        return setup
+    return register
+
+
+def _mole_fractions(n):
+    rng = np.random.default_rng(42)
+    return rng.dirichlet(np.ones(len(species)), size=n)
+
+
+def _temps(n):
+    from params import temp_max, temp_min
+    return np.linspace(temp_min, temp_max, n)
+
+
+# Benchmarks
+# ----------------------------------------------------------------------------
+
+@benchmark(10**2, 10**4, 10**6)
+def mu_wilke(n):
+    import chemics as cm
+    from funcs import mu_wilke
+    from params import temp
+    mu = [cm.mu_gas(sp, temp) for sp in species]
+    mw = [cm.mw(sp) for sp in species]
+    x = _mole_fractions(n)
+    return lambda: mu_wilke(mu, mw, x)
+
+
+@benchmark(10**2, 10**4, 10**6)
+def mu_brokaw(n):
+    import chemics as cm
+    from funcs import mu_brokaw
+    from params import temp
+    mu = [cm.mu_gas(sp, temp) for sp in species]
+    mw = [cm.mw(sp) for sp in species]
+    x = _mole_fractions(n)
+    return lambda: mu_brokaw(mu, mw, x)
+
+
+@benchmark(10**2, 10**4, 10**6)
+def mu_davidson(n):
+    import chemics as cm
+    from funcs import mu_davidson
+    from params import temp
+    mu = [cm.mu_gas(sp, temp) for sp in species]
+    mw = [cm.mw(sp) for sp in species]
+    x = _mole_fractions(n)
+    return lambda: mu_davidson(mu, mw, x)
+
+
+@benchmark(10**2, 10**4, 10**6)
+def mixture_model(n):
+    from funcs import MixtureModel
+    from params import temp
+    model = MixtureModel(species)
+    x = _mole_fractions(n)
+    model.mu_wilke(x[:1], temp)
+    return lambda: model.mu_wilke(x, temp)
+
+
+@benchmark(10**2, 10**4, 10**6)
+def mixture_properties(n):
+    from funcs import MixtureModel, mixture_properties
+    from params import dp_bed, ep, phi_bed, press, rhop_bed, temp
+    model = MixtureModel(species)
+    x = _mole_fractions(n)
+    model.mu_wilke(x[:1], temp)
+    return lambda: mixture_properties(model, x, temp, press, dp_bed, ep, phi_bed, rhop_bed, basis='mole')
+
+
+# each chemics.mu_gas call reads the correlation table and takes about 26 ms
+@benchmark(1, 4, 16)
+def chemics_mu_gas(n):
+    import chemics as cm
+    temps = _temps(n)
+    return lambda: [[cm.mu_gas(sp, t) for sp in species] for t in temps]
+
+
+@benchmark(10**2, 10**4, 10**6)
+def gas_property_table(n):
+    from funcs import GasPropertyTable
+    from params import temp_max, temp_min
+    table = GasPropertyTable(species, temp_min, temp_max)
+    temps = _temps(n)
+    return lambda: table.mu(temps)
+
+
+@benchmark(10**2, 10**4, 10**6)
+def umf_correlations(n):
+    from funcs import umf_correlations
+    from params import dp_bed, ep, phi_bed, rhop_bed
+    mu = np.linspace(1.5e-5, 4.0e-5, n)
+    rhog = np.linspace(0.03, 0.7, n)
+    return lambda: umf_correlations(dp_bed, ep, mu, phi_bed, rhog, rhop_bed)
+
+
+@benchmark(10**2, 10**4, 10**6)
+def regime(n):
+    from funcs import regime
+    from params import k_feed, rhop_feed
+    h = np.linspace(100, 3000, n)
+    r = np.geomspace(5e-6, 5e-3, n)
+    return lambda: regime(h, r, k_feed, 1.39, rhop_feed, 3093)
+
+
+@benchmark(10**2, 10**4, 10**6)
+def rate_constants(n):
+    from funcs.kinetics import rate_constants
+    temps = _temps(n)
+    return lambda: rate_constants(temps)
+
+
+@benchmark(10, 100, 1000)
+def batch_linear(n):
+    from funcs.linear_kinetics import batch_linear
+    from params import y0
+    temps = _temps(n)
+    time = np.linspace(0, 25, 1000)
+    return lambda: batch_linear(temps, y0, time)
+
+
+@benchmark(10, 100, 1000)
+def batch_cantera(n):
+    import cantera as ct
+    from funcs.batch_reactor import run_batch
+    from params import press, y0
+    gas = ct.Solution('blasi.cti')
+    temps = _temps(n)
+    time = np.linspace(0, 25, 1000)
+    return lambda: [run_batch(gas, t, press, y0, time) for t in temps]
+
+
+# Harness
+# ----------------------------------------------------------------------------
+
+def run_benchmark(name, size, min_time=0.5, max_repeat=100):
+    """
+    Run a benchmark until at least `min_time` seconds have passed and three
+    repeats are done. Peak memory is measured in a separate run with
+    `tracemalloc` so the timings are not affected.
+
+    Returns
+    -------
+    result : dict
+        Workload size, number of repeats, latency percentiles [s],
+        throughput [items/s], and peak memory [bytes].
+    """
+    setup, sizes = benchmarks[name]
+    n = sizes[size]
+    func = setup(n)
+
+    # warm up caches such as the chemics tables
+    func()
+
+    times = []
+    total = 0.0
+    while (total < min_time or len(times) < 3) and len(times) < max_repeat:
+        ti = time.perf_counter()
+        func()
+        dt = time.perf_counter() - ti
+        times.append(dt)
+        total += dt
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    p50, p90, p99 = np.percentile(times, [50, 90, 99])
+    result = {
+        'n': n,
+        'repeat': len(times),
+        'p50': p50,
+        'p90': p90,
+        'p99': p99,
+        'throughput': n / p50,
+        'peak_mem': peak
+    }
+    return result
+
+
+def _environment():
+    """
+    Versions and git commit which are stored with a baseline.
+    """
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    try:
+        import chemics as cm
+        chemics_version = getattr(cm, '__version__', None)
+    except ImportError:
+        chemics_version = None
+
+    env = {
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'chemics': chemics_version,
+        'machine': platform.machine(),
+        'date': time.strftime('%Y-%m-%d %H:%M:%S')
+    }
+    return env
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the benchmarks.')
+    parser.add_argument('names', nargs='*', help='benchmarks to run, default is all')
+    parser.add_argument('--size', default='medium', choices=['small', 'medium', 'large', 'all'])
+    parser.add_argument('--min-time', type=float, default=0.5, help='minimum time of each benchmark [s]')
+    parser.add_argument('--save', help='save results as a JSON baseline')
+    parser.add_argument('--compare', help='compare to a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=0.1, help='slowdown reported as a regression [-]')
+    parser.add_argument('--list', action='store_true', help='list the benchmarks')
+    args = parser.parse_args()
+
+    if args.list:
+        for name, (_, sizes) in benchmarks.items():
+            print(f'{name:22} {sizes["small"]:>9,} {sizes["medium"]:>9,} {sizes["large"]:>9,}')
+        return
+
+    names = args.names or list(benchmarks)
+    unknown = [n for n in names if n not in benchmarks]
+    if unknown:
+        parser.error(f'unknown benchmarks {", ".join(unknown)}')
+
+    sizes = ['small', 'medium', 'large'] if args.size == 'all' else [args.size]
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+
+    print(f'{"benchmark":22} {"size":>7} {"n":>9} {"p50 [ms]":>10} {"p90 [ms]":>10} '
+          f'{"p99 [ms]":>10} {"items/s":>10} {"peak [MB]":>10}', end='')
+    print(f' {"vs base":>8}' if baseline else '')
+
+    results = {}
+    regressions = []
+    for name in names:
+        for size in sizes:
+            key = f'{name}/{size}'
+            try:
+                res = run_benchmark(name, size, args.min_time)
+            except Exception as e:
+                print(f'{name:22} {size:>7} failed: {type(e).__name__}: {str(e).strip()[:60]}')
+                continue
+            results[key] = res
+
+            line = (f'{name:22} {size:>7} {res["n"]:>9,} {res["p50"] * 1e3:>10.3f} '
+                    f'{res["p90"] * 1e3:>10.3f} {res["p99"] * 1e3:>10.3f} '
+                    f'{res["throughput"]:>10.3g} {res["peak_mem"] / 1e6:>10.2f}')
+
+            if key in baseline:
+                ratio = res['p50'] / baseline[key]['p50']
+                line += f' {ratio:>7.2f}x'
+                if ratio > 1 + args.threshold:
+                    regressions.append((key, ratio))
+            print(line)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'environment': _environment(), 'results': results}, f, indent=2)
+        print(f'\nsaved baseline to {args.save}')
+
+    if regressions:
+        print('\nregressions')
+        for key, ratio in regressions:
+            print(f'{key:30} {ratio:.2f}x slower')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
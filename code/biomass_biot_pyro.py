@@ -2,11 +2,10 @@
 Compare the Biot and pyrolysis numbers for different fluidization gases.
 """
 
-import chemics as cm
-import matplotlib.pyplot as plt
 import numpy as np
 import params as pm
-from funcs import biot, pyro1, pyro2
+from funcs import FeedstockPopulation, GasPropertyTable, regime, regime_names, umf_correlations
+from funcs.kinetics import k_total
 
 # Parameters
 # ----------------------------------------------------------------------------
@@ -22,230 +21,149 @@ dmin = 10
 dmax = 5000
 diams = np.linspace(dmin, dmax, 10)
 
-# Diameter of biomass particle (d_avg)
-# ----------------------------------------------------------------------------
-
-dps = []
-wts = []
-
-for x in pm.dp_feed:
-    dps.append(x['d'])
-    wts.append(x['mf'])
 
-# average biomass particle diameter [m]
-d_avg = np.average(dps, weights=wts) / 1e6
+def main():
+    import chemics as cm
+    import matplotlib.pyplot as plt
 
-# Reaction rate constant (kr)
-# ----------------------------------------------------------------------------
-
-# universal gas constant [kJ/(mol K)]
-rconst = 0.008314
+    # Diameter of biomass particle (d_avg)
+    # ------------------------------------------------------------------------
 
-# biomass -> gas
-a1 = 4.38e9
-e1 = 152.7
-k1 = a1 * np.exp(-e1 / (rconst * pm.temp))
+    dps = []
+    wts = []
 
-# biomass -> char
-a2 = 3.27e6
-e2 = 111.7
-k2 = a2 * np.exp(-e2 / (rconst * pm.temp))
+    for x in pm.dp_feed:
+        dps.append(x['d'])
+        wts.append(x['mf'])
 
-# biomass -> tar
-a3 = 1.08e10
-e3 = 148.0
-k3 = a3 * np.exp(-e3 / (rconst * pm.temp))
+    # average biomass particle diameter [m]
+    d_avg = np.average(dps, weights=wts) / 1e6
 
-# overall reaction rate constant for biomass conversion [1/s]
-kr = k1 + k2 + k3
+    # Reaction rate constant (kr)
+    # ------------------------------------------------------------------------
 
-# Biot and pyrolysis numbers relevant to each gas (Bi, PyI, PyII)
-# ----------------------------------------------------------------------------
+    # overall rate constant for biomass conversion [1/s] from the biomass => gas,
+    # biomass => char, and biomass => tar reactions in blasi.cti
+    kr = k_total(pm.temp)
 
-# store properties
-h_gas = []
-bi_gas = []
-py1_gas = []
-py2_gas = []
+    # Biot and pyrolysis numbers relevant to each gas (Bi, Py)
+    # ------------------------------------------------------------------------
 
-for g in gas:
-    mw = cm.mw(g)
-    rho_gas = cm.rhog(mw, pm.press, pm.temp)
-    mu_gas = cm.mu_gas(g, pm.temp) / 1e7    # convert µP to kg/(ms)
-
-    umf_ergun = cm.umf_ergun(pm.dp_bed, pm.ep, mu_gas, pm.phi_bed, rho_gas, pm.rhop_bed)
-    umf_grace = cm.umf_coeff(pm.dp_bed, mu_gas, rho_gas, pm.rhop_bed, coeff='grace')
-    umf_rich = cm.umf_coeff(pm.dp_bed, mu_gas, rho_gas, pm.rhop_bed, coeff='rich')
-    umf_wenyu = cm.umf_coeff(pm.dp_bed, mu_gas, rho_gas, pm.rhop_bed, coeff='wenyu')
-    umf_avg = (umf_ergun + umf_grace + umf_rich + umf_wenyu) / 4
+    # properties of all gases from one table of the correlations
+    table = GasPropertyTable(gas, pm.temp_min, pm.temp_max)
+    rho_gas = cm.rhog(table.mw, pm.press, pm.temp)
+    mu_gas = table.mu(pm.temp) / 1e7    # convert µP to kg/(ms)
+    k_gas = table.k(pm.temp)
 
+    # heat transfer coefficient of the average biomass particle for each gas
+    umf_avg = umf_correlations(pm.dp_bed, pm.ep, mu_gas, pm.phi_bed, rho_gas, pm.rhop_bed)['avg']
     re = (rho_gas * umf_avg * d_avg) / mu_gas
     nu = 2 + (0.9 * re**0.62) * ((d_avg / pm.dp_bed)**0.2)
-
-    if g == 'CH4':
-        k_gas = cm.k_gas_organic(g, pm.temp)
-    else:
-        k_gas = cm.k_gas_inorganic(g, pm.temp)
-    h = (k_gas * nu) / d_avg
-    h_gas.append(h)
-
-    bi = biot(h, d_avg / 2, pm.k_feed)
-    bi_gas.append(bi)
-
-    py1 = pyro1(pm.k_feed, kr, pm.rhop_feed, cp_feed, d_avg / 2)
-    py1_gas.append(py1)
-
-    py2num = pyro2(h, kr, pm.rhop_feed, cp_feed, d_avg / 2)
-    py2_gas.append(py2num)
-
-
-# Biot and pyrolysis numbers for range of diameters (Bi, PyI, PyII)
-# ----------------------------------------------------------------------------
-
-
-class Feedstock:
-
-    def __init__(self, cp, d, h, kr, params, diams=0):
-        self.d = d
-        self.h = h
-        self.kr = kr
-        self.cp = cp
-        self.k = params.k_feed
-        self.rho = params.rhop_feed
-        self.diams = diams
-
-    @property
-    def biot(self):
-        r = self.d / 2
-        bi = (self.h * r) / self.k
-        return bi
-
-    @property
-    def pyro(self):
-        r = self.d / 2
-        pyI = self.k / (self.kr * self.rho * self.cp * (r**2))
-        pyII = self.h / (self.kr * self.rho * self.cp * r)
-        if self.biot < 1.0:
-            return pyII
-        else:
-            return pyI
-
-    def calc_from_diams(self):
-        biot_diams = []
-        pyro_diams = []
-
-        for d in self.diams:
-            d = d / 1e6
-            r = d / 2
-            bi = (self.h * r) / self.k
-            biot_diams.append(bi)
-
-            pyI = self.k / (self.kr * self.rho * self.cp * (r**2))
-            pyII = self.h / (self.kr * self.rho * self.cp * r)
-            if bi < 1.0:
-                pyro_diams.append(pyII)
-            else:
-                pyro_diams.append(pyI)
-
-        return biot_diams, pyro_diams
-
-
-feed_n2 = Feedstock(cp=cp_feed, d=d_avg, h=370, kr=kr, params=pm, diams=diams)
-feed_h2 = Feedstock(cp=cp_feed, d=d_avg, h=2200, kr=kr, params=pm, diams=diams)
-
-biot_n2, pyro_n2 = feed_n2.calc_from_diams()
-biot_h2, pyro_h2 = feed_h2.calc_from_diams()
-
-# Print
-# ----------------------------------------------------------------------------
-
-print(f'{"gas":8} {"Bi":8} {"Py I":8} {"Py II":8}')
-for i in range(len(gas)):
-    print(f'{gas[i]:<8} {bi_gas[i]:<8.2f} {py1_gas[i]:<8.2f} {py2_gas[i]:<8.2f}')
-
-# Plot
-# ----------------------------------------------------------------------------
-
-gas_labels = ['N₂', 'H₂', 'H₂O', 'CO', 'CO₂', 'CH₄']
-
-# Figure 1
-fig, ax = plt.subplots(tight_layout=True)
-for i in range(len(gas)):
-    bi = bi_gas[i]
-    pyI = py1_gas[i]
-    pyII = py2_gas[i]
-    if bi < 1.0:
-        ax.plot(bi, pyII, 'o', label=gas_labels[i])
-    else:
-        ax.plot(bi, pyI, '^', label=gas_labels[i])
-ax.set_xlabel('Biot Number, Bi [-]')
-ax.set_ylabel('Pyrolysis Number, Py [-]')
-
-ax.text(0.2, 0.91, 'kinetics limited\nisothermal', ha='center', transform=ax.transAxes)
-ax.text(0.8, 0.91, 'kinetics limited\nnon-isothermal', ha='center', transform=ax.transAxes)
-ax.text(0.2, 0.03, 'convection limited', ha='center', transform=ax.transAxes)
-ax.text(0.8, 0.03, 'conduction limited', ha='center', transform=ax.transAxes)
-ax.axvline(1, c='k', ls='-.')
-ax.axvspan(10**-1, 10**1, color='0.9')
-ax.axhline(1, c='k', ls='-.')
-ax.axhspan(10**-1, 10**1, color='0.9')
-ax.grid(color='0.9')
-ax.legend(loc='right', frameon=False)
-ax.set_frame_on(False)
-ax.set_xlim(10**-4, 10**4)
-ax.set_ylim(10**-4, 10**4)
-ax.set_xscale('log')
-ax.set_yscale('log')
-ax.tick_params(color='0.9')
-plt.minorticks_off()
-
-# zoom region for Figure 1
-axins = ax.inset_axes([0.2, 0.2, 0.2, 0.2])
-for i in range(len(gas)):
-    bi = bi_gas[i]
-    pyI = py1_gas[i]
-    pyII = py2_gas[i]
-    if bi < 1.0:
-        axins.plot(bi, pyII, 'o', label=gas[i])
-    else:
-        axins.plot(bi, pyI, '^', label=gas[i])
-x1, x2, y1, y2 = 0.5, 0.75, 0.8, 1.2
-axins.set_xlim(x1, x2)
-axins.set_ylim(y1, y2)
-axins.set_xticklabels('')
-axins.set_yticklabels('')
-ax.indicate_inset_zoom(axins)
-
-# Figure 2
-fig, ax = plt.subplots(tight_layout=True)
-ax.plot(biot_n2, pyro_n2, marker='.')
-ax.plot(biot_h2, pyro_h2, marker='.')
-ax.plot(feed_n2.biot, feed_n2.pyro, 'k^')
-ax.plot(feed_h2.biot, feed_h2.pyro, 'k^')
-ax.set_xlabel('Biot number, Bi [-]')
-ax.set_ylabel('Pyrolysis number, Py [-]')
-
-ax.text(biot_n2[0] - 0.008, pyro_n2[0], 'N₂')
-ax.text(biot_h2[0] - 0.05, pyro_h2[0], 'H₂')
-
-ax.text(biot_h2[0] + 0.02, pyro_h2[0], f'{diams[0]:.2g} µm')
-ax.text(biot_h2[-1] + 10, pyro_h2[-1], f'{diams[-1] / 1000:.1g} mm')
-
-ax.text(0.2, 0.91, 'kinetics limited\nisothermal', ha='center', transform=ax.transAxes)
-ax.text(0.8, 0.91, 'kinetics limited\nnon-isothermal', ha='center', transform=ax.transAxes)
-ax.text(0.2, 0.03, 'convection limited', ha='center', transform=ax.transAxes)
-ax.text(0.8, 0.03, 'conduction limited', ha='center', transform=ax.transAxes)
-ax.axvline(1, c='k', ls='-.')
-ax.axvspan(10**-1, 10**1, color='0.9')
-ax.axhline(1, c='k', ls='-.')
-ax.axhspan(10**-1, 10**1, color='0.9')
-ax.grid(color='0.9')
-ax.set_frame_on(False)
-ax.set_xlim(10**-4, 10**4)
-ax.set_ylim(10**-4, 10**4)
-ax.set_xscale('log')
-ax.set_yscale('log')
-ax.tick_params(color='0.9')
-plt.minorticks_off()
-
-plt.show()
+    h_gas = (k_gas * nu) / d_avg
+
+    # Biot number, pyrolysis number (Py II if Bi < 1 otherwise Py I), and
+    # regime for each gas, Py I is plotted as a triangle and Py II as a circle
+    bi_gas, py_gas, code_gas = regime(h_gas, d_avg / 2, pm.k_feed, kr, pm.rhop_feed, cp_feed)
+    markers = np.where(code_gas % 2 == 1, '^', 'o')
+
+    # Biot and pyrolysis numbers for range of diameters (Bi, PyI, PyII)
+    # ------------------------------------------------------------------------
+
+    # particle diameters [m]
+    d_pop = diams / 1e6
+
+    feed_n2 = FeedstockPopulation(d_pop, h=370, kr=kr, cp=cp_feed, k=pm.k_feed, rho=pm.rhop_feed)
+    feed_h2 = FeedstockPopulation(d_pop, h=2200, kr=kr, cp=cp_feed, k=pm.k_feed, rho=pm.rhop_feed)
+
+    # average biomass particle for each gas
+    avg_n2 = FeedstockPopulation(d_avg, h=370, kr=kr, cp=cp_feed, k=pm.k_feed, rho=pm.rhop_feed)
+    avg_h2 = FeedstockPopulation(d_avg, h=2200, kr=kr, cp=cp_feed, k=pm.k_feed, rho=pm.rhop_feed)
+
+    biot_n2, pyro_n2 = feed_n2.biot_pyro()
+    biot_h2, pyro_h2 = feed_h2.biot_pyro()
+
+    # Print
+    # ------------------------------------------------------------------------
+
+    print(f'{"gas":8} {"Bi":8} {"Py":8} {"regime"}')
+    for i in range(len(gas)):
+        print(f'{gas[i]:<8} {bi_gas[i]:<8.2f} {py_gas[i]:<8.2f} {regime_names[code_gas[i]]}')
+
+    # Plot
+    # ------------------------------------------------------------------------
+
+    gas_labels = ['N₂', 'H₂', 'H₂O', 'CO', 'CO₂', 'CH₄']
+
+    # Figure 1
+    fig, ax = plt.subplots(tight_layout=True)
+    for i in range(len(gas)):
+        ax.plot(bi_gas[i], py_gas[i], markers[i], label=gas_labels[i])
+    ax.set_xlabel('Biot Number, Bi [-]')
+    ax.set_ylabel('Pyrolysis Number, Py [-]')
+
+    ax.text(0.2, 0.91, 'kinetics limited\nisothermal', ha='center', transform=ax.transAxes)
+    ax.text(0.8, 0.91, 'kinetics limited\nnon-isothermal', ha='center', transform=ax.transAxes)
+    ax.text(0.2, 0.03, 'convection limited', ha='center', transform=ax.transAxes)
+    ax.text(0.8, 0.03, 'conduction limited', ha='center', transform=ax.transAxes)
+    ax.axvline(1, c='k', ls='-.')
+    ax.axvspan(10**-1, 10**1, color='0.9')
+    ax.axhline(1, c='k', ls='-.')
+    ax.axhspan(10**-1, 10**1, color='0.9')
+    ax.grid(color='0.9')
+    ax.legend(loc='right', frameon=False)
+    ax.set_frame_on(False)
+    ax.set_xlim(10**-4, 10**4)
+    ax.set_ylim(10**-4, 10**4)
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.tick_params(color='0.9')
+    plt.minorticks_off()
+
+    # zoom region for Figure 1
+    axins = ax.inset_axes([0.2, 0.2, 0.2, 0.2])
+    for i in range(len(gas)):
+        axins.plot(bi_gas[i], py_gas[i], markers[i], label=gas[i])
+    x1, x2, y1, y2 = 0.5, 0.75, 0.8, 1.2
+    axins.set_xlim(x1, x2)
+    axins.set_ylim(y1, y2)
+    axins.set_xticklabels('')
+    axins.set_yticklabels('')
+    ax.indicate_inset_zoom(axins)
+
+    # Figure 2
+    fig, ax = plt.subplots(tight_layout=True)
+    ax.plot(biot_n2, pyro_n2, marker='.')
+    ax.plot(biot_h2, pyro_h2, marker='.')
+    ax.plot(avg_n2.biot, avg_n2.pyro, 'k^')
+    ax.plot(avg_h2.biot, avg_h2.pyro, 'k^')
+    ax.set_xlabel('Biot number, Bi [-]')
+    ax.set_ylabel('Pyrolysis number, Py [-]')
+
+    ax.text(biot_n2[0] - 0.008, pyro_n2[0], 'N₂')
+    ax.text(biot_h2[0] - 0.05, pyro_h2[0], 'H₂')
+
+    ax.text(biot_h2[0] + 0.02, pyro_h2[0], f'{diams[0]:.2g} µm')
+    ax.text(biot_h2[-1] + 10, pyro_h2[-1], f'{diams[-1] / 1000:.1g} mm')
+
+    ax.text(0.2, 0.91, 'kinetics limited\nisothermal', ha='center', transform=ax.transAxes)
+    ax.text(0.8, 0.91, 'kinetics limited\nnon-isothermal', ha='center', transform=ax.transAxes)
+    ax.text(0.2, 0.03, 'convection limited', ha='center', transform=ax.transAxes)
+    ax.text(0.8, 0.03, 'conduction limited', ha='center', transform=ax.transAxes)
+    ax.axvline(1, c='k', ls='-.')
+    ax.axvspan(10**-1, 10**1, color='0.9')
+    ax.axhline(1, c='k', ls='-.')
+    ax.axhspan(10**-1, 10**1, color='0.9')
+    ax.grid(color='0.9')
+    ax.set_frame_on(False)
+    ax.set_xlim(10**-4, 10**4)
+    ax.set_ylim(10**-4, 10**4)
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.tick_params(color='0.9')
+    plt.minorticks_off()
+
+    plt.show()
+
+
+if __name__ == '__main__':
+    main()
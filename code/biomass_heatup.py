@@ -0,0 +1,152 @@
+"""
+Heat-up and mass loss of the biomass particles in each bin of the feedstock
+particle size distribution for different fluidization gases. The convective
+heat transfer coefficient of each gas and particle diameter is calculated as
+in `biomass_hconv.py` then all gases and diameters are integrated together
+with the non-isothermal particle model in `funcs.particle`.
+"""
+
+import numpy as np
+from funcs import umf_correlations
+from funcs.particle import particle_pyrolysis
+from funcs.result_cache import ResultCache
+
+# Parameters
+# ----------------------------------------------------------------------------
+
+from params import dp_feed
+from params import dp_bed
+from params import ep
+from params import k_feed
+from params import phi_bed
+from params import press
+from params import rhop_bed
+from params import rhop_feed
+from params import temp
+
+# initial temperature of the biomass particle [K]
+temp0 = 300
+
+# times at which the particle state is stored [s]
+time = np.linspace(0, 10, 1001)
+
+# gases for calculations
+gas = ['N2', 'H2', 'H2O', 'CO', 'CO2', 'CH4']
+
+# biomass particle diameter [m] and mass fraction [%] of each bin
+d_feed = np.array([x['d'] for x in dp_feed]) / 1e6
+mf_feed = np.array([x['mf'] for x in dp_feed])
+
+
+def calc_heatup(gas, d_feed, temp, temp0, time, press, dp_bed, ep, phi_bed, rhop_bed, k_feed, rhop_feed):
+    import chemics as cm
+
+    # Heat transfer coefficient for each gas and particle diameter
+    # ------------------------------------------------------------------------
+
+    h = np.empty((len(gas), len(d_feed)))
+
+    for i, g in enumerate(gas):
+        mw = cm.mw(g)
+        rho_gas = cm.rhog(mw, press, temp)
+        mu_gas = cm.mu_gas(g, temp) / 1e7    # convert µP to kg/(ms)
+
+        umf_avg = umf_correlations(dp_bed, ep, mu_gas, phi_bed, rho_gas, rhop_bed)['avg']
+
+        re = (rho_gas * umf_avg * d_feed) / mu_gas
+        nu = 2 + (0.9 * re**0.62) * ((d_feed / dp_bed)**0.2)
+
+        if g == 'CH4':
+            k_gas = cm.k_gas_organic(g, temp)
+        else:
+            k_gas = cm.k_gas_inorganic(g, temp)
+        h[i] = (k_gas * nu) / d_feed
+
+    # Particle temperature and mass loss
+    # ------------------------------------------------------------------------
+
+    res = particle_pyrolysis(h, d_feed, k_feed, rhop_feed, temp, time, temp0=temp0)
+    res['h'] = h
+    return res
+
+
+def main():
+    import matplotlib.pyplot as plt
+
+    # results are reused from the cache when the inputs and code are
+    # unchanged
+    cache = ResultCache()
+    inputs = {
+        'gas': gas, 'd_feed': d_feed, 'temp': temp, 'temp0': temp0, 'time': time,
+        'press': press, 'dp_bed': dp_bed, 'ep': ep, 'phi_bed': phi_bed, 'rhop_bed': rhop_bed,
+        'k_feed': k_feed, 'rhop_feed': rhop_feed
+    }
+    res = cache.run('biomass_heatup', calc_heatup, inputs)
+    h = res['h']
+
+    # biomass conversion with shape (n_times, n_gases, n_diameters)
+    conv = 1 - res['y'][..., 0]
+
+    # time to reach 95% of the reactor temperature rise and 95% conversion [s]
+    rise = (res['temp'] - temp0) / (temp - temp0)
+    t_heat = time[np.argmax(rise >= 0.95, axis=0)]
+    t_conv = time[np.argmax(conv >= 0.95, axis=0)]
+
+    # mass averaged over the particle size distribution
+    t_conv_avg = np.average(t_conv, axis=1, weights=mf_feed)
+
+    # Print
+    # ------------------------------------------------------------------------
+
+    print(
+        f'\n{" Parameters ":-^79}\n'
+        f'temp       {temp} K\n'
+        f'temp0      {temp0} K\n'
+        f'k_feed     {k_feed} W/(m K)\n'
+        f'rhop_feed  {rhop_feed} kg/m³\n'
+    )
+
+    print(f'{" Results ":-^79}\n')
+    print(f'{"":14}' + ''.join(f'{d * 1e6:<10.0f}' for d in d_feed) + 'avg.')
+
+    print('\nh [W/(m² K)]')
+    for i, g in enumerate(gas):
+        print(f'{g:14}' + ''.join(f'{v:<10.1f}' for v in h[i]))
+
+    print('\nt 95% heat-up [s]')
+    for i, g in enumerate(gas):
+        print(f'{g:14}' + ''.join(f'{v:<10.2f}' for v in t_heat[i]))
+
+    print('\nt 95% conversion [s]')
+    for i, g in enumerate(gas):
+        print(f'{g:14}' + ''.join(f'{v:<10.2f}' for v in t_conv[i]) + f'{t_conv_avg[i]:.2f}')
+
+    # Plot
+    # ------------------------------------------------------------------------
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(8.4, 4.8), sharex=True, tight_layout=True)
+
+    for i, ls in zip((gas.index('N2'), gas.index('H2')), ('-', '--')):
+        for j in range(len(d_feed)):
+            label = f'{gas[i]} {d_feed[j] * 1e6:.0f} µm'
+            ax1.plot(time, res['temp'][:, i, j], f'C{j}{ls}', label=label)
+            ax2.plot(time, res['solid'][:, i, j], f'C{j}{ls}', label=label)
+
+    ax1.grid(color='0.9')
+    ax1.set_frame_on(False)
+    ax1.set_xlabel('Time [s]')
+    ax1.set_ylabel('Particle temperature [K]')
+    ax1.tick_params(color='0.9')
+
+    ax2.grid(color='0.9')
+    ax2.legend(loc='best', frameon=False, fontsize=8)
+    ax2.set_frame_on(False)
+    ax2.set_xlabel('Time [s]')
+    ax2.set_ylabel('Solid mass fraction [-]')
+    ax2.tick_params(color='0.9')
+
+    plt.show()
+
+
+if __name__ == '__main__':
+    main()
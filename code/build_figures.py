@@ -0,0 +1,281 @@
+"""
+Build the paper figures from the scripts in this folder. Each script is
+imported and its `main` function is called in a worker process with the
+non-interactive Agg backend and its figures are saved as PDF files to
+`tex/figures/`. Scripts run in parallel and a script is skipped when the
+script, the local modules it imports, and the data files have not changed
+since the last build.
+
+Examples
+--------
+Build all figures that are out of date.
+
+    $ python build_figures.py
+
+Rebuild the biot and pyrolysis figures even if they are up to date.
+
+    $ python build_figures.py biomass_biot_pyro.py --force
+"""
+
+import argparse
+import concurrent.futures
+import contextlib
+import hashlib
+import importlib
+import io
+import json
+import os
+import sys
+import time
+import traceback
+
+# folder of the scripts which is also the working directory of each script
+code_dir = os.path.dirname(os.path.abspath(__file__))
+
+# figure file names for each figure created by a script in order of creation,
+# None is used for figures that are not in the paper
+figures = {
+    'batch_blasi.py': ['batch-blasi.pdf'],
+    'batch_blasi_temps.py': ['batch-blasi-temps.pdf'],
+    'biomass_biot_pyro.py': ['biot-pyro-gases.pdf', 'biot-pyro-diams.pdf'],
+    'biomass_hconv.py': ['biomass_hconv.pdf'],
+    'biomass_heatup.py': ['biomass-heatup.pdf'],
+    'gas_h2_n2.py': ['gas-mu-h2n2-mix.pdf'],
+    'gas_mu_h2n2_validate.py': ['gas-mu-h2n2-validate.pdf'],
+    'gas_mu_h2o2_validate.py': ['gas-mu-h2o2-validate.pdf'],
+    'gas_props.py': ['gas-properties.pdf'],
+    'gas_rho_visc.py': ['gas-rho-h2n2.pdf', 'gas-rho-n2-contour.pdf', 'gas-mu-h2n2.pdf'],
+    'gas_us_umf.py': [None, None, 'umf-usumf-gases.pdf', 'us-usumf-gases.pdf'],
+    'gas_ut_us.py': ['gas-ut-us.pdf'],
+    'mix_props.py': ['mix-properties.pdf']
+}
+
+# data files read by the scripts which are part of the inputs of every script
+data_files = ['blasi.cti']
+
+# hashes of the inputs of each script from the last build
+manifest_path = os.path.join(code_dir, '.cache', 'figures.json')
+
+
+def _init_worker(inner_workers):
+    """
+    Use the Agg backend in each worker process so no windows are opened and
+    limit the process pools started by the scripts, such as the batch reactor
+    sweep, to `inner_workers` processes.
+    """
+    os.environ['MPLBACKEND'] = 'Agg'
+    os.environ['PYRO_MAX_WORKERS'] = str(inner_workers)
+    os.chdir(code_dir)
+    if code_dir not in sys.path:
+        sys.path.insert(0, code_dir)
+
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+
+
+def _run_script(script, names, outdir):
+    """
+    Import a script and call its `main` function, save its figures, and
+    return the saved file names, the local files the script depends on, and
+    the run time.
+    """
+    import matplotlib.pyplot as plt
+
+    ti = time.perf_counter()
+    plt.close('all')
+
+    # unload local modules imported by a previous script in this worker so
+    # the modules imported by this script can be recorded
+    for name, m in list(sys.modules.items()):
+        if _is_local(m):
+            del sys.modules[name]
+
+    # the scripts call plt.show() at the end
+    show = plt.show
+    plt.show = lambda *args, **kwargs: None
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            module = importlib.import_module(os.path.splitext(script)[0])
+            module.main()
+
+        saved = []
+        for num, name in zip(plt.get_fignums(), names):
+            if name is None:
+                continue
+            # no creation date so unchanged figures give identical files
+            plt.figure(num).savefig(os.path.join(outdir, name), metadata={'CreationDate': None})
+            saved.append(name)
+    finally:
+        plt.show = show
+        plt.close('all')
+
+    # local modules imported by the script such as params.py and funcs/*.py
+    deps = sorted({
+        os.path.relpath(m.__file__, code_dir)
+        for m in list(sys.modules.values())
+        if _is_local(m)
+    })
+
+    return saved, deps, time.perf_counter() - ti
+
+
+def _is_local(module):
+    """
+    True for modules in this folder except for this build script.
+    """
+    path = getattr(module, '__file__', None)
+    if not path or os.path.abspath(path) == os.path.abspath(__file__):
+        return False
+    return os.path.abspath(path).startswith(code_dir + os.sep)
+
+
+def _safe_run(script, names, outdir):
+    """
+    Run a script in a worker and return the error message instead of raising
+    so one failed script does not stop the other builds.
+    """
+    try:
+        return _run_script(script, names, outdir) + (None,)
+    except Exception:
+        return [], [], 0.0, traceback.format_exc()
+
+
+def _hash_inputs(script, deps):
+    """
+    Hash of the script, the local modules it imports, the data files, and the
+    figure names of the script.
+    """
+    h = hashlib.sha256()
+    h.update(json.dumps(figures.get(script)).encode())
+    for path in sorted(set([script] + deps + data_files)):
+        h.update(path.encode())
+        full = os.path.join(code_dir, path)
+        if os.path.exists(full):
+            with open(full, 'rb') as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+
+def _load_manifest():
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(manifest):
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def build(scripts=None, outdir='../tex/figures', force=False, max_workers=None):
+    """
+    Build the figures of each script that is out of date.
+
+    Parameters
+    ----------
+    scripts : list of str, optional
+        Script file names such as ['gas_props.py']. Default is all the scripts
+        in `figures`.
+    outdir : str, optional
+        Folder for the PDF files relative to this folder. Default is
+        '../tex/figures'.
+    force : bool, optional
+        Build the figures even if the inputs have not changed. Default is
+        False.
+    max_workers : int, optional
+        Number of worker processes. Default is the number of CPUs.
+
+    Returns
+    -------
+    results : dict
+        Status of each script which is 'built', 'skipped', or the error
+        message of a failed script.
+    """
+    scripts = list(scripts or figures)
+    outdir = os.path.join(code_dir, outdir)
+    manifest = _load_manifest()
+
+    todo = []
+    results = {}
+    for script in scripts:
+        entry = manifest.get(script)
+        outputs = [os.path.join(outdir, n) for n in figures[script] if n]
+        uptodate = (
+            entry is not None
+            and entry['hash'] == _hash_inputs(script, entry['deps'])
+            and all(os.path.exists(p) for p in outputs)
+        )
+        if uptodate and not force:
+            results[script] = 'skipped'
+        else:
+            todo.append(script)
+
+    # longest scripts from the last build are started first
+    todo.sort(key=lambda s: manifest.get(s, {}).get('time', float('inf')), reverse=True)
+
+    if todo:
+        cpus = os.cpu_count() or 1
+        workers = min(max_workers or cpus, len(todo))
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(max(1, cpus // workers),)
+        ) as pool:
+            futures = {pool.submit(_safe_run, s, figures[s], outdir): s for s in todo}
+
+            for future in concurrent.futures.as_completed(futures):
+                script = futures[future]
+                saved, deps, elapsed, error = future.result()
+                if error:
+                    results[script] = error
+                    manifest.pop(script, None)
+                    continue
+                results[script] = 'built'
+                manifest[script] = {
+                    'hash': _hash_inputs(script, deps),
+                    'deps': deps,
+                    'figures': saved,
+                    'time': round(elapsed, 3)
+                }
+
+    _save_manifest(manifest)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the paper figures.')
+    parser.add_argument('scripts', nargs='*', help='scripts to build, default is all')
+    parser.add_argument('-f', '--force', action='store_true', help='build even if up to date')
+    parser.add_argument('-j', '--jobs', type=int, help='number of worker processes')
+    parser.add_argument('-l', '--list', action='store_true', help='list the figures of each script')
+    args = parser.parse_args()
+
+    if args.list:
+        for script, names in figures.items():
+            print(f'{script:26} {", ".join(n for n in names if n)}')
+        return
+
+    unknown = [s for s in args.scripts if s not in figures]
+    if unknown:
+        parser.error(f'no figures for {", ".join(unknown)}')
+
+    ti = time.perf_counter()
+    results = build(args.scripts, force=args.force, max_workers=args.jobs)
+    tf = time.perf_counter()
+
+    failed = 0
+    for script, status in sorted(results.items()):
+        if status in ('built', 'skipped'):
+            print(f'{status:8} {script}')
+        else:
+            failed += 1
+            print(f'failed   {script}\n{status}')
+
+    print(f'\n{len(results)} scripts in {tf - ti:.1f} s')
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
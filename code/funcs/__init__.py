@@ -1,10 +1,41 @@
 # flake8: noqa
 
-from funcs.biot import biot
+import importlib
 
+# functions with the same name as their module are imported here so the name
+# refers to the function and not to the module, these modules only use numpy
+from funcs.biot import biot
 from funcs.mu_brokaw import mu_brokaw
 from funcs.mu_davidson import mu_davidson
 from funcs.mu_wilke import mu_wilke
-
 from funcs.pyro1 import pyro1
 from funcs.pyro2 import pyro2
+from funcs.regime import regime, regime_names
+
+# other names are imported from their modules when they are first used
+_lazy = {
+    'FeedstockPopulation': 'funcs.feedstock_population',
+    'mixture_properties': 'funcs.gas_mixture',
+    'GasPropertyTable': 'funcs.gas_property_table',
+    'MixtureModel': 'funcs.mixture_model',
+    'umf_correlations': 'funcs.umf'
+}
+
+__all__ = [
+    'biot', 'FeedstockPopulation',
+    'mu_brokaw', 'mu_davidson', 'mu_wilke',
+    'mixture_properties', 'GasPropertyTable', 'MixtureModel', 'umf_correlations',
+    'pyro1', 'pyro2', 'regime', 'regime_names'
+]
+
+
+def __getattr__(name):
+    if name not in _lazy:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(_lazy[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
@@ -0,0 +1,294 @@
+import json
+import os
+import types
+
+import numpy as np
+
+from funcs.result_cache import jsonable, params_inputs
+
+
+class ResultsArchive:
+    """
+    Folder of results stored as typed columns. Each column is a `.npy` file
+    whose leading axes are sweep dimensions such as temperature or H2 mass
+    fraction and whose trailing axes are the shape of one result such as a
+    time history. The values of each dimension, the description of each
+    column, and the parameters of the calculations are stored in `meta.json`.
+    Opening an archive only reads `meta.json` and columns are memory-mapped
+    when they are accessed, so a selection only reads the blocks of the file
+    that it needs.
+
+    Parameters
+    ----------
+    path : str
+        Folder of an existing archive. Use `ResultsArchive.create` for a new
+        archive.
+
+    Attributes
+    ----------
+    path : str
+        Folder of the archive.
+    dims : dict
+        Values of each sweep dimension as a 1-D array.
+    params : dict
+        Parameters of the calculations such as the values in `params.py`.
+    attrs : dict
+        Other metadata of the archive.
+
+    Raises
+    ------
+    ValueError
+        If there is no archive in `path`.
+
+    Example
+    -------
+    >>> ar = ResultsArchive.create('tar', {'temp': temps, 'y_h2': y_h2}, params=params)
+    ... ar.add_column('y', y, shape=(1000, 4), units='-')
+    ... ar = ResultsArchive('tar')
+    ... ar.sel('y', temp=793.15)[..., 2].shape
+    (11, 1000)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        meta = _read_json(os.path.join(path, 'meta.json'))
+        if meta is None:
+            raise ValueError(f'No archive in {path}')
+
+        self.dims = {name: np.asarray(v) for name, v in meta['dims'].items()}
+        self.params = meta['params']
+        self.attrs = meta['attrs']
+        self._columns = meta['columns']
+        self._mmaps = {}
+
+    @classmethod
+    def create(cls, path, dims, params=None, attrs=None):
+        """
+        Create an empty archive. An archive that exists in `path` is replaced.
+
+        Parameters
+        ----------
+        path : str
+            Folder of the archive.
+        dims : dict
+            Name and 1-D array of values of each sweep dimension in the order
+            of the leading axes of the columns.
+        params : module or dict, optional
+            Parameters of the calculations such as the `params` module.
+        attrs : dict, optional
+            Other metadata of the archive.
+
+        Returns
+        -------
+        archive : ResultsArchive
+            The new archive.
+        """
+        if isinstance(params, types.ModuleType):
+            params = params_inputs(params)
+
+        os.makedirs(path, exist_ok=True)
+        old = _read_json(os.path.join(path, 'meta.json'))
+        if old is not None:
+            for name in old['columns']:
+                _remove(os.path.join(path, f'{name}.npy'))
+
+        meta = {
+            'dims': {name: np.asarray(v).tolist() for name, v in dims.items()},
+            'columns': {},
+            'params': params or {},
+            'attrs': attrs or {}
+        }
+        _write_json(os.path.join(path, 'meta.json'), meta)
+        return cls(path)
+
+    def __contains__(self, name):
+        return name in self._columns
+
+    def __getitem__(self, name):
+        """
+        Column `name` as a read-only memory-mapped array.
+        """
+        if name not in self._mmaps:
+            if name not in self._columns:
+                raise KeyError(f'No column {name}, columns are {", ".join(self._columns)}')
+            self._mmaps[name] = np.load(self._file(name), mmap_mode='r')
+        return self._mmaps[name]
+
+    @property
+    def columns(self):
+        """
+        Description of each column with keys 'dims', 'shape', 'dtype', and
+        'units'.
+        """
+        return dict(self._columns)
+
+    def add_column(self, name, data=None, dims=None, shape=(), dtype=float, units=None):
+        """
+        Add a column to the archive and return it as a writable memory-mapped
+        array so large results can be written in parts.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column.
+        data : array_like, optional
+            Values of the column. Default is an uninitialized column.
+        dims : list of str, optional
+            Sweep dimensions of the leading axes. Default is all dimensions.
+        shape : tuple, optional
+            Shape of one result. Default is () for a scalar.
+        dtype : data-type, optional
+            Data type of the column. Default is float.
+        units : str, optional
+            Units of the values such as 'm/s'.
+
+        Returns
+        -------
+        column : numpy.memmap
+            Writable column with shape dims_shape + shape.
+        """
+        dims = list(self.dims) if dims is None else list(dims)
+        dtype = np.dtype(dtype)
+        full = tuple(len(self.dims[d]) for d in dims) + tuple(shape)
+
+        column = np.lib.format.open_memmap(self._file(name), mode='w+', dtype=dtype, shape=full)
+        if data is not None:
+            column[...] = data
+            column.flush()
+
+        self._mmaps.pop(name, None)
+        self._columns[name] = {
+            'dims': dims,
+            'shape': list(shape),
+            'dtype': dtype.str,
+            'units': units
+        }
+        self._save()
+        return column
+
+    def open_column(self, name):
+        """
+        Open an existing column as a writable memory-mapped array.
+        """
+        self._mmaps.pop(name, None)
+        return np.load(self._file(name), mmap_mode='r+')
+
+    def set_attrs(self, **attrs):
+        """
+        Update the metadata of the archive.
+        """
+        self.attrs.update(attrs)
+        self._save()
+
+    def index(self, dim, value):
+        """
+        Position of `value` in dimension `dim`. Values are matched with a
+        relative tolerance of 1e-9 so rounded floats such as temperatures
+        are found.
+
+        Raises
+        ------
+        KeyError
+            If the value is not in the dimension.
+        """
+        values = self.dims[dim]
+        if values.dtype.kind in 'fc':
+            match = np.flatnonzero(np.isclose(values, value, rtol=1e-9, atol=0))
+        else:
+            match = np.flatnonzero(values == value)
+        if len(match) == 0:
+            raise KeyError(f'{value} is not in dimension {dim}')
+        return int(match[0])
+
+    def sel(self, name, **coords):
+        """
+        Select part of a column by the values of its dimensions. A single
+        value removes the dimension and a list of values keeps it. Only the
+        selected blocks are read from the file.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column.
+        **coords
+            Value or list of values for each selected dimension such as
+            temp=793.15 or y_h2=[0, 0.5, 1].
+
+        Returns
+        -------
+        values : ndarray
+            Selected values.
+
+        Example
+        -------
+        >>> ar.sel('umf', temp=773.15, press=101325).shape
+        (21,)
+        """
+        dims = self._columns[name]['dims']
+        unknown = set(coords) - set(dims)
+        if unknown:
+            raise KeyError(f'Column {name} has no dimensions {", ".join(sorted(unknown))}')
+
+        # scalar selections are applied first as a view of the memory map
+        # then each list selection reads only the selected rows
+        index = []
+        takes = []
+        for dim in dims:
+            if dim not in coords:
+                index.append(slice(None))
+                continue
+            value = coords[dim]
+            if np.ndim(value) == 0:
+                index.append(self.index(dim, value))
+            else:
+                pos = np.array([self.index(dim, v) for v in value], dtype=np.intp)
+                index.append(slice(None))
+                takes.append((len(index) - 1 - sum(isinstance(i, int) for i in index), pos))
+
+        values = self[name][tuple(index)]
+        for axis, pos in takes:
+            if len(pos) > 0 and np.all(np.diff(pos) == 1):
+                sl = [slice(None)] * values.ndim
+                sl[axis] = slice(pos[0], pos[-1] + 1)
+                values = values[tuple(sl)]
+            else:
+                values = np.take(values, pos, axis=axis)
+        return np.array(values)
+
+    def _file(self, name):
+        return os.path.join(self.path, f'{name}.npy')
+
+    def _save(self):
+        meta = {
+            'dims': {name: v.tolist() for name, v in self.dims.items()},
+            'columns': self._columns,
+            'params': self.params,
+            'attrs': self.attrs
+        }
+        _write_json(os.path.join(self.path, 'meta.json'), meta)
+
+
+def _read_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path, data):
+    """
+    Write a JSON file atomically so an interrupted write never leaves a
+    partial file.
+    """
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(data, f, indent=2, default=jsonable)
+    os.replace(tmp, path)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
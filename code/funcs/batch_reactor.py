@@ -0,0 +1,314 @@
+import concurrent.futures
+import itertools
+import os
+
+import numpy as np
+
+from funcs import profiling
+from funcs.state_recorder import StateRecorder
+
+# kinetics mechanism loaded once in each worker process of `sweep`
+_gas = None
+
+
+@profiling.timed('run_batch')
+def run_batch(gas, temp, press, y0, time, multipliers=None, out=None):
+    """
+    Calculate mass fractions of each species in an isothermal batch reactor.
+    The reactor is a constant pressure reactor with the energy equation
+    disabled. Reaction multipliers are reset for every call so the same
+    `gas` object can be reused for many cases.
+
+    Parameters
+    ----------
+    gas : cantera.Solution
+        Kinetics mechanism such as the Di Blasi reactions in `blasi.cti`.
+    temp : float
+        Reactor temperature [K]
+    press : float
+        Reactor pressure [Pa]
+    y0 : dict
+        Initial mass fraction of each species [-]
+    time : array_like
+        Times at which the reactor state is stored [s]
+    multipliers : array_like, optional
+        Multiplier for each reaction [-]. Default is 1 for all reactions.
+    out : ndarray, optional
+        Array of shape (n_times, n_species) where the results are written.
+        Default is a new array.
+
+    Returns
+    -------
+    y : ndarray
+        Mass fractions of shape (n_times, n_species) [-]
+    """
+    r, sim = _reactor(gas, temp, press, y0, multipliers)
+
+    states = StateRecorder(time, gas.species_names, out)
+    states.run(sim, r)
+
+    return states.y
+
+
+@profiling.timed('run_adaptive')
+def run_adaptive(gas, temp, press, y0, t_end, multipliers=None, dy=0.01, peak='tar'):
+    """
+    Calculate mass fractions in an isothermal batch reactor using the error
+    controlled internal time steps of the integrator instead of a fixed time
+    vector. A step is stored only when a mass fraction has changed by more
+    than `dy` since the last stored step so most samples are placed where the
+    biomass is converted. The maximum of the `peak` species is located
+    between the two integrator steps where its rate of change becomes
+    negative by a cubic Hermite interpolation of the mass fraction and its
+    time derivative and is kept only if it is larger than the mass fraction
+    at every integrator step. The integrator steps until it reaches or
+    passes `t_end` and a step past `t_end` is discarded, the reactor is
+    created again from the state of the previous step and advanced exactly
+    to `t_end` so the final state is not interpolated.
+
+    Parameters
+    ----------
+    gas : cantera.Solution
+        Kinetics mechanism such as the Di Blasi reactions in `blasi.cti`.
+    temp : float
+        Reactor temperature [K]
+    press : float
+        Reactor pressure [Pa]
+    y0 : dict
+        Initial mass fraction of each species [-]
+    t_end : float
+        Final time [s]
+    multipliers : array_like, optional
+        Multiplier for each reaction [-]. Default is 1 for all reactions.
+    dy : float, optional
+        Change in mass fraction that triggers a stored sample [-]. Default is
+        0.01.
+    peak : str, optional
+        Species for which the maximum mass fraction is reported. Default is
+        'tar'.
+
+    Returns
+    -------
+    res : dict
+        Results with the following keys.
+        | t - Time of each stored sample [s]
+        | y - Mass fractions of shape (n_samples, n_species) [-]
+        | y_final - Mass fractions at `t_end` [-]
+        | y_max - Maximum mass fraction of the `peak` species [-]
+        | t_max - Time of the maximum mass fraction [s]
+
+    Example
+    -------
+    >>> gas = ct.Solution('blasi.cti')
+    ... res = run_adaptive(gas, 773.15, 101325, {'biomass': 1}, 25)
+    ... res['y_max'], res['t_max']
+    (0.5272, 1.4713)
+    """
+    r, sim = _reactor(gas, temp, press, y0, multipliers)
+    ipk = gas.species_index(peak)
+
+    t_prev = 0.0
+    y_prev = r.thermo.Y
+    dydt_prev = _dydt(r.thermo)
+
+    ts = [t_prev]
+    ys = [y_prev]
+    y_max = y_prev[ipk]
+    t_max = t_prev
+    t = t_prev
+
+    while t < t_end:
+        t = sim.step()
+
+        # the integrator can step past the final time so the last step is
+        # integrated again from the previous step to exactly the final time
+        if t > t_end:
+            r, sim = _reactor(gas, temp, press, y_prev, multipliers)
+            sim.advance(t_end - t_prev)
+            t = t_end
+
+        y = r.thermo.Y
+        dydt = _dydt(r.thermo)
+
+        if y[ipk] > y_max:
+            t_max, y_max = t, y[ipk]
+
+        # after the peak the rate of change of a decayed species can change
+        # sign from solver noise so only a peak above the maximum is kept
+        peak_found = False
+        if dydt_prev[ipk] > 0 >= dydt[ipk]:
+            tp, yp = _hermite_peak(t_prev, t, y_prev[ipk], y[ipk], dydt_prev[ipk], dydt[ipk])
+            if yp > y_max:
+                t_max, y_max = tp, yp
+                peak_found = True
+
+        if peak_found:
+            ts += [t_prev, t]
+            ys += [y_prev, y]
+        elif np.max(np.abs(y - ys[-1])) > dy:
+            ts.append(t)
+            ys.append(y)
+
+        t_prev, y_prev, dydt_prev = t, y, dydt
+
+    y_final = y_prev
+
+    # samples can be repeated when the peak brackets a stored step
+    t_samples, i = np.unique(np.append(ts, t_end), return_index=True)
+    res = {
+        't': t_samples,
+        'y': np.vstack(ys + [y_final])[i],
+        'y_final': y_final,
+        'y_max': y_max,
+        't_max': t_max
+    }
+    return res
+
+
+def _reactor(gas, temp, press, y0, multipliers):
+    """
+    Set the reaction multipliers and initial state of `gas` then create an
+    isothermal constant pressure reactor and its reactor network.
+    """
+    import cantera as ct
+
+    if multipliers is None:
+        multipliers = np.ones(gas.n_reactions)
+
+    for i, m in enumerate(multipliers):
+        gas.set_multiplier(m, i)
+
+    gas.TPY = temp, press, y0
+
+    r = ct.IdealGasConstPressureReactor(gas, energy='off')
+    sim = ct.ReactorNet([r])
+    return r, sim
+
+
+def _dydt(thermo):
+    """
+    Time derivative of the mass fractions [1/s] in a reactor where the energy
+    equation is disabled.
+    """
+    return thermo.net_production_rates * thermo.molecular_weights / thermo.density
+
+
+def _hermite_peak(t0, t1, y0, y1, d0, d1):
+    """
+    Time and value of the maximum of the cubic Hermite interpolant through
+    (t0, y0) and (t1, y1) with slopes d0 > 0 and d1 <= 0.
+    """
+    h = t1 - t0
+
+    # derivative of the interpolant is a quadratic a s² + b s + c where s is
+    # the normalized time in [0, 1]
+    a = 3 * (h * (d0 + d1) - 2 * (y1 - y0))
+    b = 2 * (3 * (y1 - y0) - h * (2 * d0 + d1))
+    c = h * d0
+
+    if abs(a) < 1e-14 * abs(b):
+        s = -c / b
+    else:
+        roots = np.roots([a, b, c])
+        roots = roots[np.isreal(roots)].real
+        s = roots[(roots >= 0) & (roots <= 1)].min()
+
+    h00 = 2 * s**3 - 3 * s**2 + 1
+    h10 = s**3 - 2 * s**2 + s
+    h01 = -2 * s**3 + 3 * s**2
+    h11 = s**3 - s**2
+    y = h00 * y0 + h10 * h * d0 + h01 * y1 + h11 * h * d1
+    return t0 + s * h, y
+
+
+def _init_worker(mech):
+    """
+    Parse the kinetics mechanism once for each worker process.
+    """
+    import cantera as ct
+
+    global _gas
+
+    # forked workers inherit the results already recorded by the parent
+    profiling.reset()
+    with profiling.stage('ct.Solution'):
+        _gas = ct.Solution(mech)
+
+
+def _run_case(case, y0, time):
+    """
+    Run a (temperature, pressure, multipliers) case in a worker process.
+    Profiling results of the worker are returned with the mass fractions.
+    """
+    temp, press, multipliers = case
+    y = run_batch(_gas, temp, press, y0, time, multipliers)
+    return y, profiling.collect()
+
+
+@profiling.timed('sweep')
+def sweep(cases, y0, time, mech='blasi.cti', max_workers=None):
+    """
+    Calculate batch reactor mass fractions for many cases in parallel. Each
+    case is a tuple of (temperature, pressure, multipliers) where multipliers
+    is a sequence with a value for each reaction or None to use the original
+    rates. Cases are spread across a pool of worker processes and each worker
+    parses the mechanism only once.
+
+    Parameters
+    ----------
+    cases : list of tuple
+        Reactor temperature [K], pressure [Pa], and reaction multipliers [-]
+        for each case.
+    y0 : dict
+        Initial mass fraction of each species [-]
+    time : array_like
+        Times at which the reactor state is stored [s]
+    mech : str, optional
+        Path to the kinetics mechanism file. Default is 'blasi.cti'.
+    max_workers : int, optional
+        Number of worker processes. Default is the value of the environment
+        variable PYRO_MAX_WORKERS otherwise the number of CPUs.
+
+    Returns
+    -------
+    y : ndarray
+        Mass fractions of shape (n_cases, n_times, n_species) [-] where
+        n_cases can be zero.
+
+    Example
+    -------
+    >>> time = np.linspace(0, 10, 1000)
+    ... cases = [(773.15, 101325, None), (773.15, 101325, [1, 1, 1, 0, 0])]
+    ... y = sweep(cases, {'biomass': 1}, time)
+    ... y.shape
+    (2, 1000, 4)
+    """
+    cases = list(cases)
+    time = np.asarray(time, dtype=float)
+
+    # no worker pool is started for an empty list of cases
+    if not cases:
+        import cantera as ct
+        return np.empty((0, len(time), ct.Solution(mech).n_species))
+
+    # PYRO_MAX_WORKERS is set by a parent process pool such as the figure
+    # build so the CPUs are not oversubscribed
+    workers = max_workers or int(os.environ.get('PYRO_MAX_WORKERS') or 0) or os.cpu_count() or 1
+    chunksize = max(1, len(cases) // (4 * workers))
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(mech,)
+    ) as pool:
+        results = pool.map(
+            _run_case, cases, itertools.repeat(y0), itertools.repeat(time),
+            chunksize=chunksize
+        )
+
+        y = None
+        for i, (yi, prof) in enumerate(results):
+            profiling.merge(prof)
+            if y is None:
+                y = np.empty((len(cases),) + yi.shape)
+            y[i] = yi
+
+    return y
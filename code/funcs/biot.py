@@ -4,16 +4,16 @@ def biot(h, r, k):
 
     Parameters
     ----------
-    h : float
+    h : float or array_like
         Convective heat transfer coefficient [W/m²K]
-    r : float
+    r : float or array_like
         Radius of the biomass particle [m]
-    k : float
+    k : float or array_like
         Thermal conductivity of the biomass particle [W/mK]
 
     Returns
     -------
-    Bi : float
+    Bi : float or ndarray
         Biot number [-]
     """
     Bi = (h * r) / k
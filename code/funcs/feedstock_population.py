@@ -0,0 +1,146 @@
+import numpy as np
+
+from funcs.regime import regime
+
+
+class FeedstockPopulation:
+    """
+    Population of biomass particles stored as NumPy arrays of diameter, mass
+    fraction, heat transfer coefficient, and rate constant for each particle.
+    The Biot and pyrolysis numbers of all the particles are calculated in one
+    pass by the `funcs.regime.regime` kernel. The pyrolysis number of each
+    particle is Py II when Bi < 1 and Py I otherwise.
+
+    Parameters
+    ----------
+    d : array_like
+        Diameter of each biomass particle [m]
+    h : float or array_like
+        Convective heat transfer coefficient [W/m²K]
+    kr : float or array_like
+        Rate constant [1/s]
+    cp : float
+        Heat capacity of the biomass particle [J/kgK]
+    k : float
+        Thermal conductivity of the biomass particle [W/mK]
+    rho : float
+        Density of the biomass particle [kg/m³]
+    mf : array_like, optional
+        Mass fraction of each particle [-]. Default is an equal mass fraction
+        for every particle.
+
+    Attributes
+    ----------
+    d, mf, h, kr : ndarray
+        Diameter [m], mass fraction [-], heat transfer coefficient [W/m²K],
+        and rate constant [1/s] of each particle with the same shape.
+
+    Example
+    -------
+    >>> d = FeedstockPopulation.sample(params.dp_feed, 1_000_000, seed=1)
+    ... pop = FeedstockPopulation(d, h=370, kr=1.39, cp=3093, k=0.12, rho=540)
+    ... bi, py = pop.biot_pyro()
+    ... bi.mean(), pop.average(py)
+    (0.5695, 0.8830)
+    """
+
+    def __init__(self, d, h, kr, cp, k, rho, mf=None):
+        d = np.asarray(d, dtype=float)
+        if mf is None:
+            mf = np.full(d.shape, 1 / d.size)
+
+        self.d, self.mf, self.h, self.kr = np.broadcast_arrays(d, mf, h, kr)
+        self.cp = cp
+        self.k = k
+        self.rho = rho
+
+    @classmethod
+    def from_distribution(cls, dist, h, kr, cp, k, rho):
+        """
+        Create a population with one particle for each bin of a particle size
+        distribution such as `params.dp_feed` where 'd' is the diameter [µm]
+        and 'mf' is the mass fraction [%] of the bin.
+        """
+        d, mf = _bins(dist)
+        return cls(d, h, kr, cp, k, rho, mf=mf)
+
+    @staticmethod
+    def sample(dist, n, seed=None):
+        """
+        Diameters [m] of `n` particles drawn from the bins of a particle size
+        distribution such as `params.dp_feed` with a probability equal to the
+        mass fraction of each bin.
+        """
+        d, mf = _bins(dist)
+        rng = np.random.default_rng(seed)
+        return rng.choice(d, size=n, p=mf)
+
+    def __len__(self):
+        return self.d.size
+
+    @property
+    def biot(self):
+        """
+        Biot number of each particle [-]
+        """
+        return self.biot_pyro()[0]
+
+    @property
+    def pyro(self):
+        """
+        Pyrolysis number of each particle [-] as Py II if Bi < 1 otherwise
+        Py I.
+        """
+        return self.biot_pyro()[1]
+
+    def biot_pyro(self):
+        """
+        Biot number and pyrolysis number of each particle [-]
+        """
+        bi, py, _ = self.regime()
+        return bi, py
+
+    def regime(self):
+        """
+        Biot number, pyrolysis number, and regime code of each particle. See
+        `funcs.regime.regime` for the regime codes.
+        """
+        return regime(self.h, self.d / 2, self.k, self.kr, self.rho, self.cp)
+
+    def average(self, x):
+        """
+        Mass weighted average of a value `x` of each particle.
+        """
+        return np.average(x, weights=self.mf)
+
+
+def _bins(dist):
+    """
+    Diameter [m] and normalized mass fraction [-] of each bin of a particle
+    size distribution given as a list of dicts with 'd' [µm] and 'mf' [%].
+    """
+    d = np.array([b['d'] for b in dist], dtype=float) / 1e6
+    mf = np.array([b['mf'] for b in dist], dtype=float)
+    return d, mf / mf.sum()
+
+
+if __name__ == '__main__':
+
+    import time as timer
+
+    from params import dp_feed, k_feed, rhop_feed, temp
+
+    cp = 103.1 + 3.867 * temp
+    kr = 1.39
+
+    pop = FeedstockPopulation.from_distribution(dp_feed, 370, kr, cp, k_feed, rhop_feed)
+    bi, py = pop.biot_pyro()
+    print(f'{"d [µm]":8} {"mf [-]":8} {"Bi":8} {"Py":8}')
+    for i in range(len(pop)):
+        print(f'{pop.d[i] * 1e6:<8.0f} {pop.mf[i]:<8.3f} {bi[i]:<8.3f} {py[i]:<8.3f}')
+
+    ti = timer.perf_counter()
+    d = FeedstockPopulation.sample(dp_feed, 1_000_000, seed=1)
+    bi, py = FeedstockPopulation(d, 370, kr, cp, k_feed, rhop_feed).biot_pyro()
+    tf = timer.perf_counter()
+    print(f'\n{len(d):,} particles in {tf - ti:.3f} s, mean Bi {bi.mean():.4f}')
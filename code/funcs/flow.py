@@ -0,0 +1,182 @@
+import numpy as np
+
+from funcs.gas_mixture import mixture_properties
+
+
+def lpm_to_slm(lpm, pgas, tgas):
+    """
+    Convert volumetric gas flow from liters per minute (LPM) to standard
+    liters per minute (SLM). This is the inverse of `chemics.slm_to_lpm`
+    where STP is defined as 273.15 K and 14.696 psi.
+
+    .. math:: 1\\, SLPM = 1\\, LPM \\times \\frac{273.15\\,K}{T_{gas}} \\times \\frac{P_{gas}}{14.696\\,psi}
+
+    Parameters
+    ----------
+    lpm : float or array_like
+        Volumetric gas flow in liters per minute [LPM]
+    pgas : float or array_like
+        Absolute gas pressure [kPa]
+    tgas : float or array_like
+        Gas temperature [K]
+
+    Returns
+    -------
+    slm : float or ndarray
+        Volumetric gas flow in standard liters per minute [SLM]
+
+    Example
+    -------
+    >>> lpm_to_slm(1108.74, 150, 773)
+    579.9953
+    """
+    pgas_psi = pgas * 0.1450377
+    slm = lpm * (273.15 / tgas) * (pgas_psi / 14.696)
+    return slm
+
+
+def slm_to_us(slm, di, press, temp):
+    """
+    Superficial gas velocity in a reactor of inner diameter `di` for an inlet
+    gas flow given in standard liters per minute.
+
+    Parameters
+    ----------
+    slm : float or array_like
+        Volumetric gas flow in standard liters per minute [SLM]
+    di : float
+        Inner diameter of the reactor [m]
+    press : float
+        Pressure of the gas [Pa]
+    temp : float
+        Temperature of the gas [K]
+
+    Returns
+    -------
+    us : float or ndarray
+        Superficial gas velocity [m/s]
+    """
+    import chemics as cm
+
+    slm = np.asarray(slm, dtype=float)
+    ac = np.pi * di**2 / 4
+    lpm = cm.slm_to_lpm(slm, press / 1000, temp)
+    us = lpm / 60_000 / ac
+    return us
+
+
+def fluidization_number(us, umf):
+    """
+    Fluidization number Us/Umf as the average of Us/Umf for each Umf
+    correlation. This is the average used for the Us/Umf of the fluidization
+    gases in `gas_us_umf.py` and differs from Us divided by the average Umf.
+
+    Parameters
+    ----------
+    us : float or array_like
+        Superficial gas velocity [m/s]
+    umf : ndarray
+        Structured array of Umf [m/s] from `funcs.umf.umf_correlations` which
+        is broadcast against `us`.
+
+    Returns
+    -------
+    us_umf : float or ndarray
+        Fluidization number Us/Umf [-]
+
+    Example
+    -------
+    >>> umf = umf_correlations(0.000453, 0.46, 3.6e-5, 0.94, 0.44, 2500)
+    ... fluidization_number(0.18, umf)
+    1.7357
+    """
+    names = [name for name in umf.dtype.names if name != 'avg']
+    us_umf = sum(us / umf[name] for name in names) / len(names)
+    return us_umf
+
+
+def slm_for_fluidization(species, frac, target, temp, press, di, dp, ep, phi, rhos,
+                         basis='mass', umf='avg'):
+    """
+    Inlet gas flow in standard liters per minute that gives a target
+    fluidization number Us/Umf for many gas compositions at once. Mixture
+    properties and Umf are calculated for all the compositions with
+    `funcs.gas_mixture.mixture_properties` then the superficial velocity
+    Us = target × Umf is converted to a flow rate. The superficial velocity
+    is linear in the flow rate so the solution is exact.
+
+    Parameters
+    ----------
+    species : list of str or MixtureModel
+        Molecular formula of each gas component or a mixture model.
+    frac : array_like
+        Mass or mole fractions [-] with shape (..., n_species).
+    target : float or array_like
+        Target fluidization number Us/Umf [-] which is broadcast against the
+        leading dimensions of `frac`.
+    temp : float
+        Temperature of the gas [K]
+    press : float
+        Pressure of the gas [Pa]
+    di : float
+        Inner diameter of the reactor [m]
+    dp : float
+        Diameter of bed particle [m]
+    ep : float
+        Void fraction of the bed [-]
+    phi : float
+        Sphericity of bed particle [-]
+    rhos : float
+        Density of bed particle [kg/m³]
+    basis : str, optional
+        Fractions are 'mass' or 'mole' fractions. Default is 'mass'.
+    umf : str, optional
+        Umf correlation which is one of 'ergun', 'grace', 'rich', 'wenyu', or
+        'avg' for the average Us/Umf of the correlations from
+        `fluidization_number`. Default is 'avg'.
+
+    Returns
+    -------
+    slm : ndarray
+        Inlet gas flow for each composition [SLM]
+
+    Example
+    -------
+    >>> slm_for_fluidization(['N2', 'H2'], [[1, 0], [0.5, 0.5], [0, 1]], 3,
+    ...                      773.15, 101325, 0.05232, 0.000453, 0.46, 0.94, 2500)
+    array([14.0304, 23.497 , 28.6106])
+    """
+    _, props = mixture_properties(species, frac, temp, press, dp, ep, phi, rhos, basis)
+
+    # flow that gives a superficial velocity of 1 m/s
+    slm_per_us = 1 / slm_to_us(1.0, di, press, temp)
+
+    # superficial velocity that gives Us/Umf = 1
+    if umf == 'avg':
+        us_one = 1 / fluidization_number(1.0, props['umf'])
+    else:
+        us_one = props['umf'][umf]
+
+    slm = np.asarray(target) * us_one * slm_per_us
+    return slm
+
+
+if __name__ == '__main__':
+
+    import time as timer
+
+    from params import di, dp_bed, ep, phi_bed, press, q_gas, rhop_bed, temp
+
+    species = ['N2', 'H2', 'H2O', 'CO', 'CO2', 'CH4']
+
+    # setpoint table for random recycled gas compositions
+    rng = np.random.default_rng(1)
+    y = rng.dirichlet(np.ones(len(species)), size=10_000)
+
+    ti = timer.perf_counter()
+    slm = slm_for_fluidization(species, y, 3, temp, press, di, dp_bed, ep, phi_bed, rhop_bed)
+    tf = timer.perf_counter()
+
+    print(f'us for {q_gas} SLM    {slm_to_us(q_gas, di, press, temp):.4f} m/s')
+    print(f'{len(y):,} setpoints in {(tf - ti) * 1e3:.1f} ms')
+    print(f'slm for Us/Umf = 3   {slm.min():.2f} - {slm.max():.2f} SLM')
@@ -0,0 +1,116 @@
+import numpy as np
+
+from funcs.mixture_model import MixtureModel
+from funcs.umf import umf_correlations, umf_dtype
+
+# fields of the structured array returned by `mixture_properties`
+mixture_dtype = np.dtype([
+    ('mw', float),
+    ('rho', float),
+    ('mu_herning', float),
+    ('mu_wilke', float),
+    ('mu_brokaw', float),
+    ('mu_davidson', float),
+    ('umf', umf_dtype)
+])
+
+
+def mixture_properties(model, frac, temp, press, dp, ep, phi, rhos, basis='mass'):
+    """
+    Calculate properties of many gas mixtures of the same species at once.
+    Each row of `frac` is a mixture given as mass or mole fractions of the
+    species in `model` which can be any subset of gases such as recycled
+    product gas. Component viscosities and molecular weight terms are taken
+    from the model so they are only calculated once for all the mixtures. The
+    minimum fluidization velocity is based on the Herning viscosity of each
+    mixture.
+
+    Parameters
+    ----------
+    model : MixtureModel or list of str
+        Mixture model or molecular formula of each gas component such as
+        ['N2', 'H2', 'CO'].
+    frac : array_like
+        Mass or mole fractions [-] with shape (..., n_species).
+    temp : float
+        Temperature of the gas [K]
+    press : float
+        Pressure of the gas [Pa]
+    dp : float
+        Diameter of bed particle [m]
+    ep : float
+        Void fraction of the bed [-]
+    phi : float
+        Sphericity of bed particle [-]
+    rhos : float
+        Density of bed particle [kg/m³]
+    basis : str, optional
+        Fractions are 'mass' or 'mole' fractions. Default is 'mass'.
+
+    Returns
+    -------
+    x : ndarray
+        Mole fractions [-] with shape (..., n_species).
+    props : ndarray
+        Structured array with shape (...) and fields 'mw' [g/mol], 'rho'
+        [kg/m³], 'mu_herning', 'mu_wilke', 'mu_brokaw', 'mu_davidson' [µP],
+        and 'umf' which has the fields of `funcs.umf.umf_dtype` [m/s].
+
+    Example
+    -------
+    >>> model = MixtureModel(['N2', 'H2'])
+    ... y = [[0.8, 0.2], [0.6, 0.4]]
+    ... x, props = mixture_properties(model, y, 773.15, 101325, 0.000453,
+    ...                               0.46, 0.94, 2500)
+    ... props['umf']['ergun']
+    array([0.1927, 0.2283])
+    """
+    if not isinstance(model, MixtureModel):
+        model = MixtureModel(model)
+
+    if basis == 'mass':
+        x = model.molefrac(frac)
+    elif basis == 'mole':
+        x = np.asarray(frac, dtype=float)
+    else:
+        raise ValueError("Basis must be 'mass' or 'mole'")
+
+    props = np.empty(x.shape[:-1], dtype=mixture_dtype)
+    props['mw'] = model.mw_mix(x)
+
+    # ideal gas density with the same gas constant as `chemics.rhog`
+    props['rho'] = press * props['mw'] / (1000 * 8.3145 * temp)
+
+    props['mu_herning'] = model.mu_herning(x, temp)
+    props['mu_wilke'] = model.mu_wilke(x, temp)
+    props['mu_brokaw'] = model.mu_brokaw(x, temp)
+    props['mu_davidson'] = model.mu_davidson(x, temp)
+
+    # convert viscosity from µP to kg/(m s)
+    mu = props['mu_herning'] / 1e7
+    props['umf'] = umf_correlations(dp, ep, mu, phi, props['rho'], rhos)
+
+    return x, props
+
+
+if __name__ == '__main__':
+
+    import time as timer
+
+    from params import dp_bed, ep, phi_bed, press, rhop_bed, temp
+
+    # recycled product gas with random compositions
+    species = ['N2', 'H2', 'H2O', 'CO', 'CO2', 'CH4']
+    rng = np.random.default_rng(1)
+    y = rng.dirichlet(np.ones(len(species)), size=10_000)
+
+    model = MixtureModel(species)
+
+    ti = timer.perf_counter()
+    x, props = mixture_properties(model, y, temp, press, dp_bed, ep, phi_bed, rhop_bed)
+    tf = timer.perf_counter()
+
+    print(f'{len(y):,} mixtures in {(tf - ti) * 1e3:.1f} ms')
+    for name in props.dtype.names[:-1]:
+        print(f'{name:12} {props[name].min():10.4f} {props[name].max():10.4f}')
+    print(f'{"umf ergun":12} {props["umf"]["ergun"].min():10.4f} {props["umf"]["ergun"].max():10.4f}')
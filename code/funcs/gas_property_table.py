@@ -0,0 +1,143 @@
+import numpy as np
+
+from funcs import profiling
+from funcs.uniform_grid import interp_grid, refine_grid
+
+
+class GasPropertyTable:
+    """
+    Tabulated viscosity and thermal conductivity of pure gases for a range of
+    temperatures. The Yaws correlations used by `chemics.mu_gas`,
+    `chemics.k_gas_inorganic`, and `chemics.k_gas_organic` are looked up once
+    per species and evaluated on a uniform temperature grid. The grid is
+    refined until linear interpolation between grid points is within the
+    relative tolerance `rtol` of the correlations. Properties at any
+    temperature in the range are then interpolated for all species at once.
+
+    Parameters
+    ----------
+    species : list of str
+        Molecular formula of each gas such as ['N2', 'H2'].
+    tmin : float
+        Minimum temperature of the table [K]
+    tmax : float
+        Maximum temperature of the table [K]
+    rtol : float, optional
+        Maximum relative error of the interpolated properties [-]. Default is
+        1e-6.
+
+    Attributes
+    ----------
+    species : tuple of str
+        Molecular formula of each gas.
+    mw : ndarray
+        Molecular weight of each gas [g/mol]
+    temps : ndarray
+        Temperatures of the table grid [K]
+    data : ndarray
+        Contiguous table of shape (2, n_temps, n_species) where the first
+        axis is viscosity [µP] and thermal conductivity [W/(m K)].
+
+    Raises
+    ------
+    ValueError
+        If the temperature range is outside the range of a correlation or if
+        `rtol` is not reached with the largest grid.
+
+    Example
+    -------
+    >>> table = GasPropertyTable(['H2', 'N2'], 753.15, 853.15)
+    ... table.mu([773.15, 800])
+    array([[179.7551, 363.8718],
+           [183.7196, 372.4695]])
+    """
+
+    def __init__(self, species, tmin, tmax, rtol=1e-6):
+        import chemics as cm
+
+        self.species = tuple(species)
+        self.tmin = float(tmin)
+        self.tmax = float(tmax)
+        self.rtol = rtol
+        self.mw = np.array([cm.mw(sp) for sp in self.species])
+
+        # coefficients (a, b, c, d) of each correlation as (2, 4, n_species)
+        with profiling.stage('chemics coefficients'):
+            coeffs = np.array([
+                [_coeffs(cm.mu_gas, sp, self.tmin, self.tmax) for sp in self.species],
+                [_coeffs(_k_gas, sp, self.tmin, self.tmax) for sp in self.species]
+            ]).transpose(0, 2, 1)
+
+        # double the number of intervals until the interpolated value at the
+        # middle of each interval agrees with the correlation
+        self.temps, data = refine_grid(lambda t: _poly(coeffs, t), self.tmin, self.tmax, rtol, axis=1)
+        self.data = np.ascontiguousarray(data)
+
+    def _interp(self, prop, temp):
+        """
+        Interpolate table `prop` at temperature `temp`. Returned array has shape
+        temp.shape + (n_species,).
+        """
+        return interp_grid(self.data[prop], temp, self.tmin, self.tmax)
+
+    def mu(self, temp):
+        """
+        Viscosity of each gas [µP] at temperature `temp` [K] as an array of
+        shape temp.shape + (n_species,).
+        """
+        return self._interp(0, temp)
+
+    def k(self, temp):
+        """
+        Thermal conductivity of each gas [W/(m K)] at temperature `temp` [K]
+        as an array of shape temp.shape + (n_species,).
+        """
+        return self._interp(1, temp)
+
+
+def _k_gas(formula, temp, full=False):
+    """
+    Thermal conductivity of a gas from the inorganic correlations otherwise
+    from the organic correlations.
+    """
+    import chemics as cm
+
+    try:
+        return cm.k_gas_inorganic(formula, temp, full=full)
+    except ValueError:
+        return cm.k_gas_organic(formula, temp, full=full)
+
+
+def _coeffs(func, formula, tmin, tmax):
+    """
+    Correlation coefficients (a, b, c, d) from the chemics function `func`
+    after checking that the range `tmin` to `tmax` is applicable.
+    """
+    _, _, t0, t1, a, b, c, d = func(formula, tmin, full=True)
+    if tmax > t1:
+        raise ValueError('Temperature out of range. Applicable values are '
+                         f'{t0} - {t1} K for {formula} gas.')
+    return a, b, c, d
+
+
+def _poly(coeffs, temps):
+    """
+    Evaluate cubic correlations with coefficients of shape (2, 4, n_species) at
+    each temperature. Returns array of shape (2, n_temps, n_species).
+    """
+    t = temps[:, None]
+    a, b, c, d = (coeffs[:, i, None, :] for i in range(4))
+    return a + t * (b + t * (c + t * d))
+
+
+if __name__ == '__main__':
+
+    from params import temp, temp_min, temp_max
+
+    gas = ['N2', 'H2', 'H2O', 'CO', 'CO2', 'CH4']
+    table = GasPropertyTable(gas, temp_min, temp_max)
+
+    print('grid points ', len(table.temps))
+    print('mw          ', table.mw)
+    print('mu          ', table.mu(temp))
+    print('k           ', table.k(temp))
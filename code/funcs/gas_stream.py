@@ -0,0 +1,286 @@
+import csv
+import itertools
+import queue
+import threading
+import time
+
+import numpy as np
+
+from funcs.gas_mixture import mixture_dtype, mixture_properties
+from funcs.mixture_model import MixtureModel
+
+
+def read_compositions(source, species, delimiter=','):
+    """
+    Read gas compositions one line at a time from a CSV file or stream such
+    as a gas analyzer log. The first line is a header and only the columns
+    named in `species` are used so other columns such as timestamps are
+    ignored. Blank lines are skipped. A line with a missing or malformed
+    value such as an empty field gives a row of NaN so one bad reading does
+    not stop the stream and rows stay aligned with the lines of the log.
+
+    Parameters
+    ----------
+    source : str or file
+        Path to the CSV file or an open text stream such as `sys.stdin`.
+    species : list of str
+        Molecular formula of each gas component which are column names in the
+        header such as ['N2', 'H2', 'CO'].
+    delimiter : str, optional
+        Column delimiter. Default is ','.
+
+    Yields
+    ------
+    row : list of float
+        Fraction of each species in the order of `species` or NaN for each
+        species when the line is malformed.
+    """
+    if isinstance(source, str):
+        with open(source, newline='') as f:
+            yield from read_compositions(f, species, delimiter)
+        return
+
+    reader = csv.reader(source, delimiter=delimiter)
+    header = [h.strip() for h in next(reader)]
+    cols = [header.index(sp) for sp in species]
+
+    bad = [float('nan')] * len(cols)
+
+    for line in reader:
+        if not line:
+            continue
+        try:
+            yield [float(line[i]) for i in cols]
+        except (IndexError, ValueError):
+            yield bad
+
+
+def stream_properties(rows, species, temp, press, dp, ep, phi, rhos,
+                      basis='mass', batch_size=4096, normalize=False, max_latency=None):
+    """
+    Evaluate mixture properties of a stream of gas compositions in batches.
+    Rows are taken from the iterable `rows` until `batch_size` rows are
+    collected then all the rows of the batch are evaluated at once with
+    `funcs.gas_mixture.mixture_properties`. Only one batch is held in memory
+    so the stream can be an endless analyzer feed or a log file that does
+    not fit in memory. For a live feed use `max_latency` so a partial batch
+    is evaluated when its first reading has waited that long.
+
+    A row is invalid when it has the wrong number of values, a value that is
+    not a finite number, a negative value, or fractions that do not sum to 1
+    (or to a positive number when `normalize` is True). Invalid rows do not
+    stop the stream, their results are NaN and they are flagged in `valid`.
+
+    Parameters
+    ----------
+    rows : iterable
+        Mass or mole fractions of each species for each reading such as the
+        rows from `read_compositions`.
+    species : list of str or MixtureModel
+        Molecular formula of each gas component or a mixture model.
+    temp : float
+        Temperature of the gas [K]
+    press : float
+        Pressure of the gas [Pa]
+    dp : float
+        Diameter of bed particle [m]
+    ep : float
+        Void fraction of the bed [-]
+    phi : float
+        Sphericity of bed particle [-]
+    rhos : float
+        Density of bed particle [kg/m³]
+    basis : str, optional
+        Fractions are 'mass' or 'mole' fractions. Default is 'mass'.
+    batch_size : int, optional
+        Maximum number of rows evaluated at once. Default is 4096.
+    normalize : bool, optional
+        Scale each row so the fractions sum to 1 which is useful for readings
+        given in percent or that do not sum exactly to 1. Default is False.
+    max_latency : float, optional
+        Maximum time [s] that a row waits for the rest of its batch. Rows are
+        read in a background thread when this is given. Default is None which
+        only evaluates full batches and the last partial batch.
+
+    Yields
+    ------
+    x : ndarray
+        Mole fractions [-] with shape (n_rows, n_species) for the batch.
+    props : ndarray
+        Structured array of mixture properties with shape (n_rows,). See
+        `funcs.gas_mixture.mixture_properties` for the fields.
+    valid : ndarray
+        Boolean array with shape (n_rows,) which is False for invalid rows.
+
+    Example
+    -------
+    >>> rows = read_compositions('analyzer.csv', ['N2', 'H2', 'CO', 'CO2'])
+    >>> for x, props, valid in stream_properties(rows, ['N2', 'H2', 'CO', 'CO2'],
+    ...                                          773.15, 101325, 0.000453, 0.46,
+    ...                                          0.94, 2500, normalize=True):
+    ...     print(props['umf']['ergun'][valid].mean())
+    """
+    model = species if isinstance(species, MixtureModel) else MixtureModel(species)
+    n_species = len(model.species)
+
+    if max_latency is None:
+        batches = _batches(rows, batch_size)
+    else:
+        batches = _timed_batches(rows, batch_size, max_latency)
+
+    # close the batches when the caller stops early so a reader thread stops
+    try:
+        for batch in batches:
+            frac = _fractions(batch, n_species)
+
+            with np.errstate(invalid='ignore'):
+                valid = np.all(np.isfinite(frac) & (frac >= 0), axis=1)
+                total = frac.sum(axis=1)
+                if normalize:
+                    valid &= total > 0
+                    frac[valid] /= total[valid, None]
+                else:
+                    valid &= np.isclose(total, 1.0)
+
+            x = np.full(frac.shape, np.nan)
+            props = np.full(len(frac), np.nan, dtype=mixture_dtype)
+            if np.any(valid):
+                x[valid], props[valid] = mixture_properties(
+                    model, frac[valid], temp, press, dp, ep, phi, rhos, basis)
+
+            yield x, props, valid
+    finally:
+        batches.close()
+
+
+def _fractions(batch, n_species):
+    """
+    Array of shape (n_rows, n_species) from a list of rows where rows that
+    can not be converted to `n_species` floats are NaN.
+    """
+    try:
+        frac = np.array(batch, dtype=float)
+        if frac.ndim == 2 and frac.shape[1] == n_species:
+            return frac
+    except (TypeError, ValueError):
+        pass
+
+    frac = np.full((len(batch), n_species), np.nan)
+    for i, row in enumerate(batch):
+        try:
+            frac[i] = row
+        except (TypeError, ValueError):
+            pass
+    return frac
+
+
+def _batches(rows, batch_size):
+    """
+    Lists of up to `batch_size` rows from the iterable `rows`.
+    """
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _timed_batches(rows, batch_size, max_latency):
+    """
+    Lists of up to `batch_size` rows where a batch is returned early when its
+    first row has waited `max_latency` seconds. Rows are read in a background
+    thread through a bounded queue so a slow feed never holds back a partial
+    batch. The thread stops when the generator is closed before the end of
+    the rows.
+    """
+    end = object()
+    q = queue.Queue(maxsize=batch_size)
+    stop = threading.Event()
+
+    def put(item):
+        # wait for room in the queue unless the consumer has stopped
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def read():
+        try:
+            for row in rows:
+                if not put(row):
+                    return
+        except Exception as e:
+            put(e)
+        put(end)
+
+    threading.Thread(target=read, daemon=True).start()
+
+    try:
+        done = False
+        while not done:
+            batch = []
+            deadline = None
+
+            while len(batch) < batch_size:
+                try:
+                    if deadline is None:
+                        row = q.get()
+                    else:
+                        row = q.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if row is end:
+                    done = True
+                    break
+                if isinstance(row, Exception):
+                    raise row
+                if deadline is None:
+                    deadline = time.monotonic() + max_latency
+                batch.append(row)
+
+            if batch:
+                yield batch
+    finally:
+        stop.set()
+
+
+if __name__ == '__main__':
+
+    import sys
+
+    from params import dp_bed, ep, phi_bed, press, rhop_bed, temp
+
+    species = ['N2', 'H2', 'H2O', 'CO', 'CO2', 'CH4']
+
+    # compositions from a CSV file or stdin otherwise random readings
+    if len(sys.argv) > 1:
+        source = sys.stdin if sys.argv[1] == '-' else sys.argv[1]
+        rows = read_compositions(source, species)
+    else:
+        rng = np.random.default_rng(1)
+        rows = (rng.dirichlet(np.ones(len(species))) for _ in range(200_000))
+
+    # readings from stdin are a live feed so partial batches are evaluated
+    latency = 1.0 if sys.argv[1:] == ['-'] else None
+
+    n = 0
+    n_bad = 0
+    umf_min = np.inf
+    umf_max = -np.inf
+
+    ti = time.perf_counter()
+    for x, props, valid in stream_properties(rows, species, temp, press, dp_bed, ep, phi_bed, rhop_bed,
+                                             normalize=True, max_latency=latency):
+        n += len(x)
+        n_bad += np.count_nonzero(~valid)
+        if np.any(valid):
+            umf_min = min(umf_min, props['umf']['ergun'][valid].min())
+            umf_max = max(umf_max, props['umf']['ergun'][valid].max())
+    tf = time.perf_counter()
+
+    print(f'{n:,} readings in {tf - ti:.2f} s, {n_bad:,} invalid')
+    print(f'umf ergun   {umf_min:.4f} - {umf_max:.4f} m/s')
@@ -0,0 +1,291 @@
+import math
+import time
+import tracemalloc
+
+import numpy as np
+
+from funcs.archive import ResultsArchive
+
+# growth factor of the chunk size while the memory of each point is measured
+_growth = 4
+
+
+def grid_sweep(func, axes, outputs, path, max_memory=256e6, dtype=float, params=None, resume=True,
+               callback=None):
+    """
+    Evaluate a function on every point of a parameter grid in chunks and
+    write the results to arrays on disk. The grid is the Cartesian product of
+    the `axes` and the results are stored as a `funcs.archive.ResultsArchive`
+    in the folder `path` where the axes are the dimensions and each output is
+    a memory-mapped column with shape grid_shape + output_shape. The first
+    chunk is one grid point and the memory used by `func` is measured with
+    `tracemalloc` while the chunk size grows geometrically up to the size
+    that keeps each chunk below `max_memory`. A measured chunk that exceeds
+    `max_memory` gives a smaller chunk size and is measured again. Chunks
+    are no longer measured once a chunk below the limit can not be doubled.
+    Progress is saved after every chunk so an interrupted sweep continues
+    from the last chunk when it is run again.
+
+    Parameters
+    ----------
+    func : callable
+        Function called as func(**chunk) where chunk contains a 1-D array for
+        each axis name with the axis value of each point in the chunk. Must
+        return a dict with an array of shape (n_points,) + output_shape for
+        each output name such as the vectorized property, Umf, and kinetics
+        functions.
+    axes : dict
+        Axis name and 1-D array of values for each axis of the grid.
+    outputs : dict
+        Output name and shape of the output for one grid point such as () for
+        a scalar or (n_times, n_species) for a batch reactor history.
+    path : str
+        Folder of the results archive.
+    max_memory : float, optional
+        Memory available to `func` for one chunk [bytes]. Default is 256 MB.
+    dtype : data-type, optional
+        Data type of the output arrays. Default is float.
+    params : module or dict, optional
+        Parameters stored with the results such as the `params` module.
+    resume : bool, optional
+        Continue a previous sweep with the same axes and outputs. Default is
+        True.
+    callback : callable, optional
+        Called after every chunk with a dict of the chunk number, first and
+        last point, number of points, time [s], throughput [points/s], peak
+        memory [bytes] of a measured chunk or None, and 'probe' which is True
+        for the measured chunks whose time includes the `tracemalloc`
+        overhead.
+
+    Returns
+    -------
+    out : ResultsArchive
+        Archive of the results where each output is a read-only
+        memory-mapped column.
+    stats : list of dict
+        Chunk statistics which are also passed to `callback`.
+
+    Raises
+    ------
+    ValueError
+        If one grid point uses more than `max_memory`.
+
+    Example
+    -------
+    >>> import tempfile
+    ... from funcs.kinetics import k_total
+    ... temps = np.linspace(753.15, 853.15, 100)
+    ... y_h2 = np.linspace(0, 1, 50)
+    ... def func(temp, y_h2):
+    ...     return {'kr': k_total(temp) * (1 + 0 * y_h2)}
+    ... out, stats = grid_sweep(func, {'temp': temps, 'y_h2': y_h2}, {'kr': ()}, tempfile.mkdtemp())
+    ... out['kr'].shape
+    (100, 50)
+    """
+    axes = {name: np.asarray(v) for name, v in axes.items()}
+    outputs = {name: tuple(shape) for name, shape in outputs.items()}
+    dtype = np.dtype(dtype)
+
+    shape = tuple(len(v) for v in axes.values())
+    n = math.prod(shape)
+
+    archive = _resumable(path, axes, outputs, dtype) if resume else None
+    if archive is None:
+        archive = ResultsArchive.create(path, axes, params=params, attrs={'done': 0})
+        columns = {name: archive.add_column(name, shape=s, dtype=dtype) for name, s in outputs.items()}
+    else:
+        columns = {name: archive.open_column(name) for name in outputs}
+
+    start = archive.attrs['done']
+    flat = {name: c.reshape((n,) + outputs[name]) for name, c in columns.items()}
+
+    # bytes of the output values of one point, included in the memory of each
+    # point because `func` returns the results of the chunk
+    out_bytes = sum(math.prod(s) for s in outputs.values()) * dtype.itemsize
+
+    stats = []
+    size = 1
+    probe = True
+
+    while start < n:
+        stop = min(start + size, n)
+        index = np.unravel_index(np.arange(start, stop), shape)
+        chunk = {name: v[i] for (name, v), i in zip(axes.items(), index)}
+
+        if probe:
+            tracing = tracemalloc.is_tracing()
+            if not tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+
+        ti = time.perf_counter()
+        res = func(**chunk)
+        for name in outputs:
+            flat[name][start:stop] = res[name]
+        del res
+        elapsed = time.perf_counter() - ti
+
+        peak = None
+        was_probe = probe
+        if probe:
+            peak = tracemalloc.get_traced_memory()[1] - before + (stop - start) * out_bytes
+            if not tracing:
+                tracemalloc.stop()
+
+            per_point = peak / (stop - start)
+            if per_point > max_memory:
+                raise ValueError(f'One grid point uses {per_point:,.0f} bytes which is more '
+                                 f'than max_memory of {max_memory:,.0f} bytes')
+
+            # a chunk above the limit is made smaller and measured again, a
+            # chunk below the limit grows while it can at least double in
+            # size otherwise its size is kept for the rest of the sweep
+            points = stop - start
+            limit = max(1, int(max_memory // per_point))
+            if peak > max_memory:
+                size = limit
+            elif limit >= 2 * points:
+                size = min(points * _growth, limit)
+            else:
+                size = points
+                probe = False
+
+        for c in columns.values():
+            c.flush()
+        archive.set_attrs(done=stop)
+
+        info = {
+            'chunk': len(stats),
+            'start': start,
+            'stop': stop,
+            'points': stop - start,
+            'time': elapsed,
+            'throughput': (stop - start) / elapsed if elapsed > 0 else float('inf'),
+            'peak': peak,
+            'probe': was_probe
+        }
+        stats.append(info)
+        if callback:
+            callback(info)
+
+        start = stop
+
+    del flat, columns
+    out = open_sweep(path)
+    return out, stats
+
+
+def open_sweep(path):
+    """
+    Open the results archive of a finished sweep. Columns are read-only
+    memory-mapped arrays so slicing a column only reads the requested part
+    from disk.
+
+    Parameters
+    ----------
+    path : str
+        Folder of the sweep.
+
+    Returns
+    -------
+    out : ResultsArchive
+        Archive of the results with a column of shape grid_shape +
+        output_shape for each output.
+
+    Raises
+    ------
+    ValueError
+        If the sweep in `path` is not complete.
+    """
+    archive = ResultsArchive(path)
+
+    n = math.prod(len(v) for v in archive.dims.values())
+    done = archive.attrs.get('done', 0)
+    if done < n:
+        raise ValueError(f'Sweep in {path} is not complete, {done} of {n} points done')
+
+    return archive
+
+
+def _resumable(path, axes, outputs, dtype):
+    """
+    Archive of a previous sweep in `path` with the same axes and outputs or
+    None when there is no such sweep.
+    """
+    try:
+        archive = ResultsArchive(path)
+    except ValueError:
+        return None
+
+    same_axes = list(archive.dims) == list(axes) and all(
+        np.array_equal(archive.dims[name], v) for name, v in axes.items())
+    same_outputs = {
+        name: (tuple(c['shape']), c['dtype']) for name, c in archive.columns.items()
+    } == {name: (s, dtype.str) for name, s in outputs.items()}
+
+    if same_axes and same_outputs and 'done' in archive.attrs:
+        return archive
+    return None
+
+
+if __name__ == '__main__':
+
+    import tempfile
+
+    from funcs.linear_kinetics import batch_linear
+    from funcs.mixture_model import MixtureModel
+    from funcs.residence import tar_loss
+    import params
+    from params import di, dp_bed, ep, h_reactor, h_static, phi_bed, rhop_bed, y0
+
+    time_hist = np.linspace(0, 10, 100)
+
+    # grid of N2/H2 composition, temperature, pressure, and inlet gas flow
+    axes = {
+        'y_h2': np.linspace(0, 1, 21),
+        'temp': np.linspace(753.15, 853.15, 11),
+        'press': np.linspace(101_325, 202_650, 5),
+        'slm': np.linspace(5, 40, 36)
+    }
+
+    outputs = {'us_umf': (), 'tar_loss': (), 'y': (len(time_hist), 4)}
+
+    # viscosities of the gases are cached by the model for each temperature
+    model = MixtureModel(['N2', 'H2'])
+
+    def func(y_h2, temp, press, slm):
+        ys = np.column_stack((1 - y_h2, y_h2))
+        res = {'us_umf': np.empty(len(temp)), 'tar_loss': np.empty(len(temp))}
+
+        # properties depend on temperature and pressure so points are grouped
+        # by the (temp, press) pairs of the chunk
+        pairs, inv = np.unique(np.column_stack((temp, press)), axis=0, return_inverse=True)
+        for i, (t, p) in enumerate(pairs):
+            sel = inv.ravel() == i
+            tl = tar_loss(model, ys[sel], slm[sel], t, p, di, h_static, h_reactor,
+                          dp_bed, ep, phi_bed, rhop_bed)
+            res['us_umf'][sel] = tl['us_umf']
+            res['tar_loss'][sel] = tl['tar_loss']
+
+        res['y'] = batch_linear(temp, y0, time_hist)
+        return res
+
+    def report(info):
+        label = 'probe' if info['probe'] else ''
+        print(f'chunk {info["chunk"]:>3}  points {info["start"]:>7,} - {info["stop"]:<7,} '
+              f'{info["throughput"]:>10,.0f} points/s  {label}')
+
+    with tempfile.TemporaryDirectory() as path:
+        out, stats = grid_sweep(func, axes, outputs, path, max_memory=32e6, params=params,
+                                callback=report)
+        # throughput without the chunks measured with tracemalloc
+        full = [s for s in stats if not s['probe']] or stats
+        total = sum(s['points'] for s in full) / sum(s['time'] for s in full)
+        print(f'{len(stats)} chunks, {total:,.0f} points/s, y shape {out["y"].shape}')
+        print(f'tar loss {out["tar_loss"].min():.3f} - {out["tar_loss"].max():.3f}')
+
+        # tar history for all compositions and flows at 793.15 K and 1 atm
+        tar = out.sel('y', temp=793.15, press=101_325)[..., 2]
+        print(f'tar at 793.15 K {tar.shape}, max {tar.max():.4f}')
+        del out
@@ -0,0 +1,280 @@
+import functools
+import re
+
+import numpy as np
+
+from funcs.uniform_grid import interp_grid, refine_grid
+
+# universal gas constant [J/(mol K)], same value as used by Cantera
+rgas = 8.31446261815324
+
+# conversion of activation energy units to J/mol
+_act_energy = {
+    'J/mol': 1.0,
+    'kJ/mol': 1000.0,
+    'cal/mol': 4.184,
+    'kcal/mol': 4184.0
+}
+
+
+@functools.lru_cache()
+def read_mechanism(path='blasi.cti'):
+    """
+    Read species and first-order Arrhenius reactions from a Cantera CTI
+    mechanism file such as `blasi.cti`. Results are cached so the file is
+    only parsed once for each path.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path to the mechanism file. Default is 'blasi.cti'.
+
+    Returns
+    -------
+    mech : dict
+        Mechanism data with the following keys.
+        | species - Name of each species
+        | equations - Equation of each reaction
+        | reactant - Index of the reactant species for each reaction
+        | product - Index of the product species for each reaction
+        | a - Pre-exponential factor for each reaction [1/s]
+        | b - Temperature exponent for each reaction [-]
+        | e - Activation energy for each reaction [J/mol]
+
+    Raises
+    ------
+    ValueError
+        If a reaction is not of the form A => B.
+
+    Example
+    -------
+    >>> mech = read_mechanism('blasi.cti')
+    ... mech['species']
+    ('biomass', 'gas', 'tar', 'char')
+    """
+    with open(path) as f:
+        text = f.read()
+
+    # remove comments so commented out reactions are ignored
+    text = re.sub(r'#.*', '', text)
+
+    units = re.search(r'act_energy\s*=\s*"([^"]+)"', text)
+    efactor = _act_energy[units.group(1)] if units else 4184.0
+
+    phase = re.search(r'ideal_gas\(.*?species\s*=\s*"([^"]+)"', text, re.S)
+    species = tuple(phase.group(1).split())
+
+    equations = []
+    reactant = []
+    product = []
+    a = []
+    b = []
+    e = []
+
+    for m in re.finditer(r'reaction\(\s*"([^"]+)"\s*,\s*\[([^\]]+)\]', text):
+        eq = m.group(1)
+        sides = [s.split() for s in eq.split('=>')]
+        if len(sides) != 2 or len(sides[0]) != 1 or len(sides[1]) != 1:
+            raise ValueError(f'Reaction {eq} is not a first-order A => B reaction')
+
+        ai, bi, ei = (float(v) for v in m.group(2).split(','))
+        equations.append(eq)
+        reactant.append(species.index(sides[0][0]))
+        product.append(species.index(sides[1][0]))
+        a.append(ai)
+        b.append(bi)
+        e.append(ei * efactor)
+
+    mech = {
+        'species': species,
+        'equations': tuple(equations),
+        'reactant': _readonly(reactant, int),
+        'product': _readonly(product, int),
+        'a': _readonly(a, float),
+        'b': _readonly(b, float),
+        'e': _readonly(e, float)
+    }
+    return mech
+
+
+def rate_constants(temp, multipliers=None, mech='blasi.cti'):
+    """
+    Calculate the Arrhenius rate constant of each reaction for one or more
+    temperatures.
+
+    .. math:: k_i = m_i\\, A_i\\, T^{b_i} \\exp(-E_i / R T)
+
+    Parameters
+    ----------
+    temp : float or array_like
+        Temperature [K]
+    multipliers : array_like, optional
+        Multiplier for each reaction [-] with shape (..., n_reactions). Default
+        is 1 for all reactions.
+    mech : str, optional
+        Path to the mechanism file. Default is 'blasi.cti'.
+
+    Returns
+    -------
+    k : ndarray
+        Rate constants [1/s] with shape temp.shape + (n_reactions,) which is
+        broadcast against the shape of `multipliers` with the NumPy rules. The
+        leading dimensions of `temp` and `multipliers` must be compatible so
+        for every combination of n temperatures and m multiplier sets use
+        `temp[:, None]` which gives shape (n, m, n_reactions).
+
+    Example
+    -------
+    >>> rate_constants(773.15)
+    array([0.2114, 0.0929, 1.083 , 0.2163, 0.0505])
+    """
+    m = read_mechanism(mech)
+    temp = np.asarray(temp, dtype=float)[..., None]
+    k = m['a'] * np.exp(-m['e'] / (rgas * temp))
+    if np.any(m['b']):
+        k *= temp**m['b']
+    if multipliers is not None:
+        k = k * np.asarray(multipliers, dtype=float)
+    return k
+
+
+def k_total(temp, species='biomass', multipliers=None, mech='blasi.cti'):
+    """
+    Calculate the overall rate constant for the conversion of a species which
+    is the sum of the rate constants of the reactions that consume it. For
+    the Di Blasi reactions the overall rate constant of biomass is
+    k1 + k2 + k3.
+
+    Parameters
+    ----------
+    temp : float or array_like
+        Temperature [K]
+    species : str, optional
+        Name of the reactant species. Default is 'biomass'.
+    multipliers : array_like, optional
+        Multiplier for each reaction [-] with shape (..., n_reactions). Default
+        is 1 for all reactions.
+    mech : str, optional
+        Path to the mechanism file. Default is 'blasi.cti'.
+
+    Returns
+    -------
+    kr : ndarray
+        Overall rate constant [1/s] with shape of `temp` which is broadcast
+        against the leading dimensions of `multipliers`.
+
+    Example
+    -------
+    >>> k_total([773.15, 793.15])
+    array([1.3873, 2.4642])
+    """
+    m = read_mechanism(mech)
+    k = rate_constants(temp, multipliers, mech)
+    consumed = m['reactant'] == m['species'].index(species)
+    return k @ consumed.astype(float)
+
+
+class RateConstantTable:
+    """
+    Tabulated rate constants of a mechanism on a uniform temperature grid.
+    The grid is refined until linear interpolation between grid points is
+    within the relative tolerance `rtol` of the Arrhenius equation. Rate
+    constants at many temperatures are then interpolated without evaluating
+    an exponential for every temperature and reaction.
+
+    Parameters
+    ----------
+    tmin : float
+        Minimum temperature of the table [K]
+    tmax : float
+        Maximum temperature of the table [K]
+    mech : str, optional
+        Path to the mechanism file. Default is 'blasi.cti'.
+    rtol : float, optional
+        Maximum relative error of the interpolated rate constants [-]. Default
+        is 1e-6.
+
+    Attributes
+    ----------
+    temps : ndarray
+        Temperatures of the table grid [K]
+    data : ndarray
+        Rate constants of shape (n_temps, n_reactions) [1/s]
+
+    Raises
+    ------
+    ValueError
+        If `rtol` is not reached with the largest grid or if an interpolated
+        temperature is outside the range of the table.
+
+    Example
+    -------
+    >>> table = RateConstantTable(753.15, 853.15)
+    ... table.k_total(np.linspace(753.15, 853.15, 100_000)).max()
+    11.8152
+    """
+
+    def __init__(self, tmin, tmax, mech='blasi.cti', rtol=1e-6):
+        self.tmin = float(tmin)
+        self.tmax = float(tmax)
+        self.mech = mech
+        self.rtol = rtol
+
+        # double the number of intervals until the interpolated value at the
+        # middle of each interval agrees with the Arrhenius equation
+        self.temps, data = refine_grid(lambda t: rate_constants(t, mech=mech), self.tmin, self.tmax, rtol)
+        self.data = np.ascontiguousarray(data)
+
+        # overall rate constant of each reactant species on the grid
+        self._totals = {}
+
+    def k(self, temp):
+        """
+        Rate constant of each reaction [1/s] at temperature `temp` [K] as an
+        array of shape temp.shape + (n_reactions,).
+        """
+        return interp_grid(self.data, temp, self.tmin, self.tmax)
+
+    def k_total(self, temp, species='biomass'):
+        """
+        Overall rate constant [1/s] for the conversion of `species` at
+        temperature `temp` [K] as an array with the shape of `temp`.
+        """
+        if species not in self._totals:
+            m = read_mechanism(self.mech)
+            consumed = m['reactant'] == m['species'].index(species)
+            self._totals[species] = self.data @ consumed.astype(float)
+        return interp_grid(self._totals[species], temp, self.tmin, self.tmax)
+
+
+def _readonly(values, dtype):
+    """
+    Array that is flagged as read-only because it is shared by the cache.
+    """
+    a = np.array(values, dtype=dtype)
+    a.flags.writeable = False
+    return a
+
+
+if __name__ == '__main__':
+
+    import time as timer
+
+    from params import temp, temp_min, temp_max
+
+    temps = np.linspace(temp_min, temp_max, 100_000)
+
+    ti = timer.perf_counter()
+    kr = k_total(temps)
+    tf = timer.perf_counter()
+
+    table = RateConstantTable(temp_min, temp_max)
+    kr_table = table.k_total(temps)
+    tt = timer.perf_counter()
+
+    print('k_i         ', rate_constants(temp))
+    print('k_total     ', k_total(temp))
+    print('grid points ', len(table.temps))
+    print(f'arrhenius    {(tf - ti) * 1e3:.2f} ms for {len(temps):,} temperatures')
+    print(f'table        {(tt - tf) * 1e3:.2f} ms including the table setup')
+    print(f'max rel err  {np.max(np.abs(kr_table / kr - 1)):.2e}')
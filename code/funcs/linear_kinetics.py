@@ -0,0 +1,160 @@
+import numpy as np
+
+from funcs.kinetics import rate_constants, read_mechanism
+
+# largest condition number of the eigenvectors of a rate matrix that is
+# solved with the eigendecomposition
+_cond_max = 1e4
+
+
+def rate_matrix(k, mech='blasi.cti'):
+    """
+    Build the rate matrix K of a network of first-order reactions such that
+    the mass fractions of the species in an isothermal batch reactor are given
+    by dy/dt = K y.
+
+    Parameters
+    ----------
+    k : array_like
+        Rate constant of each reaction [1/s] with shape (..., n_reactions).
+    mech : str, optional
+        Path to the mechanism file. Default is 'blasi.cti'.
+
+    Returns
+    -------
+    kmat : ndarray
+        Rate matrix [1/s] with shape (..., n_species, n_species).
+    """
+    m = read_mechanism(mech)
+    k = np.asarray(k, dtype=float)
+    n = len(m['species'])
+
+    kmat = np.zeros(k.shape[:-1] + (n, n))
+    for i, (r, p) in enumerate(zip(m['reactant'], m['product'])):
+        kmat[..., p, r] += k[..., i]
+        kmat[..., r, r] -= k[..., i]
+
+    return kmat
+
+
+def solve_linear(kmat, y0, time):
+    """
+    Solve dy/dt = K y at each time using the eigendecomposition of the rate
+    matrix K such that y(t) = V exp(Λt) V⁻¹ y0. When two decay rates are equal
+    or nearly equal, such as k1 + k2 + k3 = k4 + k5 for the Di Blasi
+    reactions, the matrix of eigenvectors V is singular or ill-conditioned and
+    y(t) = exp(Kt) y0 is calculated with `scipy.linalg.expm` instead.
+
+    Parameters
+    ----------
+    kmat : array_like
+        Rate matrix [1/s] with shape (..., n_species, n_species).
+    y0 : array_like
+        Initial mass fractions [-] with shape (..., n_species).
+    time : array_like
+        Times at which the mass fractions are calculated [s]
+
+    Returns
+    -------
+    y : ndarray
+        Mass fractions [-] with shape (..., n_times, n_species).
+    """
+    kmat = np.asarray(kmat, dtype=float)
+    y0 = np.asarray(y0, dtype=float)
+    time = np.asarray(time, dtype=float)
+
+    w, v = np.linalg.eig(kmat)
+    y0 = np.broadcast_to(y0, w.shape)
+
+    # the error of the eigendecomposition grows with the condition number of
+    # V and is below 1e-12 for a condition number of 1e4
+    bad = ~(np.linalg.cond(v) < _cond_max)
+    v = np.where(bad[..., None, None], np.eye(w.shape[-1]), v)
+
+    c = np.linalg.solve(v, y0[..., None])[..., 0]
+    z = np.exp(w[..., None, :] * time[:, None]) * c[..., None, :]
+    y = np.einsum('...ij,...tj->...ti', v, z).real
+
+    if np.any(bad):
+        from scipy.linalg import expm
+        kt = kmat[bad][:, None] * time[:, None, None]
+        y[bad] = np.einsum('btij,bj->bti', expm(kt), y0[bad])
+
+    return y
+
+
+def batch_linear(temp, y0, time, multipliers=None, mech='blasi.cti'):
+    """
+    Calculate mass fractions of each species in an isothermal batch reactor
+    using the analytic solution of the first-order reaction network. This
+    gives the same results as `funcs.batch_reactor.run_batch` but all
+    temperatures and multiplier sets are evaluated in one vectorized call.
+
+    Parameters
+    ----------
+    temp : float or array_like
+        Reactor temperature [K]
+    y0 : dict or array_like
+        Initial mass fraction of each species [-]
+    time : array_like
+        Times at which the mass fractions are calculated [s]
+    multipliers : array_like, optional
+        Multiplier for each reaction [-] with shape (..., n_reactions). Default
+        is 1 for all reactions.
+    mech : str, optional
+        Path to the mechanism file. Default is 'blasi.cti'.
+
+    Returns
+    -------
+    y : ndarray
+        Mass fractions [-] with shape temp.shape + (n_times, n_species) which is
+        broadcast against the leading dimensions of `multipliers`. Use
+        `temp[:, None]` for every combination of n temperatures and m
+        multiplier sets. See `funcs.kinetics.rate_constants`.
+
+    Example
+    -------
+    >>> time = np.linspace(0, 25, num=1000)
+    ... y = batch_linear([773.15, 793.15], {'biomass': 1}, time)
+    ... y.shape
+    (2, 1000, 4)
+    """
+    species = read_mechanism(mech)['species']
+
+    if isinstance(y0, dict):
+        y0 = [y0.get(sp, 0) for sp in species]
+
+    k = rate_constants(temp, multipliers, mech)
+    kmat = rate_matrix(k, mech)
+    y = solve_linear(kmat, y0, time)
+    return y
+
+
+if __name__ == '__main__':
+
+    import time as timer
+
+    import cantera as ct
+
+    from funcs.batch_reactor import run_batch
+    from params import press, temp, y0
+
+    time = np.linspace(0, 25, num=1000)
+
+    # primary reactions, all reactions, and tar => gas reduced by 0.2
+    mults = np.array([
+        [1, 1, 1, 0, 0],
+        [1, 1, 1, 1, 1],
+        [1, 1, 1, 0.2, 1]
+    ])
+
+    ti = timer.perf_counter()
+    y = batch_linear(temp, y0, time, mults)
+    tf = timer.perf_counter()
+
+    # compare to the Cantera batch reactor
+    gas = ct.Solution('blasi.cti')
+    y_ct = np.array([run_batch(gas, temp, press, y0, time, m) for m in mults])
+
+    print(f'linear solution   {(tf - ti) * 1e6:.1f} µs for {len(mults)} cases')
+    print(f'max difference    {np.max(np.abs(y - y_ct)):.2e}')
@@ -0,0 +1,190 @@
+import functools
+
+import numpy as np
+
+from funcs import profiling
+from funcs.mu_brokaw import _brokaw_aij, _brokaw_mix
+from funcs.mu_davidson import _davidson_ea, _davidson_mix, _davidson_w
+from funcs.mu_wilke import _wilke_mix, _wilke_mw_terms, _wilke_phi
+
+
+class MixtureModel:
+    """
+    Viscosity of gas mixtures for a fixed list of species. The species-pair
+    terms of the Wilke, Brokaw, and Davidson models that only depend on
+    molecular weight are calculated once when the model is created. Terms
+    that depend on the component viscosities are calculated once per
+    temperature and kept in a least recently used (LRU) cache so repeated
+    evaluations only perform the reduction over the mole fractions.
+
+    Parameters
+    ----------
+    species : list of str
+        Molecular formula of each gas component such as ['N2', 'H2'].
+    mw : array_like, optional
+        Molecular weight of each gas component [g/mol]. Default values are
+        from `chemics.mw`.
+    maxsize : int, optional
+        Maximum number of temperatures kept in the cache. Default is 128.
+
+    Attributes
+    ----------
+    species : tuple of str
+        Molecular formula of each gas component.
+    mw : ndarray
+        Molecular weight of each gas component [g/mol]
+
+    Example
+    -------
+    >>> model = MixtureModel(['H2', 'N2'])
+    ... model.mu_wilke([[0.85, 0.15], [0.5, 0.5]], 773.15)
+    array([276.4728, 347.1322])
+    """
+
+    def __init__(self, species, mw=None, maxsize=128):
+        self.species = tuple(species)
+
+        if mw is None:
+            import chemics as cm
+            mw = [cm.mw(sp) for sp in self.species]
+        self.mw = _readonly(mw)
+
+        self._sqrt_mw = _readonly(np.sqrt(self.mw))
+        self._wilke_b, self._wilke_d = _wilke_mw_terms(self.mw)
+        self._brokaw_aij = _brokaw_aij(self.mw)
+        self._davidson_ea = _davidson_ea(self.mw)
+
+        self._terms = functools.lru_cache(maxsize=maxsize)(self._calc_terms)
+
+    def _calc_terms(self, temp):
+        """
+        Component viscosities [µP] and the viscosity dependent terms for each
+        mixture model at temperature `temp` [K].
+        """
+        import chemics as cm
+
+        with profiling.stage('chemics.mu_gas'):
+            mu = np.array([cm.mu_gas(sp, temp) for sp in self.species])
+        terms = {
+            'mu': _readonly(mu),
+            'sqrt_mu': _readonly(np.sqrt(mu)),
+            'phi': _readonly(_wilke_phi(mu, self._wilke_b, self._wilke_d)),
+            'w': _readonly(_davidson_w(mu, self._davidson_ea))
+        }
+        return terms
+
+    def _check(self, x, name='mole'):
+        x = np.asarray(x, dtype=float)
+        if x.shape[-1] != len(self.species):
+            raise ValueError(f'{name.capitalize()} fractions must have {len(self.species)} '
+                             'components as the last dimension')
+        if not np.allclose(x.sum(axis=-1), 1.0):
+            raise ValueError(f'Sum of {name} fractions must be 1.0')
+        return x
+
+    def cache_info(self):
+        """
+        Hits, misses, maximum size, and current size of the temperature cache.
+        """
+        return self._terms.cache_info()
+
+    def cache_clear(self):
+        """
+        Remove all temperatures from the cache.
+        """
+        self._terms.cache_clear()
+
+    def mu_gas(self, temp):
+        """
+        Viscosity of each gas component [µP] at temperature `temp` [K].
+        """
+        return self._terms(float(temp))['mu']
+
+    def molefrac(self, y):
+        """
+        Mole fractions [-] of gas mixtures with mass fractions `y` [-] of shape
+        (..., n_species).
+        """
+        y = self._check(y, 'mass')
+        n = y / self.mw
+        return n / n.sum(axis=-1, keepdims=True)
+
+    def mw_mix(self, x):
+        """
+        Molecular weight [g/mol] of gas mixtures with mole fractions `x` [-] of
+        shape (..., n_species).
+        """
+        x = self._check(x)
+        return x @ self.mw
+
+    def mu_herning(self, x, temp):
+        """
+        Viscosity of the gas mixture [µP] from the Herning and Zipperer model.
+        See `chemics.mu_herning` for details. Mole fractions `x` have shape
+        (..., n_species) and temperature `temp` [K] is a single value.
+        """
+        x = self._check(x)
+        mu = self._terms(float(temp))['mu']
+        xw = x * self._sqrt_mw
+        return (xw @ mu) / xw.sum(axis=-1)
+
+    def mu_brokaw(self, x, temp):
+        """
+        Viscosity of the gas mixture [µP] from the Brokaw model. See
+        `funcs.mu_brokaw` for details. Mole fractions `x` have shape
+        (..., n_species) and temperature `temp` [K] is a single value.
+        """
+        x = self._check(x)
+        terms = self._terms(float(temp))
+        return _brokaw_mix(terms['sqrt_mu'], self._brokaw_aij, x)
+
+    def mu_davidson(self, x, temp):
+        """
+        Viscosity of the gas mixture [µP] from the Davidson model. See
+        `funcs.mu_davidson` for details. Mole fractions `x` have shape
+        (..., n_species) and temperature `temp` [K] is a single value.
+        """
+        x = self._check(x)
+        terms = self._terms(float(temp))
+        return _davidson_mix(terms['w'], x)
+
+    def mu_wilke(self, x, temp):
+        """
+        Viscosity of the gas mixture [µP] from the Wilke model. See
+        `funcs.mu_wilke` for details. Mole fractions `x` have shape
+        (..., n_species) and temperature `temp` [K] is a single value.
+        """
+        x = self._check(x)
+        terms = self._terms(float(temp))
+        return _wilke_mix(terms['mu'], terms['phi'], x)
+
+
+def _readonly(a):
+    """
+    Float array that is flagged as read-only because it is shared between
+    calls.
+    """
+    a = np.array(a, dtype=float)
+    a.flags.writeable = False
+    return a
+
+
+if __name__ == '__main__':
+
+    from params import temp
+
+    # recycled product gas species
+    model = MixtureModel(['N2', 'H2', 'H2O', 'CO', 'CO2', 'CH4'])
+
+    # mole fractions of each mixture where each row is a mixture
+    x = [
+        [0.5, 0.1, 0.1, 0.1, 0.1, 0.1],
+        [0.1, 0.5, 0.1, 0.1, 0.1, 0.1],
+        [0.2, 0.3, 0.1, 0.2, 0.1, 0.1]
+    ]
+
+    print('herning  ', model.mu_herning(x, temp))
+    print('brokaw   ', model.mu_brokaw(x, temp))
+    print('davidson ', model.mu_davidson(x, temp))
+    print('wilke    ', model.mu_wilke(x, temp))
+    print(model.cache_info())
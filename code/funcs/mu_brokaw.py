@@ -19,16 +19,19 @@ def mu_brokaw(mu, mw, x):
     ----------
     mu : array_like
         Viscosity of each gas component. Units can be µP, cP, μPa·s or some
-        other appropriate units for dynamic gas viscosity.
+        other appropriate units for dynamic gas viscosity. Shape is
+        (..., n_species) where the last axis is the gas component.
     mw : array_like
-        Moleculare weight of each gas component [g/mol]
+        Moleculare weight of each gas component [g/mol]. Shape is
+        (..., n_species).
     x : array_like
-        Mole fraction of each gas component [-]
+        Mole fraction of each gas component [-]. Shape is (..., n_species).
 
     Returns
     -------
-    mu_mix : float
+    mu_mix : float or ndarray
         Viscosity of the gas mixture. Units are same as input parameter `mu`.
+        Shape is the broadcast of the leading dimensions of the inputs.
 
     Raises
     ------
@@ -49,27 +52,58 @@ def mu_brokaw(mu, mw, x):
     ... mu_brokaw([mu_h2, mu_n2], [mw_h2, mw_n2], [x_h2, x_n2])
     257.9015
 
+    Each row of `x` is a separate mixture when evaluating several mole
+    fractions in one call.
+
+    >>> xs = [[x_h2, x_n2], [0.5, 0.5]]
+    ... mu_brokaw([mu_h2, mu_n2], [mw_h2, mw_n2], xs)
+    array([257.9015, 334.1361])
+
     References
     ----------
     .. [1] Richard S. Brokaw. Viscosity of Gas Mixtures. NASA Lewis Research
        Center, NASA technical note NASA-TN-D-4496, 1968.
     """
-    if not np.isclose(np.asarray(x).sum(), 1.0):
+    mu = np.asarray(mu, dtype=float)
+    mw = np.asarray(mw, dtype=float)
+    x = np.asarray(x, dtype=float)
+
+    if not np.allclose(x.sum(axis=-1), 1.0):
         raise ValueError('Sum of mole fractions must be 1.0')
 
-    mij = (4 * np.outer(mw, mw) / (np.add.outer(mw, mw)**2))**0.25
+    aij = _brokaw_aij(mw)
+    mu_mix = _brokaw_mix(np.sqrt(mu), aij, x)
+    return mu_mix
+
 
-    mi_mj = np.divide.outer(mw, mw)  # Mi/Mj
+def _brokaw_aij(mw):
+    """
+    Brokaw A_ij matrix of shape (..., n, n). It only depends on the molecular
+    weights so it is shared by every temperature and composition.
+    """
+    mi = mw[..., :, None]
+    mj = mw[..., None, :]
+    mij = (4 * mi * mj / (mi + mj)**2)**0.25
+
+    mi_mj = mi / mj  # Mi/Mj
     num = mi_mj - mi_mj**0.45
     den = 2 * (1 + mi_mj) + (1 + mi_mj**0.45) / (1 + mij) * mij
-    aij = mij * (mi_mj.T**0.5) * (1 + num / den)
+    aij = mij * (np.swapaxes(mi_mj, -1, -2)**0.5) * (1 + num / den)
+    return aij
+
 
+def _brokaw_mix(sqrt_mu, aij, x):
+    """
+    Reduce the A_ij matrix over the mole fractions `x` to get the viscosity of
+    each mixture. Parameter `sqrt_mu` is the square root of the component
+    viscosities.
+    """
     sij = 1.0
-    sqrt_mu = np.sqrt(mu)
-    v = sij * aij * x / sqrt_mu
-    vsum = np.sum(v, axis=1) - np.diagonal(v)
+    xs = x / sqrt_mu
+    v = np.einsum('...ij,...j->...i', sij * aij, xs)
+    vsum = v - sij * np.diagonal(aij, axis1=-2, axis2=-1) * xs
 
-    mu_mix = np.sum((x * sqrt_mu) / (x / sqrt_mu + vsum))
+    mu_mix = np.sum((x * sqrt_mu) / (xs + vsum), axis=-1)
     return mu_mix
 
 
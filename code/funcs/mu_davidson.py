@@ -18,16 +18,19 @@ def mu_davidson(mu, mw, x):
     ----------
     mu : array_like
         Viscosity of each gas component. Units can be µP, cP, μPa·s or some
-        other appropriate units for dynamic gas viscosity.
+        other appropriate units for dynamic gas viscosity. Shape is
+        (..., n_species) where the last axis is the gas component.
     mw : array_like
-        Molecular weight of each gas component [g/mol]
+        Molecular weight of each gas component [g/mol]. Shape is
+        (..., n_species).
     x : array_like
-        Mole fraction of each gas component [-]
+        Mole fraction of each gas component [-]. Shape is (..., n_species).
 
     Returns
     -------
-    mu_mix : float
+    mu_mix : float or ndarray
         Viscosity of the gas mixture. Units are same as input parameter `mu`.
+        Shape is the broadcast of the leading dimensions of the inputs.
 
     Raises
     ------
@@ -48,18 +51,59 @@ def mu_davidson(mu, mw, x):
     ... mu_wilke([mu_h2, mu_n2], [mw_h2, mw_n2], [x_h2, x_n2])
     206.1662
 
+    Each row of `x` is a separate mixture when evaluating several mole
+    fractions in one call.
+
+    >>> xs = [[x_h2, x_n2], [0.5, 0.5]]
+    ... mu_davidson([mu_h2, mu_n2], [mw_h2, mw_n2], xs)
+    array([206.1662, 278.8611])
+
     References
     ----------
     .. [1] Thomas A. Davidson. A Simple and Accurate Method for Calculating
        Viscosity of Gaseous Mixtures. United States Department of the
        Interior, Report of Investigations 9456, 1993.
     """
-    if not np.isclose(np.asarray(x).sum(), 1.0):
+    mu = np.asarray(mu, dtype=float)
+    mw = np.asarray(mw, dtype=float)
+    x = np.asarray(x, dtype=float)
+
+    if not np.allclose(x.sum(axis=-1), 1.0):
         raise ValueError('Sum of mole fractions must be 1.0')
 
+    ea = _davidson_ea(mw)
+    w = _davidson_w(mu, ea)
+    mu_mix = _davidson_mix(w, x)
+    return mu_mix
+
+
+def _davidson_ea(mw):
+    """
+    Davidson E_ij^A matrix of shape (..., n, n). It only depends on the
+    molecular weights so it is shared by every temperature and composition.
+    """
     a = 0.375
-    e = 2 * np.outer(mw, mw)**0.5 / np.add.outer(mw, mw)
-    f = np.sum(np.outer(x, x) * e**a / np.outer(mu, mu)**0.5)
+    mi = mw[..., :, None]
+    mj = mw[..., None, :]
+    e = 2 * (mi * mj)**0.5 / (mi + mj)
+    return e**a
+
+
+def _davidson_w(mu, ea):
+    """
+    Weight matrix E_ij^A / √(μi μj) for the component viscosities `mu`.
+    """
+    sqrt_mu = np.sqrt(mu)
+    w = ea / (sqrt_mu[..., :, None] * sqrt_mu[..., None, :])
+    return w
+
+
+def _davidson_mix(w, x):
+    """
+    Reduce the weight matrix over the mole fractions `x` to get the viscosity
+    of each mixture.
+    """
+    f = np.einsum('...i,...ij,...j->...', x, w, x)
     mu_mix = 1 / f
     return mu_mix
 
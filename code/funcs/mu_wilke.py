@@ -16,16 +16,19 @@ def mu_wilke(mu, mw, x):
     ----------
     mu : array_like
         Viscosity of each gas component. Units can be µP, cP, μPa·s or some
-        other appropriate units for dynamic gas viscosity.
+        other appropriate units for dynamic gas viscosity. Shape is
+        (..., n_species) where the last axis is the gas component.
     mw : array_like
-        Molecular weight of each gas component [g/mol]
+        Molecular weight of each gas component [g/mol]. Shape is
+        (..., n_species).
     x : array_like
-        Mole fraction of each gas component [-]
+        Mole fraction of each gas component [-]. Shape is (..., n_species).
 
     Returns
     -------
-    mu_mix : float
+    mu_mix : float or ndarray
         Viscosity of the gas mixture. Units are same as input parameter `mu`.
+        Shape is the broadcast of the leading dimensions of the inputs.
 
     Raises
     ------
@@ -46,22 +49,62 @@ def mu_wilke(mu, mw, x):
     ... mu_wilke([mu_h2, mu_n2], [mw_h2, mw_n2], [x_h2, x_n2])
     276.4676
 
+    Each row of `x` is a separate mixture when evaluating several mole
+    fractions in one call.
+
+    >>> xs = [[x_h2, x_n2], [0.5, 0.5]]
+    ... mu_wilke([mu_h2, mu_n2], [mw_h2, mw_n2], xs)
+    array([276.4676, 347.1286])
+
     References
     ----------
     .. [1] C.R. Wilke. A Viscosity Equation for Gas Mixtures. The Journal of
        Chemical Physics, vol. 18, no. 4, pp. 517-519, 1950.
     """
-    if not np.isclose(np.asarray(x).sum(), 1.0):
+    mu = np.asarray(mu, dtype=float)
+    mw = np.asarray(mw, dtype=float)
+    x = np.asarray(x, dtype=float)
+
+    if not np.allclose(x.sum(axis=-1), 1.0):
         raise ValueError('Sum of mole fractions must be 1.0')
 
-    mi_mj = np.divide.outer(mw, mw)  # Mi / Mj
-    num = (1 + (np.divide.outer(mu, mu))**0.5 * (mi_mj.T)**0.25)**2
-    den = 4 / np.sqrt(2) * (1 + mi_mj)**0.5
-    phi = num / den
+    b, d = _wilke_mw_terms(mw)
+    phi = _wilke_phi(mu, b, d)
+    mu_mix = _wilke_mix(mu, phi, x)
+    return mu_mix
+
+
+def _wilke_mw_terms(mw):
+    """
+    Molecular weight terms (Mj/Mi)^1/4 and (4/√2)(1 + Mi/Mj)^1/2 of the Wilke
+    phi matrix. These only depend on the species so they are shared by every
+    temperature and composition.
+    """
+    mi_mj = mw[..., :, None] / mw[..., None, :]  # Mi / Mj
+    b = np.swapaxes(mi_mj, -1, -2)**0.25
+    d = 4 / np.sqrt(2) * (1 + mi_mj)**0.5
+    return b, d
 
-    v = x * phi
-    vsum = np.sum(v, axis=1) - np.diagonal(v)
-    mu_mix = np.sum(mu / (1 + vsum / x))
+
+def _wilke_phi(mu, b, d):
+    """
+    Wilke phi matrix of shape (..., n, n) from the component viscosities and
+    the molecular weight terms.
+    """
+    mui_muj = mu[..., :, None] / mu[..., None, :]
+    phi = (1 + mui_muj**0.5 * b)**2 / d
+    return phi
+
+
+def _wilke_mix(mu, phi, x):
+    """
+    Reduce the phi matrix over the mole fractions `x` to get the viscosity of
+    each mixture. Since phi_ii = 1 the denominator x_i + sum_j≠i x_j phi_ij
+    is the product of phi and x which is also valid when a mole fraction is
+    zero.
+    """
+    v = np.einsum('...ij,...j->...i', phi, x)
+    mu_mix = np.sum(x * mu / v, axis=-1)
     return mu_mix
 
 
@@ -0,0 +1,183 @@
+import numpy as np
+
+from funcs.kinetics import rate_constants, read_mechanism
+
+
+def cp_biomass(temp):
+    """
+    Heat capacity of dry biomass as a function of temperature.
+
+    .. math:: c_p = 103.1 + 3.867\\, T
+
+    Parameters
+    ----------
+    temp : float or array_like
+        Temperature of the biomass [K]
+
+    Returns
+    -------
+    cp : float or ndarray
+        Heat capacity of the biomass [J/(kg K)]
+
+    Example
+    -------
+    >>> cp_biomass(773.15)
+    3092.871
+    """
+    return 103.1 + 3.867 * temp
+
+
+def particle_pyrolysis(h, d, k, rho, temp_gas, time, temp0=300.0, y0=None, cp=cp_biomass,
+                       multipliers=None, mech='blasi.cti', dt=None):
+    """
+    Temperature and composition of heated biomass particles undergoing
+    pyrolysis. The particle temperature is a lumped heat balance where the
+    internal conduction resistance is included with the effective heat
+    transfer coefficient h / (1 + Bi/5) of a sphere. The species react with
+    the first-order reactions of the mechanism at the particle temperature.
+    Heat of reaction and particle shrinkage are neglected.
+
+    .. math::
+
+       \\frac{dT}{dt} = \\frac{6\\, h_{eff}}{\\rho\\, c_p(T)\\, d} (T_g - T),
+       \\quad h_{eff} = \\frac{h}{1 + h\\, d / (10\\, k)}
+
+       \\frac{dy}{dt} = K(T)\\, y
+
+    All cases given by broadcasting `h`, `d`, and `temp_gas` against each
+    other are integrated together as one state with the classical fourth
+    order Runge-Kutta method.
+
+    Parameters
+    ----------
+    h : float or array_like
+        Convective heat transfer coefficient [W/(m² K)]
+    d : float or array_like
+        Diameter of the biomass particle [m]
+    k : float
+        Thermal conductivity of the biomass particle [W/(m K)]
+    rho : float
+        Density of the biomass particle [kg/m³]
+    temp_gas : float or array_like
+        Temperature of the surrounding gas [K]
+    time : array_like
+        Times at which the particle state is stored [s]. The first time is the
+        initial state.
+    temp0 : float, optional
+        Initial particle temperature [K]. Default is 300 K.
+    y0 : dict, optional
+        Initial mass fraction of each species [-]. Default is only biomass.
+    cp : callable, optional
+        Heat capacity of the particle [J/(kg K)] as a function of temperature.
+        Default is `cp_biomass`.
+    multipliers : array_like, optional
+        Multiplier for each reaction [-]. Default is 1 for all reactions.
+    mech : str, optional
+        Path to the mechanism file. Default is 'blasi.cti'.
+    dt : float, optional
+        Maximum integration time step [s]. Default is a tenth of the shortest
+        heating or reaction time constant.
+
+    Returns
+    -------
+    res : dict
+        Results with the following keys where `shape` is the broadcast shape
+        of `h`, `d`, and `temp_gas`.
+        | t - Times [s]
+        | temp - Particle temperature with shape (n_times,) + shape [K]
+        | y - Mass fractions with shape (n_times,) + shape + (n_species,) [-]
+        | solid - Remaining solid mass fraction, biomass + char [-]
+
+    Example
+    -------
+    >>> res = particle_pyrolysis([[370], [2200]], [278e-6, 543e-6], 0.12, 540,
+    ...                          773.15, np.linspace(0, 5, 501))
+    ... res['temp'][20]
+    array([[645.8993, 543.8096],
+           [767.0453, 707.0134]])
+    """
+    m = read_mechanism(mech)
+    species = m['species']
+    time = np.asarray(time, dtype=float)
+
+    if y0 is None:
+        y0 = {species[0]: 1}
+
+    h, d, temp_gas = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (h, d, temp_gas)))
+    shape = h.shape
+
+    # heating factor 6 h_eff / (rho d) in dT/dt = a (Tg - T) / cp(T)
+    h_eff = h / (1 + h * d / (10 * k))
+    a = 6 * h_eff / (rho * d)
+
+    # stoichiometric matrix of the reactions with shape (n_reactions, n_species)
+    nu = np.zeros((len(m['reactant']), len(species)))
+    nu[np.arange(len(nu)), m['reactant']] -= 1
+    nu[np.arange(len(nu)), m['product']] += 1
+    reactant = m['reactant']
+
+    def rhs(temp, y):
+        kr = rate_constants(temp, multipliers, mech)
+        dy = (kr * y[..., reactant]) @ nu
+        dtemp = a * (temp_gas - temp) / cp(temp)
+        return dtemp, dy
+
+    if dt is None:
+        tau_heat = np.min(rho * d * cp(np.maximum(temp_gas, temp0)) / (6 * h_eff))
+        kmax = np.max(rate_constants(np.max(temp_gas), multipliers, mech))
+        dt = 0.1 * min(tau_heat, 1 / kmax)
+
+    temp = np.full(shape, temp0, dtype=float)
+    y = np.empty(shape + (len(species),))
+    y[:] = [y0.get(sp, 0) for sp in species]
+
+    temps = np.empty((len(time),) + shape)
+    ys = np.empty((len(time),) + y.shape)
+    temps[0] = temp
+    ys[0] = y
+
+    for i in range(1, len(time)):
+        span = time[i] - time[i - 1]
+        n = max(1, int(np.ceil(span / dt)))
+        step = span / n
+
+        for _ in range(n):
+            k1t, k1y = rhs(temp, y)
+            k2t, k2y = rhs(temp + 0.5 * step * k1t, y + 0.5 * step * k1y)
+            k3t, k3y = rhs(temp + 0.5 * step * k2t, y + 0.5 * step * k2y)
+            k4t, k4y = rhs(temp + step * k3t, y + step * k3y)
+            temp = temp + step / 6 * (k1t + 2 * k2t + 2 * k3t + k4t)
+            y = y + step / 6 * (k1y + 2 * k2y + 2 * k3y + k4y)
+
+        temps[i] = temp
+        ys[i] = y
+
+    solid = ys[..., species.index('biomass')] + ys[..., species.index('char')]
+
+    res = {
+        't': time,
+        'temp': temps,
+        'y': ys,
+        'solid': solid
+    }
+    return res
+
+
+if __name__ == '__main__':
+
+    import time as timer
+
+    from params import dp_feed, k_feed, rhop_feed, temp
+
+    # diameter of each feedstock bin [m] and a range of heat transfer
+    # coefficients from nitrogen to hydrogen [W/(m² K)]
+    d = np.array([x['d'] for x in dp_feed]) / 1e6
+    h = np.linspace(370, 2200, 50)[:, None]
+    time = np.linspace(0, 10, 1001)
+
+    ti = timer.perf_counter()
+    res = particle_pyrolysis(h, d, k_feed, rhop_feed, temp, time)
+    tf = timer.perf_counter()
+
+    print(f'{h.size * d.size} particles in {(tf - ti) * 1e3:.1f} ms')
+    print(f'final solid mass fraction {res["solid"][-1].min():.4f} - {res["solid"][-1].max():.4f}')
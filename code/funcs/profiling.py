@@ -0,0 +1,311 @@
+import atexit
+import contextlib
+import functools
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+# Profiling is enabled for a whole run with the environment variable
+# PYRO_PROFILE=1 and the summary is printed to stderr when the program exits.
+# PYRO_PROFILE_TRACE and PYRO_PROFILE_CPROFILE are optional paths for a Chrome
+# trace-event file and a cProfile stats file. Use the `profile` context
+# manager to enable profiling for part of a program. Worker processes return
+# their results with `collect` and the parent process adds them with `merge`.
+
+_enabled = False
+
+# stage name and [calls, total time, max time] [s]
+_stages = {}
+
+# counter name and count
+_counters = {}
+
+# trace events, None when no trace is recorded
+_events = None
+
+# start time of the profiled run [s]
+_t0 = time.perf_counter()
+
+# returned by `stage` when profiling is disabled
+_null = contextlib.nullcontext()
+
+
+class _Stage:
+    """
+    Timer for one call of a stage.
+    """
+    __slots__ = ('name', 'ti')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.ti = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        add(self.name, time.perf_counter() - self.ti, start=self.ti)
+
+
+def enabled():
+    """
+    True when profiling is enabled.
+    """
+    return _enabled
+
+
+def enable(trace=False):
+    """
+    Enable profiling and clear the previous results. Trace events are stored
+    for each stage call when `trace` is True.
+    """
+    global _enabled, _events, _t0
+    reset()
+    _events = [] if trace else None
+    _t0 = time.perf_counter()
+    _enabled = True
+
+
+def disable():
+    """
+    Disable profiling. Results are kept until the next `enable` or `reset`.
+    """
+    global _enabled
+    _enabled = False
+
+
+def reset():
+    """
+    Clear the stage times, counters, and trace events.
+    """
+    _stages.clear()
+    _counters.clear()
+    if _events is not None:
+        _events.clear()
+
+
+def stage(name):
+    """
+    Context manager that times a stage such as parsing a mechanism or drawing
+    a figure. Returns a shared no-op context manager when profiling is
+    disabled.
+
+    Example
+    -------
+    >>> with stage('ct.Solution'):
+    ...     gas = ct.Solution('blasi.cti')
+    """
+    if not _enabled:
+        return _null
+    return _Stage(name)
+
+
+def timed(name=None):
+    """
+    Decorator that times every call of a function as a stage. The stage name
+    is the qualified function name unless `name` is given.
+    """
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Stage(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+    return decorate
+
+
+def add(name, seconds, calls=1, start=None):
+    """
+    Add the time of one or more calls of a stage that were timed by the
+    caller such as the steps of a loop. A trace event is stored when the start
+    time `start` [s] from `time.perf_counter` is given.
+    """
+    if not _enabled:
+        return
+
+    s = _stages.get(name)
+    if s is None:
+        s = _stages[name] = [0, 0.0, 0.0]
+    s[0] += calls
+    s[1] += seconds
+    if calls:
+        s[2] = max(s[2], seconds / calls)
+
+    if _events is not None and start is not None:
+        _events.append({
+            'name': name,
+            'ph': 'X',
+            'ts': (start - _t0) * 1e6,
+            'dur': seconds * 1e6,
+            'pid': os.getpid(),
+            'tid': threading.get_ident()
+        })
+
+
+def count(name, n=1):
+    """
+    Add `n` to the counter `name`.
+    """
+    if _enabled:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def collect():
+    """
+    Stage times, counters, and trace events recorded since the last call
+    which are then cleared. Worker processes return this to the parent
+    process where it is added with `merge`. Returns None when profiling is
+    disabled.
+    """
+    if not _enabled:
+        return None
+    res = {
+        'stages': {name: list(s) for name, s in _stages.items()},
+        'counters': dict(_counters),
+        'events': list(_events or [])
+    }
+    reset()
+    return res
+
+
+def merge(res):
+    """
+    Add the results from `collect` in another process such as a worker of a
+    process pool to the results of this process.
+    """
+    if not _enabled or not res:
+        return
+
+    for name, (calls, total, tmax) in res['stages'].items():
+        s = _stages.get(name)
+        if s is None:
+            s = _stages[name] = [0, 0.0, 0.0]
+        s[0] += calls
+        s[1] += total
+        s[2] = max(s[2], tmax)
+
+    for name, n in res['counters'].items():
+        _counters[name] = _counters.get(name, 0) + n
+
+    if _events is not None:
+        _events.extend(res['events'])
+
+
+def summary(wall=None):
+    """
+    Table of the calls, total time, mean time, and maximum time of each stage
+    and the value of each counter. Stages are sorted by total time. Stages
+    merged from parallel worker processes can exceed 100 % of the wall time.
+    """
+    if wall is None:
+        wall = time.perf_counter() - _t0
+
+    lines = [
+        f'\n{" Profile ":-^79}',
+        f'{"stage":30} {"calls":>8} {"total [s]":>10} {"mean [ms]":>10} {"max [ms]":>10} {"wall [%]":>8}'
+    ]
+    for name, (calls, total, tmax) in sorted(_stages.items(), key=lambda s: -s[1][1]):
+        mean = total / calls if calls else 0.0
+        lines.append(
+            f'{name[:30]:30} {calls:>8,} {total:>10.4f} {mean * 1e3:>10.3f} '
+            f'{tmax * 1e3:>10.3f} {total / wall * 100:>8.1f}'
+        )
+
+    if _counters:
+        lines.append(f'\n{"counter":30} {"count":>8}')
+        for name, n in sorted(_counters.items()):
+            lines.append(f'{name[:30]:30} {n:>8,}')
+
+    lines.append(f'\nwall time {wall:.4f} s')
+    return '\n'.join(lines)
+
+
+def write_trace(path):
+    """
+    Write the trace events to a Chrome trace-event JSON file which can be
+    opened in chrome://tracing or Perfetto.
+    """
+    events = list(_events or [])
+    ts = (time.perf_counter() - _t0) * 1e6
+    for name, n in _counters.items():
+        events.append({'name': name, 'ph': 'C', 'ts': ts, 'pid': os.getpid(), 'args': {name: n}})
+
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+@contextlib.contextmanager
+def profile(report=True, trace=None, cprofile=None, file=None):
+    """
+    Enable profiling for the duration of the context.
+
+    Parameters
+    ----------
+    report : bool, optional
+        Print the stage summary at exit. Default is True.
+    trace : str, optional
+        Path of a Chrome trace-event JSON file. Default is no trace.
+    cprofile : str, optional
+        Path of a cProfile stats file for `pstats` or snakeviz. Default is no
+        cProfile.
+    file : file, optional
+        Stream for the summary. Default is stderr.
+
+    Example
+    -------
+    >>> with profile(trace='trace.json'):
+    ...     run_scenarios(gas, scenarios, time)
+    """
+    enable(trace=trace is not None)
+
+    prof = None
+    if cprofile:
+        import cProfile
+        prof = cProfile.Profile()
+        prof.enable()
+
+    try:
+        yield
+    finally:
+        if prof:
+            prof.disable()
+            prof.dump_stats(cprofile)
+        wall = time.perf_counter() - _t0
+        disable()
+        if trace:
+            write_trace(trace)
+        if report:
+            print(summary(wall), file=file or sys.stderr)
+
+
+def _profile_from_env():
+    """
+    Enable profiling for the whole program when PYRO_PROFILE is set and
+    report the results when the program exits.
+    """
+    trace = os.environ.get('PYRO_PROFILE_TRACE')
+    cprofile = os.environ.get('PYRO_PROFILE_CPROFILE')
+
+    ctx = profile(trace=trace, cprofile=cprofile)
+    ctx.__enter__()
+    pid = os.getpid()
+
+    def finish():
+        # forked worker processes inherit the handler and worker processes
+        # return their results to the parent with `collect`
+        if os.getpid() == pid and multiprocessing.parent_process() is None:
+            ctx.__exit__(None, None, None)
+
+    atexit.register(finish)
+
+
+if os.environ.get('PYRO_PROFILE', '') not in ('', '0'):
+    _profile_from_env()
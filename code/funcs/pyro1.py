@@ -4,20 +4,20 @@ def pyro1(k, kr, rho, cp, r):
 
     Parameters
     ----------
-    k : float
+    k : float or array_like
         Thermal conductivity of the biomass particle [W/mK]
-    kr : float
+    kr : float or array_like
         Rate constant [1/s]
-    rho : float
+    rho : float or array_like
         Density of the biomass particle [kg/m³]
-    cp : float
+    cp : float or array_like
         Heat capacity of the biomass particle [J/kgK]
-    r : float
+    r : float or array_like
         Radius of the biomass particle [m]
 
     Returns
     -------
-    py : float
+    py : float or ndarray
         Pyrolysis number Py I [-]
     """
     py = k / (kr * rho * cp * (r**2))
@@ -4,20 +4,20 @@ def pyro2(h, kr, rho, cp, r):
 
     Parameters
     ----------
-    h : float
+    h : float or array_like
         Convective heat transfer coefficient [W/m²K]
-    kr : float
+    kr : float or array_like
         Rate constant [1/s]
-    rho : float
+    rho : float or array_like
         Density of the biomass particle [kg/m³]
-    cp : float
+    cp : float or array_like
         Heat capacity of the biomass particle [J/kgK]
-    r : float
+    r : float or array_like
         Radius of the biomass particle [m]
 
     Returns
     -------
-    py : float
+    py : float or ndarray
         Pyrolysis number Py II [-]
     """
     py = h / (kr * rho * cp * r)
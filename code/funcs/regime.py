@@ -0,0 +1,110 @@
+import numpy as np
+
+# name of each regime where the index is the regime code returned by `regime`
+regime_names = (
+    'kinetics limited isothermal',
+    'kinetics limited non-isothermal',
+    'convection limited',
+    'conduction limited'
+)
+
+
+def regime(h, r, k, kr, rho, cp, out=None):
+    """
+    Calculate the Biot number, pyrolysis number, and pyrolysis regime of
+    biomass particles. The pyrolysis number is Py II when Bi < 1 and Py I
+    otherwise. Results are calculated in place in the output arrays so no
+    intermediate float arrays are created which allows large grids of gases,
+    temperatures, and particle sizes to be evaluated in one call.
+
+    Parameters
+    ----------
+    h : float or array_like
+        Convective heat transfer coefficient [W/m²K]
+    r : float or array_like
+        Radius of the biomass particle [m]
+    k : float or array_like
+        Thermal conductivity of the biomass particle [W/mK]
+    kr : float or array_like
+        Rate constant [1/s]
+    rho : float or array_like
+        Density of the biomass particle [kg/m³]
+    cp : float or array_like
+        Heat capacity of the biomass particle [J/kgK]
+    out : tuple of ndarray, optional
+        Arrays (bi, py, code) where the results are written. The float arrays
+        and the int8 code array must have the broadcast shape of the inputs.
+        Default is new arrays.
+
+    Returns
+    -------
+    bi : ndarray
+        Biot number [-]
+    py : ndarray
+        Pyrolysis number Py II if Bi < 1 otherwise Py I [-]
+    code : ndarray
+        Regime code where 0 is kinetics limited isothermal (Bi < 1, Py > 1),
+        1 is kinetics limited non-isothermal (Bi > 1, Py > 1), 2 is convection
+        limited (Bi < 1, Py < 1), and 3 is conduction limited (Bi > 1, Py < 1).
+        See `regime_names`.
+
+    Example
+    -------
+    >>> h = np.array([370, 2200])[:, None]
+    ... r = np.array([50, 200, 1000]) / 1e6
+    ... bi, py, code = regime(h, r, 0.12, 1.39, 540, 3093)
+    ... code
+    array([[0, 2, 3],
+           [0, 1, 3]], dtype=int8)
+    """
+    if out is None:
+        shape = np.broadcast_shapes(*(np.shape(x) for x in (h, r, k, kr, rho, cp)))
+        out = np.empty(shape), np.empty(shape), np.empty(shape, dtype=np.int8)
+    bi, py, code = out
+
+    # Bi = h r / k
+    np.multiply(h, r, out=bi)
+    np.divide(bi, k, out=bi)
+
+    # code is 1 where Bi ≥ 1 which selects Py I
+    nonisothermal = code.view(bool)
+    np.greater_equal(bi, 1.0, out=nonisothermal)
+
+    # 1 / Py II = kr ρ cp r / h for every particle
+    np.multiply(kr, rho, out=py)
+    np.multiply(py, cp, out=py)
+    np.multiply(py, r, out=py)
+    np.divide(py, h, out=py)
+
+    # 1 / Py I = (1 / Py II) h r / k where Bi ≥ 1
+    np.multiply(py, bi, out=py, where=nonisothermal)
+
+    np.reciprocal(py, out=py)
+
+    # add 2 where Py < 1 for the convection and conduction limited regimes
+    np.add(code, 2, out=code, where=py < 1.0)
+
+    return bi, py, code
+
+
+if __name__ == '__main__':
+
+    import time as timer
+
+    from params import k_feed, rhop_feed, temp
+
+    cp = 103.1 + 3.867 * temp
+    kr = 1.39
+
+    # grid of heat transfer coefficients, temperatures, and particle sizes
+    h = np.linspace(100, 3000, 50)[:, None, None]
+    kr_temps = (kr * np.linspace(0.5, 2, 40))[None, :, None]
+    r = np.geomspace(5e-6, 5e-3, 5000) / 2
+
+    ti = timer.perf_counter()
+    bi, py, code = regime(h, r, k_feed, kr_temps, rhop_feed, cp)
+    tf = timer.perf_counter()
+
+    print(f'{bi.size:,} points in {tf - ti:.3f} s')
+    for i, name in enumerate(regime_names):
+        print(f'{name:32} {np.mean(code == i):.3f}')
@@ -0,0 +1,182 @@
+import numpy as np
+
+from funcs.flow import fluidization_number, slm_to_us
+from funcs.gas_mixture import mixture_properties
+from funcs.kinetics import rate_constants, read_mechanism
+
+
+def residence_time(slm, di, h_bed, h_reactor, press, temp, ep):
+    """
+    Residence time of the vapors in the bed and in the freeboard of a
+    fluidized bed reactor. The gas flows as a plug through the voids of the
+    bed and through the empty freeboard above the bed.
+
+    .. math::
+
+       \\tau_{bed} = \\frac{\\varepsilon\\, H_{bed}}{U_s}, \\quad
+       \\tau_{free} = \\frac{H_{reactor} - H_{bed}}{U_s}
+
+    Parameters
+    ----------
+    slm : float or array_like
+        Volumetric gas flow in standard liters per minute [SLM]
+    di : float
+        Inner diameter of the reactor [m]
+    h_bed : float
+        Height of the bed [m]
+    h_reactor : float
+        Height of the reactor from the distributor to the outlet [m]
+    press : float
+        Pressure of the gas [Pa]
+    temp : float
+        Temperature of the gas [K]
+    ep : float
+        Void fraction of the bed [-]
+
+    Returns
+    -------
+    us : float or ndarray
+        Superficial gas velocity [m/s]
+    tau_bed : float or ndarray
+        Residence time in the bed [s]
+    tau_free : float or ndarray
+        Residence time in the freeboard [s]
+
+    Example
+    -------
+    >>> residence_time(14, 0.05232, 0.1016, 0.4318, 101325, 773.15, 0.46)
+    (0.3072, 0.1521, 1.0749)
+    """
+    us = slm_to_us(slm, di, press, temp)
+    tau_bed = ep * h_bed / us
+    tau_free = (h_reactor - h_bed) / us
+    return us, tau_bed, tau_free
+
+
+def tar_loss(species, frac, slm, temp, press, di, h_bed, h_reactor, dp, ep, phi, rhos,
+             basis='mass', multipliers=None, mech='blasi.cti'):
+    """
+    Estimate the loss of tar by secondary reactions in the vapor phase for
+    many operating points. The products of the primary reactions leave the
+    biomass particle then the tar reacts with the first-order tar reactions
+    of the mechanism during the residence time in the bed and freeboard from
+    `residence_time`. The gas composition gives the mixture Umf which is used
+    to report the fluidization number Us/Umf of each operating point.
+
+    Parameters
+    ----------
+    species : list of str or MixtureModel
+        Molecular formula of each gas component or a mixture model.
+    frac : array_like
+        Mass or mole fractions of the fluidization gas [-] with shape
+        (..., n_species).
+    slm : float or array_like
+        Volumetric gas flow in standard liters per minute [SLM] which is
+        broadcast against the leading dimensions of `frac`.
+    temp : float
+        Reactor temperature [K]
+    press : float
+        Reactor pressure [Pa]
+    di : float
+        Inner diameter of the reactor [m]
+    h_bed : float
+        Height of the bed [m]
+    h_reactor : float
+        Height of the reactor from the distributor to the outlet [m]
+    dp : float
+        Diameter of bed particle [m]
+    ep : float
+        Void fraction of the bed [-]
+    phi : float
+        Sphericity of bed particle [-]
+    rhos : float
+        Density of bed particle [kg/m³]
+    basis : str, optional
+        Fractions are 'mass' or 'mole' fractions. Default is 'mass'.
+    multipliers : array_like, optional
+        Multiplier for each reaction [-]. Default is 1 for all reactions.
+    mech : str, optional
+        Path to the mechanism file. Default is 'blasi.cti'.
+
+    Returns
+    -------
+    res : dict
+        Results for each operating point with the following keys.
+        | us - Superficial gas velocity [m/s]
+        | us_umf - Fluidization number Us/Umf [-]
+        | tau_bed - Vapor residence time in the bed [s]
+        | tau_free - Vapor residence time in the freeboard [s]
+        | y_primary - Product yields of the primary reactions [-] with shape (n_species,)
+        | y - Product yields at the reactor outlet [-] with shape (..., n_species)
+        | tar_loss - Fraction of the primary tar lost to secondary reactions [-]
+
+    Example
+    -------
+    >>> res = tar_loss(['N2', 'H2'], [[1, 0], [0, 1]], 14, 773.15, 101325,
+    ...                0.05232, 0.1016, 0.4318, 0.000453, 0.46, 0.94, 2500)
+    ... res['us_umf'], res['tar_loss']
+    (array([2.9935, 1.468 ]), array([0.2792, 0.2792]))
+    """
+    m = read_mechanism(mech)
+    sp_mech = m['species']
+    itar = sp_mech.index('tar')
+    ibio = sp_mech.index('biomass')
+
+    _, props = mixture_properties(species, frac, temp, press, dp, ep, phi, rhos, basis)
+
+    us, tau_bed, tau_free = residence_time(slm, di, h_bed, h_reactor, press, temp, ep)
+    us, tau_bed, tau_free = np.broadcast_arrays(us, tau_bed, tau_free, props['umf']['avg'])[:3]
+    us_umf = fluidization_number(us, props['umf'])
+
+    k = rate_constants(temp, multipliers, mech)
+    reactant = m['reactant']
+    product = m['product']
+
+    # primary yields from the branching ratios of the biomass reactions
+    primary = reactant == ibio
+    y_primary = np.zeros(len(sp_mech))
+    np.add.at(y_primary, product[primary], k[primary] / k[primary].sum())
+
+    # first-order decay of the tar along the vapor path where the tar that
+    # reacts is split between the products of the tar reactions
+    secondary = reactant == itar
+    k_tar = k[secondary].sum()
+    converted = 1 - np.exp(-k_tar * (tau_bed + tau_free))
+
+    y = np.broadcast_to(y_primary, us.shape + (len(sp_mech),)).copy()
+    y[..., itar] -= y_primary[itar] * converted
+    for j in np.flatnonzero(secondary):
+        y[..., product[j]] += y_primary[itar] * converted * k[j] / k_tar
+
+    res = {
+        'us': us,
+        'us_umf': us_umf,
+        'tau_bed': tau_bed,
+        'tau_free': tau_free,
+        'y_primary': y_primary,
+        'y': y,
+        'tar_loss': converted
+    }
+    return res
+
+
+if __name__ == '__main__':
+
+    import time as timer
+
+    from params import di, dp_bed, ep, h_reactor, h_static, phi_bed, press, rhop_bed, temp
+
+    # recycle gas flows for N2/H2 mixtures with 100 H2 mass fractions and
+    # 100 flow rates [SLM]
+    y_h2 = np.linspace(0, 1, 100)
+    ys = np.column_stack((1 - y_h2, y_h2))[:, None, :]
+    slm = np.linspace(5, 40, 100)
+
+    ti = timer.perf_counter()
+    res = tar_loss(['N2', 'H2'], ys, slm, temp, press, di, h_static, h_reactor,
+                   dp_bed, ep, phi_bed, rhop_bed)
+    tf = timer.perf_counter()
+
+    print(f'{res["us"].size:,} operating points in {(tf - ti) * 1e3:.1f} ms')
+    print(f'tar loss {res["tar_loss"].min():.3f} - {res["tar_loss"].max():.3f}')
+    print(f'primary tar yield {res["y_primary"][2]:.4f}')
@@ -0,0 +1,315 @@
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time as timer
+
+import numpy as np
+
+
+class ResultCache:
+    """
+    Content addressed cache of calculation results stored as compressed NumPy
+    `.npz` files. The key of each result is a hash of the stage name, the
+    source code of the function and of the local modules it uses, an optional
+    function version, the input values, and the contents of any input files
+    such as a kinetics mechanism so editing the code of a stage or one of the
+    `funcs` modules it calls gives a new key. Inputs must be JSON
+    serializable where NumPy arrays and scalars are converted to lists and
+    floats. When the total size of the cache exceeds `max_bytes` the least
+    recently used results are removed. The cache folder can be shared by
+    several processes such as the workers of `build_figures.py`.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Folder where results are stored. Default is '.cache'.
+    max_bytes : int, optional
+        Maximum total size of the stored results [bytes]. Default is 1 GB.
+
+    Example
+    -------
+    >>> cache = ResultCache()
+    ... res = cache.run('blasi-temps', calc_tar, {'temps': temps},
+    ...                 files=['blasi.cti'])
+    ... cache.entries()
+    [{'stage': 'blasi-temps', 'key': '5f1c...', 'size': 61723, ...}]
+    """
+
+    def __init__(self, directory='.cache', max_bytes=1_000_000_000):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, stage, key):
+        return os.path.join(self.directory, f'{stage}-{key}.npz')
+
+    def key(self, stage, inputs, files=(), version=1, func=None):
+        """
+        Hash of the stage name, input values, contents of the input files,
+        version of the function that calculates the results, and the source
+        code of `func` from `code_hash`.
+        """
+        h = hashlib.sha256()
+        h.update(json.dumps([stage, version, inputs], sort_keys=True, default=jsonable).encode())
+        if func is not None:
+            h.update(code_hash(func).encode())
+        for path in files:
+            with open(path, 'rb') as f:
+                h.update(f.read())
+        return h.hexdigest()[:32]
+
+    def get(self, stage, key):
+        """
+        Stored results as a dict of arrays or None if the results are not in
+        the cache.
+        """
+        path = self._path(stage, key)
+
+        # update access time which is used for least recently used eviction,
+        # the result can be removed by another process at any time
+        try:
+            os.utime(path)
+            with np.load(path) as data:
+                return {k: data[k] for k in data.files if k != '__inputs__'}
+        except FileNotFoundError:
+            return None
+
+    def put(self, stage, key, results, inputs=None):
+        """
+        Store a dict of arrays `results` then remove least recently used
+        results if the cache exceeds its maximum size.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        # write to a temporary file first so a partially written result is
+        # never read by another process
+        path = self._path(stage, key)
+        tmp = f'{path}.{os.getpid()}.tmp'
+        meta = json.dumps(inputs, sort_keys=True, default=jsonable)
+        with open(tmp, 'wb') as f:
+            np.savez_compressed(f, __inputs__=np.array(meta), **results)
+        os.replace(tmp, path)
+
+        self.evict()
+
+    def run(self, stage, func, inputs, files=(), version=1):
+        """
+        Return results of `func(**inputs)` from the cache or calculate and
+        store them if they are not in the cache. The function must return a
+        dict of arrays. The key includes the source code of the function and
+        of the local modules it uses so results are calculated again when the
+        code changes. Increase `version` for other changes such as a new
+        version of an installed package.
+        """
+        key = self.key(stage, inputs, files, version, func)
+        results = self.get(stage, key)
+        if results is None:
+            results = func(**inputs)
+            self.put(stage, key, results, inputs)
+        return results
+
+    def entries(self):
+        """
+        List of stored results where each item is a dict with the stage, key,
+        size [bytes], and last access time of the result. Items are sorted from
+        least to most recently used.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+
+        items = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.npz'):
+                continue
+            stage, key = name[:-4].rsplit('-', 1)
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            items.append({
+                'stage': stage,
+                'key': key,
+                'size': st.st_size,
+                'accessed': st.st_mtime
+            })
+
+        return sorted(items, key=lambda e: e['accessed'])
+
+    def inputs(self, stage, key):
+        """
+        Input values that were used to calculate a stored result.
+        """
+        with np.load(self._path(stage, key)) as data:
+            return json.loads(data['__inputs__'].item())
+
+    def invalidate(self, stage=None, key=None):
+        """
+        Remove stored results for a stage, a key, or all results when no stage
+        or key is given. Returns the number of removed results.
+        """
+        n = 0
+        for e in self.entries():
+            if (stage is None or e['stage'] == stage) and (key is None or e['key'] == key):
+                if _remove(self._path(e['stage'], e['key'])):
+                    n += 1
+        return n
+
+    def evict(self):
+        """
+        Remove least recently used results until the total size of the cache
+        is less than the maximum size.
+        """
+        items = self.entries()
+        total = sum(e['size'] for e in items)
+        for e in items:
+            if total <= self.max_bytes:
+                break
+            _remove(self._path(e['stage'], e['key']))
+            total -= e['size']
+
+
+def params_inputs(module):
+    """
+    Public values of a parameters module such as `params` that can be used as
+    cache inputs. Values that are not JSON serializable are skipped.
+    """
+    inputs = {}
+    for name, value in vars(module).items():
+        if name.startswith('_'):
+            continue
+        try:
+            json.dumps(value, default=jsonable)
+        except TypeError:
+            continue
+        inputs[name] = value
+    return inputs
+
+
+def _remove(path):
+    """
+    Remove a stored result and return True or return False when another
+    process sharing the cache has already removed it.
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def jsonable(obj):
+    """
+    Convert NumPy arrays and scalars for JSON serialization. Use as the
+    `default` argument of `json.dump` and `json.dumps`.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def code_hash(func):
+    """
+    Hash of the source code of a stage function. The source of `func` and of
+    the functions it calls from its own module is used so changes elsewhere in
+    a script do not change the hash. Other local modules that `func` uses,
+    which are the modules in the folder of `func` such as the `funcs`
+    package, are hashed as whole files together with the local modules they
+    import.
+    """
+    func = inspect.unwrap(func)
+    home = inspect.getmodule(func)
+    root = os.path.dirname(os.path.abspath(inspect.getsourcefile(func)))
+
+    sources = []
+    files = set()
+    seen = set()
+    todo = [func]
+
+    while todo:
+        f = todo.pop()
+        if f in seen:
+            continue
+        seen.add(f)
+        sources.append(inspect.getsource(f))
+
+        for name in _code_names(f.__code__):
+            value = f.__globals__.get(name)
+            if inspect.isfunction(value) and inspect.getmodule(value) is home:
+                todo.append(inspect.unwrap(value))
+            elif inspect.ismodule(value) or inspect.isfunction(value) or inspect.isclass(value):
+                _module_files(inspect.getmodule(value), root, files)
+            elif name in sys.modules:
+                # modules imported inside the function such as funcs.umf
+                _module_files(sys.modules[name], root, files)
+            else:
+                path = os.path.join(root, *name.split('.'))
+                for p in (f'{path}.py', os.path.join(path, '__init__.py')):
+                    if os.path.isfile(p):
+                        files.add(p)
+
+    h = hashlib.sha256()
+    for src in sources:
+        h.update(src.encode())
+    for path in sorted(files):
+        with open(path, 'rb') as fh:
+            h.update(fh.read())
+    return h.hexdigest()
+
+
+def _code_names(code):
+    """
+    Global and attribute names used by a code object and its nested
+    functions.
+    """
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _code_names(const)
+    return names
+
+
+def _module_files(module, root, files):
+    """
+    Add the source file of `module` and of the local modules it imports to
+    `files` when the module is in the folder `root`.
+    """
+    path = getattr(module, '__file__', None)
+    if path is None:
+        return
+
+    path = os.path.abspath(path)
+    if path in files or not path.startswith(root + os.sep):
+        return
+    files.add(path)
+
+    for value in list(vars(module).values()):
+        if inspect.ismodule(value) or inspect.isfunction(value) or inspect.isclass(value):
+            _module_files(inspect.getmodule(value), root, files)
+
+
+if __name__ == '__main__':
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description='List or remove cached results.')
+    parser.add_argument('--dir', default='.cache', help='cache folder')
+    parser.add_argument('--clear', action='store_true', help='remove results')
+    parser.add_argument('--stage', help='only results for this stage')
+    parser.add_argument('--key', help='only the result with this key')
+    args = parser.parse_args()
+
+    cache = ResultCache(args.dir)
+
+    if args.clear:
+        n = cache.invalidate(args.stage, args.key)
+        print(f'removed {n} results')
+    else:
+        print(f'{"stage":24} {"key":34} {"size [kB]":>10}   accessed')
+        for e in cache.entries():
+            if args.stage and e['stage'] != args.stage:
+                continue
+            accessed = timer.strftime('%Y-%m-%d %H:%M', timer.localtime(e['accessed']))
+            print(f'{e["stage"]:24} {e["key"]:34} {e["size"] / 1000:>10.1f}   {accessed}')
@@ -0,0 +1,114 @@
+import itertools
+
+import numpy as np
+
+from funcs.batch_reactor import run_batch
+
+
+def expand_scenarios(multipliers, temps, y0s, press):
+    """
+    Create a scenario for every combination of reaction multipliers,
+    temperature, and initial composition.
+
+    Parameters
+    ----------
+    multipliers : list
+        Multiplier for each reaction [-] of every multiplier set.
+    temps : list
+        Reactor temperatures [K]
+    y0s : list of dict
+        Initial mass fraction of each species [-] such as `params.y0`.
+    press : float
+        Reactor pressure [Pa]
+
+    Returns
+    -------
+    scenarios : list of dict
+        Scenarios with keys 'name', 'multipliers', 'temp', 'press', and 'y0'.
+    """
+    scenarios = []
+    combos = itertools.product(enumerate(multipliers), temps, enumerate(y0s))
+
+    for (i, mult), temp, (j, y0) in combos:
+        scenarios.append({
+            'name': f'm{i} T{temp:g} y{j}',
+            'multipliers': mult,
+            'temp': temp,
+            'press': press,
+            'y0': y0
+        })
+
+    return scenarios
+
+
+def run_scenarios(gas, scenarios, time):
+    """
+    Run isothermal batch reactor scenarios with one kinetics mechanism. The
+    `gas` object is reused for every scenario instead of parsing the
+    mechanism file for each case. Each scenario is a dict with keys 'temp'
+    [K], 'press' [Pa], 'y0' (initial mass fractions) and the optional keys
+    'name' and 'multipliers' (a multiplier for each reaction).
+
+    Parameters
+    ----------
+    gas : cantera.Solution
+        Kinetics mechanism such as the Di Blasi reactions in `blasi.cti`.
+    scenarios : list of dict
+        Reactor conditions and reaction multipliers for each scenario.
+    time : array_like
+        Times at which the reactor state is stored [s]
+
+    Returns
+    -------
+    table : ndarray
+        Structured array with one row for each scenario. Fields are 'name',
+        'temp', 'press', 'multipliers', and for each species such as 'tar' the
+        final mass fraction 'tar', the maximum mass fraction 'tar_max', and
+        the time of the maximum 'tar_tmax'.
+    y : ndarray
+        Mass fractions of shape (n_scenarios, n_times, n_species) [-]
+
+    Example
+    -------
+    >>> gas = ct.Solution('blasi.cti')
+    ... scenarios = expand_scenarios([[1, 1, 1, 0, 0], [1, 1, 1, 1, 1]],
+    ...                              [753.15, 773.15], [y0], 101325)
+    ... table, y = run_scenarios(gas, scenarios, np.linspace(0, 25, 1000))
+    ... table['tar_max']
+    array([0.7745, 0.7806, 0.5022, 0.5272])
+    """
+    time = np.asarray(time, dtype=float)
+    species = gas.species_names
+
+    dtype = [
+        ('name', 'U64'),
+        ('temp', float),
+        ('press', float),
+        ('multipliers', float, (gas.n_reactions,))
+    ]
+    for sp in species:
+        dtype += [(sp, float), (f'{sp}_max', float), (f'{sp}_tmax', float)]
+
+    table = np.zeros(len(scenarios), dtype=dtype)
+    y = np.empty((len(scenarios), len(time), len(species)))
+
+    for i, sc in enumerate(scenarios):
+        mult = sc.get('multipliers')
+        if mult is None:
+            mult = np.ones(gas.n_reactions)
+
+        run_batch(gas, sc['temp'], sc['press'], sc['y0'], time, mult, out=y[i])
+
+        row = table[i]
+        row['name'] = sc.get('name', f'scenario {i}')
+        row['temp'] = sc['temp']
+        row['press'] = sc['press']
+        row['multipliers'] = mult
+
+        imax = np.argmax(y[i], axis=0)
+        for k, sp in enumerate(species):
+            row[sp] = y[i, -1, k]
+            row[f'{sp}_max'] = y[i, imax[k], k]
+            row[f'{sp}_tmax'] = time[imax[k]]
+
+    return table, y
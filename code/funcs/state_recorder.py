@@ -0,0 +1,107 @@
+import time as timer
+
+import numpy as np
+
+from funcs import profiling
+
+
+class StateRecorder:
+    """
+    Record mass fractions of a reactor at fixed times into a preallocated
+    array. This replaces appending to a Cantera `SolutionArray` at every time
+    step. Mass fractions are written in place into one row of the buffer for
+    each time and species are accessed by name as views of a buffer column.
+
+    Parameters
+    ----------
+    time : array_like
+        Times at which the reactor state is recorded [s]
+    species_names : list of str
+        Name of each species in the same order as the reactor mass fractions.
+    out : ndarray, optional
+        Array of shape (n_times, n_species) used as the buffer such as a slice
+        of a larger array of results. Default is a new array.
+
+    Attributes
+    ----------
+    t : ndarray
+        Times at which the reactor state is recorded [s]
+    species_names : tuple of str
+        Name of each species.
+    y : ndarray
+        Mass fractions with shape (n_times, n_species) [-]
+
+    Example
+    -------
+    >>> gas = ct.Solution('blasi.cti')
+    ... gas.TPY = 773.15, 101325, {'biomass': 1}
+    ... r = ct.IdealGasConstPressureReactor(gas, energy='off')
+    ... sim = ct.ReactorNet([r])
+    ... states = StateRecorder(np.linspace(0, 25, 1000), gas.species_names)
+    ... states.run(sim, r)
+    ... states['tar'].max()
+    0.5272
+    """
+
+    def __init__(self, time, species_names, out=None):
+        self.t = np.asarray(time, dtype=float)
+        self.species_names = tuple(species_names)
+
+        shape = (len(self.t), len(self.species_names))
+        if out is None:
+            out = np.empty(shape)
+        elif out.shape != shape:
+            raise ValueError(f'Buffer must have shape {shape}')
+        self.y = out
+
+        self._index = {sp: i for i, sp in enumerate(self.species_names)}
+
+    def __getitem__(self, name):
+        """
+        Mass fraction of species `name` at each time as a view of the buffer.
+        """
+        return self.y[:, self._index[name]]
+
+    def record(self, i, y):
+        """
+        Store mass fractions `y` for the i-th time.
+        """
+        self.y[i] = y
+
+    def run(self, sim, reactor):
+        """
+        Advance the reactor network `sim` to each time and record the mass
+        fractions of `reactor`. Integration and recording are timed
+        separately when profiling is enabled.
+        """
+        if profiling.enabled():
+            self._run_profiled(sim, reactor)
+            return
+
+        y = self.y
+        for i, t in enumerate(self.t):
+            sim.advance(t)
+            y[i] = reactor.thermo.Y
+
+    def _run_profiled(self, sim, reactor):
+        """
+        Same as `run` but the time spent in `ReactorNet.advance` and in
+        copying the mass fractions is added to the profiling stages.
+        """
+        y = self.y
+        t_adv = 0.0
+        t_rec = 0.0
+        ti = timer.perf_counter()
+
+        for i, t in enumerate(self.t):
+            t0 = timer.perf_counter()
+            sim.advance(t)
+            t1 = timer.perf_counter()
+            y[i] = reactor.thermo.Y
+            t_rec += timer.perf_counter() - t1
+            t_adv += t1 - t0
+
+        n = len(self.t)
+        profiling.add('StateRecorder.run', timer.perf_counter() - ti, start=ti)
+        profiling.add('ReactorNet.advance', t_adv, calls=n)
+        profiling.add('record state', t_rec, calls=n)
@@ -0,0 +1,132 @@
+import numpy as np
+
+
+def ut_haider(dp, mu, phi, rhog, rhos):
+    """
+    Calculate terminal velocity of a particle from the Haider and Levenspiel
+    correlation [1]_. Same as `chemics.ut_haider` but inputs can be floats or
+    arrays which are broadcast against each other.
+
+    .. math::
+
+       d_* = d_p \\left[ \\frac{g\\, \\rho_g (\\rho_s - \\rho_g)}{\\mu^2} \\right]^{1/3}
+
+       u_* = \\left[ \\frac{18}{d_*^2} + \\frac{2.3348 - 1.7439\\, \\phi}{d_*^{0.5}} \\right]^{-1}
+
+       u_t = u_* \\left[ \\frac{g\\, \\mu\\, (\\rho_s - \\rho_g)}{\\rho_g^2} \\right]^{1/3}
+
+    Parameters
+    ----------
+    dp : float or array_like
+        Diameter of particle [m]
+    mu : float or array_like
+        Viscosity of gas [kg/(m s)]
+    phi : float or array_like
+        Sphericity of particle [-]
+    rhog : float or array_like
+        Density of gas [kg/m³]
+    rhos : float or array_like
+        Density of particle [kg/m³]
+
+    Returns
+    -------
+    ut : ndarray
+        Terminal velocity of the particle [m/s]
+
+    Raises
+    ------
+    ValueError
+        If a sphericity is not 0.5 <= phi <= 1.0
+
+    Example
+    -------
+    >>> ut_haider([0.00016, 0.0005], 1.8e-5, 0.67, 1.2, 2600)
+    array([0.8857, 2.4467])
+
+    References
+    ----------
+    .. [1] A. Haider and O. Levenspiel. Drag coefficient and terminal velocity
+       of spherical and nonspherical particles. Powder Technology, 58:63–70,
+       1989.
+    """
+    dstar_per_dp, ut_per_ustar, c = _haider_terms(mu, phi, rhog, rhos)
+    dstar = np.asarray(dp, dtype=float) * dstar_per_dp
+    ustar = 1 / (18 / dstar**2 + c / dstar**0.5)
+    return ustar * ut_per_ustar
+
+
+def elutriation_diameter(us, mu, phi, rhog, rhos, rtol=1e-12, maxiter=50):
+    """
+    Particle diameter at which the Haider and Levenspiel terminal velocity is
+    equal to the superficial gas velocity. Smaller particles have a terminal
+    velocity less than the gas velocity and are elutriated from the reactor.
+    With s = d*^0.5 the condition u* = Us / (ut / u*) becomes the quartic
+
+    .. math:: R\\, s^4 - c\\, s^3 - 18 = 0, \\quad R = 1 / u_*
+
+    which has one positive root. Newton's method is started from the upper
+    bound s = c / R + (18 / R)^(1/4) where the quartic is increasing and
+    convex so the iterations converge monotonically for all the inputs at
+    once.
+
+    Parameters
+    ----------
+    us : float or array_like
+        Superficial gas velocity [m/s]
+    mu : float or array_like
+        Viscosity of gas [kg/(m s)]
+    phi : float or array_like
+        Sphericity of particle [-]
+    rhog : float or array_like
+        Density of gas [kg/m³]
+    rhos : float or array_like
+        Density of particle [kg/m³]
+    rtol : float, optional
+        Relative tolerance of the Newton step [-]. Default is 1e-12.
+    maxiter : int, optional
+        Maximum number of Newton iterations. Default is 50.
+
+    Returns
+    -------
+    dp : ndarray
+        Particle diameter where Ut = Us [m] with the broadcast shape of the
+        inputs.
+
+    Example
+    -------
+    >>> elutriation_diameter(0.307, 3.64e-5, 1.0, 0.44, [540, 300])
+    array([0.000207, 0.000281])
+    """
+    dstar_per_dp, ut_per_ustar, c = _haider_terms(mu, phi, rhog, rhos)
+    r = ut_per_ustar / np.asarray(us, dtype=float)
+
+    shape = np.broadcast_shapes(r.shape, dstar_per_dp.shape, c.shape)
+    s = np.broadcast_to(c / r + (18 / r)**0.25, shape).copy()
+
+    for _ in range(maxiter):
+        f = r * s**4 - c * s**3 - 18
+        df = 4 * r * s**3 - 3 * c * s**2
+        step = f / df
+        s -= step
+        if np.all(np.abs(step) <= rtol * s):
+            break
+
+    dp = s**2 / dstar_per_dp
+    return dp
+
+
+def _haider_terms(mu, phi, rhog, rhos):
+    """
+    Factors that convert particle diameter to d* and u* to terminal velocity
+    along with the sphericity term of the Haider and Levenspiel correlation.
+    """
+    mu, phi, rhog, rhos = (np.asarray(v, dtype=float) for v in (mu, phi, rhog, rhos))
+
+    if np.any(phi > 1.0) or np.any(phi < 0.5):
+        raise ValueError('Sphericity must be 0.5 <= phi <= 1.0')
+
+    g = 9.81
+    dstar_per_dp = (g * rhog * (rhos - rhog) / mu**2)**(1 / 3)
+    ut_per_ustar = (g * (rhos - rhog) * mu / rhog**2)**(1 / 3)
+    c = 2.3348 - 1.7439 * phi
+    return dstar_per_dp, ut_per_ustar, c
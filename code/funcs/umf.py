@@ -0,0 +1,103 @@
+import numpy as np
+
+# coefficients (a, b) for the Umf correlations based on Table 4 in Chapter 3
+# of Kunii and Levenspiel
+umf_coeffs = {
+    'grace': (27.2, 0.0408),
+    'rich': (25.7, 0.0365),
+    'wenyu': (33.7, 0.0408)
+}
+
+# fields of the structured array returned by `umf_correlations`
+umf_dtype = np.dtype([
+    ('ergun', float),
+    ('grace', float),
+    ('rich', float),
+    ('wenyu', float),
+    ('avg', float)
+])
+
+
+def umf_correlations(dp, ep, mu, phi, rhog, rhos):
+    """
+    Calculate minimum fluidization velocity from the Ergun, Grace, Richardson,
+    and Wen and Yu correlations along with their average. Inputs can be floats
+    or arrays which are broadcast against each other. The Archimedes number is
+    calculated once and shared by all the correlations. Refer to Equations 18,
+    19, and 25 and Table 4 in Chapter 3 of Kunii and Levenspiel [1]_.
+
+    .. math::
+
+       Ar = \\frac{d_p^3\\, \\rho_g (\\rho_s - \\rho_g) g}{\\mu^2}
+
+       Re_{mf} = \\sqrt{a^2 + b\\, Ar} - a
+
+       U_{mf} = \\frac{Re_{mf}\\, \\mu}{d_p\\, \\rho_g}
+
+    Parameters
+    ----------
+    dp : float or array_like
+        Diameter of bed particle [m]
+    ep : float or array_like
+        Void fraction of the bed [-]
+    mu : float or array_like
+        Viscosity of gas [kg/(m s)]
+    phi : float or array_like
+        Sphericity of bed particle [-]
+    rhog : float or array_like
+        Density of gas [kg/m³]
+    rhos : float or array_like
+        Density of bed particle [kg/m³]
+
+    Returns
+    -------
+    umf : ndarray
+        Structured array of minimum fluidization velocity [m/s] with fields
+        'ergun', 'grace', 'rich', 'wenyu', and 'avg'. Shape is the broadcast
+        shape of the inputs.
+
+    Example
+    -------
+    >>> umf = umf_correlations(0.0005, 0.46, 3.6e-5, 0.86, 0.44, 2500)
+    ... umf['ergun'], umf['avg']
+    (array(0.1488), array(0.124))
+
+    References
+    ----------
+    .. [1] Daizo Kunii and Octave Levenspiel. Fluidization Engineering.
+       Butterworth-Heinemann, 2nd edition, 1991.
+    """
+    dp, ep, mu, phi, rhog, rhos = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (dp, ep, mu, phi, rhog, rhos)))
+
+    g = 9.81
+    ar = (dp**3 * rhog * (rhos - rhog) * g) / mu**2
+
+    # converts Reynolds number to velocity
+    re_to_u = mu / (dp * rhog)
+
+    umf = np.empty(ar.shape, dtype=umf_dtype)
+
+    k1 = 1.75 / (ep**3 * phi)
+    k2 = 150 * (1 - ep) / (ep**3 * phi**2)
+    a = k2 / (2 * k1)
+    b = 1 / k1
+    umf['ergun'] = ((a**2 + b * ar)**0.5 - a) * re_to_u
+
+    for name, (a, b) in umf_coeffs.items():
+        umf[name] = ((a**2 + b * ar)**0.5 - a) * re_to_u
+
+    umf['avg'] = (umf['ergun'] + umf['grace'] + umf['rich'] + umf['wenyu']) / 4
+    return umf
+
+
+if __name__ == '__main__':
+
+    # operating envelope of bed particle diameter [m] and gas viscosity [kg/ms]
+    dp = np.linspace(0.0002, 0.0008, 1000)[:, None]
+    mu = np.linspace(1.5e-5, 4.0e-5, 1000)[None, :]
+
+    umf = umf_correlations(dp, 0.46, mu, 0.86, 0.44, 2500)
+    print('shape ', umf.shape)
+    print('ergun ', umf['ergun'].min(), umf['ergun'].max())
+    print('avg   ', umf['avg'].min(), umf['avg'].max())
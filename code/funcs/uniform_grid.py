@@ -0,0 +1,78 @@
+import numpy as np
+
+
+def refine_grid(func, tmin, tmax, rtol, axis=0, n=16, n_max=2**20):
+    """
+    Tabulate a function on a uniform temperature grid. The number of
+    intervals is doubled until linear interpolation at the middle of each
+    interval is within the relative tolerance `rtol` of the function.
+
+    Parameters
+    ----------
+    func : callable
+        Function of a 1-D array of temperatures [K] which returns an array
+        with the temperatures along axis `axis`.
+    tmin : float
+        Minimum temperature of the grid [K]
+    tmax : float
+        Maximum temperature of the grid [K]
+    rtol : float
+        Maximum relative error of the interpolated values [-]
+    axis : int, optional
+        Temperature axis of the values returned by `func`. Default is 0.
+    n : int, optional
+        Number of intervals of the first grid. Default is 16.
+    n_max : int, optional
+        Maximum number of intervals. Default is 2**20.
+
+    Returns
+    -------
+    temps : ndarray
+        Temperatures of the grid [K]
+    data : ndarray
+        Values of `func` at each temperature of the grid.
+
+    Raises
+    ------
+    ValueError
+        If `rtol` is not reached with `n_max` intervals.
+    """
+    while True:
+        temps = np.linspace(tmin, tmax, n + 1)
+        data = func(temps)
+        values = np.moveaxis(data, axis, 0)
+        interp = 0.5 * (values[:-1] + values[1:])
+        exact = np.moveaxis(func(0.5 * (temps[:-1] + temps[1:])), axis, 0)
+        err = np.max(np.abs(interp / exact - 1))
+        if err <= rtol:
+            return temps, data
+        if n >= n_max:
+            raise ValueError(f'Relative tolerance {rtol} not reached with {n:,} grid '
+                             f'intervals, relative error is {err:.2e}.')
+        n *= 2
+
+
+def interp_grid(data, temp, tmin, tmax):
+    """
+    Linear interpolation of values tabulated with `refine_grid` at
+    temperature `temp` [K]. Table `data` has the temperatures along the first
+    axis and the returned array has shape temp.shape + data.shape[1:].
+
+    Raises
+    ------
+    ValueError
+        If a temperature is outside the range of the table.
+    """
+    temp = np.asarray(temp, dtype=float)
+
+    if np.any(temp < tmin) or np.any(temp > tmax):
+        raise ValueError('Temperature out of range. Applicable values are '
+                         f'{tmin} - {tmax} K for this table.')
+
+    n = len(data) - 1
+    s = (temp - tmin) / ((tmax - tmin) / n)
+    i = np.minimum(s.astype(np.intp), n - 1)
+    f = (s - i).reshape(s.shape + (1,) * (data.ndim - 1))
+
+    y = data[i] + f * (data[i + 1] - data[i])
+    return y
@@ -2,9 +2,8 @@
 Calculations for H2 and N2 gas and mixtures of the two gases.
 """
 
-import chemics as cm
-import matplotlib.pyplot as plt
 import numpy as np
+from funcs import GasPropertyTable
 
 # Parameters
 # ----------------------------------------------------------------------------
@@ -13,39 +12,43 @@ from params import temp
 from params import temp_min
 from params import temp_max
 
-# Gas viscosity of H2 and N2 mixture at temperature
-# ----------------------------------------------------------------------------
 
-# molecular weight [g/mol]
-mw_h2 = cm.mw('H2')
-mw_n2 = cm.mw('N2')
+def main():
+    import matplotlib.pyplot as plt
 
-mu_mix = np.array([cm.mu_gas('H2', temp), cm.mu_gas('N2', temp)])
-mw_mix = np.array([mw_h2, mw_n2])
-x_mix = np.array([0.85, 0.15])
+    # Gas viscosity of H2 and N2 mixture for range of temperatures
+    # ------------------------------------------------------------------------
 
-# Gas viscosity of H2 and N2 mixture for range of temperatures
-# ----------------------------------------------------------------------------
+    # temperature range for calculations [K]
+    temps = np.linspace(temp_min, temp_max, 20)
 
-# temperature range for calculations [K]
-temps = np.linspace(temp_min, temp_max, 20)
+    # viscosity of H2 and N2 at each temperature as rows of (H2, N2) [µP]
+    table = GasPropertyTable(['H2', 'N2'], temp_min, temp_max)
+    mu_temps = table.mu(temps)
 
-mu_h2 = []
-mu_n2 = []
-mu_h2n2_h = []
-mu_h2n2_g = []
+    mu_h2 = mu_temps[:, 0]
+    mu_n2 = mu_temps[:, 1]
 
-for tk in temps:
-    mu_h2.append(cm.mu_gas('H2', tk))
-    mu_n2.append(cm.mu_gas('N2', tk))
-    mu_i = np.array([cm.mu_gas('H2', tk), cm.mu_gas('N2', tk)])
-    mu_h2n2_h.append(cm.mu_herning(mu_i, mw_mix, x_mix))
-    mu_h2n2_g.append(cm.mu_graham(mu_i, x_mix))
+    # mixture viscosity of every row at once, same as `chemics.mu_herning` and
+    # `chemics.mu_graham` for each temperature
+    mw_mix = table.mw
+    x_mix = np.array([0.85, 0.15])
+    xw = x_mix * np.sqrt(mw_mix)
 
-# Print
-# ----------------------------------------------------------------------------
+    mu_h2n2_h = (mu_temps @ xw) / xw.sum()
+    mu_h2n2_g = mu_temps @ x_mix
+
+    # Gas viscosity of H2 and N2 mixture at temperature
+    # ------------------------------------------------------------------------
+
+    mu_mix = table.mu(temp)
+    mu_herning = (mu_mix @ xw) / xw.sum()
+    mu_graham = mu_mix @ x_mix
 
-print(f"""
+    # Print
+    # ------------------------------------------------------------------------
+
+    print(f"""
 Parameters
 ----------
 temp        {temp} K
@@ -54,23 +57,27 @@ temp_max    {temp_max} K
 
 Calculated viscosity at {temp} K
 --------------------------------
-mu_graham   {cm.mu_graham(mu_mix, x_mix):.2f} µP
-mu_herning  {cm.mu_herning(mu_mix, mw_mix, x_mix):.2f} µP
+mu_graham   {mu_graham:.2f} µP
+mu_herning  {mu_herning:.2f} µP
 """)
 
-# Plot
-# ----------------------------------------------------------------------------
+    # Plot
+    # ------------------------------------------------------------------------
+
+    fig, ax = plt.subplots(tight_layout=True)
+    ax.plot(temps, mu_h2, marker='.', label='H₂')
+    ax.plot(temps, mu_n2, marker='.', label='N₂')
+    ax.plot(temps, mu_h2n2_h, marker='.', label='0.85H₂ 0.15N₂ (Herning)')
+    ax.plot(temps, mu_h2n2_g, marker='.', label='0.85H₂ 0.15N₂ (Graham)')
+    ax.set_xlabel('Temperature [K]')
+    ax.set_ylabel('Viscosity [µP]')
+    ax.grid(color='0.9')
+    ax.legend(frameon=False, loc='best')
+    ax.set_frame_on(False)
+    ax.tick_params(color='0.9')
+
+    plt.show()
+
 
-fig, ax = plt.subplots(tight_layout=True)
-ax.plot(temps, mu_h2, marker='.', label='H₂')
-ax.plot(temps, mu_n2, marker='.', label='N₂')
-ax.plot(temps, mu_h2n2_h, marker='.', label='0.85H₂ 0.15N₂ (Herning)')
-ax.plot(temps, mu_h2n2_g, marker='.', label='0.85H₂ 0.15N₂ (Graham)')
-ax.set_xlabel('Temperature [K]')
-ax.set_ylabel('Viscosity [µP]')
-ax.grid(color='0.9')
-ax.legend(frameon=False, loc='best')
-ax.set_frame_on(False)
-ax.tick_params(color='0.9')
-
-plt.show()
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,7 @@
 Calculate minimum fluidization velocity Umf for various gas mixtures.
 """
 
-import chemics as cm
+from funcs.gas_mixture import mixture_properties
 
 # Get parameters
 from params import dp_bed
@@ -22,31 +22,14 @@ def run_n2h2():
     # Mass fractions for N2/H2
     y_n2h2 = [(0.8, 0.2), (0.6, 0.4), (0.4, 0.6), (0.2, 0.8)]
 
-    # Calculate Umf for N2/H2 gas mixtures
-    for ys in y_n2h2:
-
-        # Molecular weight for N2 and H2
-        mw_n2 = cm.mw('N2')
-        mw_h2 = cm.mw('H2')
-
-        # Viscosity for N2 and H2
-        mu_n2 = cm.mu_gas('N2', temp) / 1e7
-        mu_h2 = cm.mu_gas('H2', temp) / 1e7
-
-        # Molecular weight of mixture
-        xs = cm.massfrac_to_molefrac(ys, (mw_n2, mw_h2))
-        mw_mixture = cm.mw_mix((mw_n2, mw_h2), xs)
-
-        # Viscosity and density of mixture
-        mu_mixture = cm.mu_herning((mu_n2, mu_h2), (mw_n2, mw_h2), xs)
-        rho_mixture = cm.rhog(mw_mixture, press, temp)
-
-        # Minimum fluidization velocity of mixture
-        umf_mixture = cm.umf_ergun(dp_bed, ep, mu_mixture, phi_bed, rho_mixture, rhop_bed)
+    # Mole fractions and Umf for all the N2/H2 gas mixtures
+    xs, props = mixture_properties(['N2', 'H2'], y_n2h2, temp, press, dp_bed, ep, phi_bed, rhop_bed)
+    umf_mixtures = props['umf']['ergun']
 
+    for i, ys in enumerate(y_n2h2):
         print('ys   ', ys)
-        print('xs   ', xs)
-        print('umf  ', round(umf_mixture, 4), 'm/s')
+        print('xs   ', xs[i])
+        print('umf  ', round(umf_mixtures[i], 4), 'm/s')
         print('')
 
 
@@ -55,22 +38,9 @@ def run_umf_mix(sp_mix, y):
     Calculate Umf for a given gas mixture `sp_mix` and mass fraction `y`.
     """
 
-    mw1 = cm.mw(sp_mix[0])  # Molecular weight for gas species 1
-    mw2 = cm.mw(sp_mix[1])  # Molecular weight for gas species 2
-
-    mu1 = cm.mu_gas(sp_mix[0], temp) / 1e7  # Viscosity for gas species 1
-    mu2 = cm.mu_gas(sp_mix[1], temp) / 1e7  # Viscosity for gas species 2
-
-    # Molecular weight of mixture, g/mol
-    x = cm.massfrac_to_molefrac(y, (mw1, mw2))
-    mw_mixture = cm.mw_mix((mw1, mw2), x)
-
-    # Viscosity and density of mixture
-    mu_mixture = cm.mu_herning((mu1, mu2), (mw1, mw2), x)
-    rho_mixture = cm.rhog(mw_mixture, press, temp)
-
-    # Minimum fluidization velocity of mixture, m/s
-    umf_mixture = cm.umf_ergun(dp_bed, ep, mu_mixture, phi_bed, rho_mixture, rhop_bed)
+    # Mole fractions and minimum fluidization velocity of mixture, m/s
+    x, props = mixture_properties(sp_mix, y, temp, press, dp_bed, ep, phi_bed, rhop_bed)
+    umf_mixture = float(props['umf']['ergun'])
 
     print(f'\n--- Umf for {sp_mix} gas mixture ---\n')
     print('y    ', y)
@@ -82,6 +52,7 @@ def run_umf(sp):
     """
     Calculate Umf for a given gas species `sp`.
     """
+    import chemics as cm
 
     mw = cm.mw(sp)                  # Molecular weight, g/mol
     mu = cm.mu_gas(sp, temp) / 1e7  # Gas viscosity, kg/(ms)
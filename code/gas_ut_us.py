@@ -0,0 +1,117 @@
+"""
+Particle diameter and density at which the terminal velocity (Ut) of a
+biomass or char particle is equal to the superficial gas velocity (Us) for
+N2/H2 fluidization gas mixtures. Results are given for a constant inlet flow
+(constant Us) and for an inlet flow adjusted to keep the nitrogen Us/Umf.
+"""
+
+import numpy as np
+from funcs import mixture_properties
+from funcs.flow import fluidization_number, slm_for_fluidization, slm_to_us
+from funcs.terminal_velocity import elutriation_diameter
+
+# Parameters
+# ----------------------------------------------------------------------------
+
+from params import di
+from params import dp_bed
+from params import ep
+from params import phi_bed
+from params import press
+from params import q_gas
+from params import rhop_bed
+from params import rhop_char
+from params import rhop_feed
+from params import temp
+
+# sphericity of the biomass and char particles, assume a sphere [-]
+phi_feed = 1.0
+
+# H2 mass fraction of the N2/H2 fluidization gas [-]
+y_h2 = np.linspace(0, 1, 5)
+ys = np.column_stack((1 - y_h2, y_h2))
+
+# particle densities from char to the initial biomass density [kg/m³]
+rhos = np.linspace(rhop_char, rhop_feed, 100)
+
+
+def main():
+    import matplotlib.pyplot as plt
+
+    # Gas properties and superficial velocity
+    # ------------------------------------------------------------------------
+
+    species = ['N2', 'H2']
+    _, props = mixture_properties(species, ys, temp, press, dp_bed, ep, phi_bed, rhop_bed)
+
+    mu_gas = props['mu_herning'] / 1e7   # convert µP to kg/(ms)
+    rho_gas = props['rho']
+
+    # constant inlet flow
+    us = slm_to_us(q_gas, di, press, temp)
+
+    # inlet flow for each gas mixture to keep the nitrogen Us/Umf
+    us_umf_n2 = fluidization_number(us, props['umf'][0])
+    q_adj = slm_for_fluidization(species, ys, us_umf_n2, temp, press, di, dp_bed, ep, phi_bed, rhop_bed)
+    us_adj = slm_to_us(q_adj, di, press, temp)
+
+    # Particle diameter where Ut = Us
+    # ------------------------------------------------------------------------
+
+    # diameters [µm] with shape (n_mixtures, n_densities)
+    d_us = elutriation_diameter(us, mu_gas[:, None], phi_feed, rho_gas[:, None], rhos) * 1e6
+    d_usumf = elutriation_diameter(us_adj[:, None], mu_gas[:, None], phi_feed, rho_gas[:, None], rhos) * 1e6
+
+    # Print
+    # ------------------------------------------------------------------------
+
+    print(
+        f'\n{" Parameters ":-^79}\n'
+        f'temp       {temp} K\n'
+        f'press      {press:,} Pa\n'
+        f'q_gas      {q_gas} SLM\n'
+        f'rhop_feed  {rhop_feed} kg/m³\n'
+        f'rhop_char  {rhop_char} kg/m³\n'
+    )
+
+    print(
+        f'\n{" Results ":-^79}\n'
+        f'Y_H2 [-]              {"".join(f"{y:<8.2f}" for y in y_h2)}\n'
+        f'Q adjusted [SLM]      {"".join(f"{q:<8.2f}" for q in q_adj)}\n'
+        f'Us adjusted [m/s]     {"".join(f"{u:<8.2f}" for u in us_adj)}\n'
+        f'\n'
+        f'd where Ut = Us [µm]\n'
+        f'constant Us, feed     {"".join(f"{d:<8.0f}" for d in d_us[:, -1])}\n'
+        f'constant Us, char     {"".join(f"{d:<8.0f}" for d in d_us[:, 0])}\n'
+        f'Us/Umf, feed          {"".join(f"{d:<8.0f}" for d in d_usumf[:, -1])}\n'
+        f'Us/Umf, char          {"".join(f"{d:<8.0f}" for d in d_usumf[:, 0])}'
+    )
+
+    # Plot
+    # ------------------------------------------------------------------------
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(8.4, 4.8), sharey=True, tight_layout=True)
+
+    for i in range(len(y_h2)):
+        ax1.plot(d_us[i], rhos)
+        ax2.plot(d_usumf[i], rhos, label=f'Y$_{{H_2}}$ = {y_h2[i]:.2f}')
+
+    ax1.grid(color='0.9')
+    ax1.set_frame_on(False)
+    ax1.set_title('Constant Us')
+    ax1.set_xlabel('Particle diameter [µm]')
+    ax1.set_ylabel('Particle density [kg/m³]')
+    ax1.tick_params(color='0.9')
+
+    ax2.grid(color='0.9')
+    ax2.legend(loc='best', frameon=False)
+    ax2.set_frame_on(False)
+    ax2.set_title('Constant Us/Umf')
+    ax2.set_xlabel('Particle diameter [µm]')
+    ax2.tick_params(color='0.9')
+
+    plt.show()
+
+
+if __name__ == '__main__':
+    main()
@@ -22,6 +22,9 @@ k_feed = 0.12
 # density of the biomass particle, assume loblolly pine [kg/m³]
 rhop_feed = 540
 
+# density of the char particle [kg/m³]
+rhop_char = 300
+
 # Bed (sand particle)
 # ----------------------------------------------------------------------------
 
@@ -43,6 +46,12 @@ di = 0.05232
 # void fraction of the bed [-]
 ep = 0.46
 
+# static bed height of the bfb reactor [m]
+h_static = 0.1016   # 4 in
+
+# height of the bfb reactor from the distributor to the outlet [m]
+h_reactor = 0.4318  # 17 in
+
 # reactor pressure [Pa]
 press = 101_325.0
 
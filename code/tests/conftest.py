@@ -0,0 +1,5 @@
+import os
+import sys
+
+# tests import the `funcs` package and `params` module from the code folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,29 @@
+import os
+
+import numpy as np
+import pytest
+
+from funcs.batch_reactor import run_adaptive
+from funcs.linear_kinetics import batch_linear
+
+ct = pytest.importorskip('cantera')
+
+mech = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'blasi.cti')
+
+
+@pytest.mark.parametrize('temp, t_end', [(900, 25), (773.15, 1000)])
+def test_run_adaptive_peak_long_t_end(temp, t_end):
+    # after the tar has decayed the sign of its rate of change is solver
+    # noise which must not replace the peak at the start of the run
+    gas = ct.Solution(mech)
+    res = run_adaptive(gas, temp, 101325, {'biomass': 1}, t_end)
+
+    time = np.linspace(0, 30, 1_000_001)
+    tar = batch_linear(temp, {'biomass': 1}, time, mech=mech)[:, 2]
+    i = np.argmax(tar)
+
+    assert res['y_max'] == pytest.approx(tar[i], rel=1e-6)
+    assert res['t_max'] == pytest.approx(time[i], rel=1e-3)
+
+    y_end = batch_linear(temp, {'biomass': 1}, [t_end], mech=mech)[0]
+    np.testing.assert_allclose(res['y_final'], y_end, atol=1e-8)